@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Adaptive iteration budgeting by confidence interval width
+Instead of a fixed 100 iterations per (request, engine) cell, each cell is
+sampled until the relative half-width of its mean's confidence interval
+(z * stdev / sqrt(n) / mean) reaches TARGET, within per-cell MIN_ITERATIONS
+and MAX_ITERATIONS caps and an optional global time budget.
+
+After MIN_ITERATIONS round-robin iterations, the next iterations always go to
+the cell whose extra iteration buys the largest drop of its half-width
+(towards the target, not below it) per millisecond spent, so with a time
+budget the precision lands where it is cheapest, and cells that are already
+tight (SPARQL R1) stop early.
+
+    python adaptive_sampling.py plan [results.csv] [--target 0.02]
+    python adaptive_sampling.py replay run.samples [--target 0.02] [--budget 60] [-o results.csv]
+
+plan estimates each cell's iterations from its mean and stdev; replay runs
+the sampler against recorded samples (in run order) to check the savings.
+"""
+import argparse
+import heapq
+import math
+import sys
+import time
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from bootstrap_ci import CONFIDENCE, ITERATIONS
+from results_store import RESULTS_CSV, read_csv, sync_store, write_csv
+from sample_ingest import SampleAggregator, SampleCollector, ingest
+
+TARGET = 0.02          # relative CI half-width of the mean (2%)
+MIN_ITERATIONS = 10    # per cell, before its stdev is trusted
+MAX_ITERATIONS = 1000  # per cell
+STEP = 5               # iterations run per scheduling decision
+
+PLAN_COLUMNS = ['question', 'method', 'iterations', 'rel_half_width', 'seconds',
+                'fixed_seconds', 'fixed_rel_half_width']
+
+
+def z_value(confidence=CONFIDENCE):
+    """Two-sided normal quantile of confidence"""
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def relative_half_width(count, mean, stdev, confidence=CONFIDENCE):
+    """Relative CI half-width of a mean from count samples (inf while undefined)"""
+    count, mean, stdev = (np.asarray(a, dtype=float) for a in (count, mean, stdev))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        width = z_value(confidence) * stdev / np.sqrt(count) / np.abs(mean)
+    return np.where((count > 1) & (mean != 0), width, np.inf)
+
+
+def required_iterations(mean, stdev, target=TARGET, confidence=CONFIDENCE,
+                        min_iterations=MIN_ITERATIONS, max_iterations=MAX_ITERATIONS):
+    """Iterations for the relative half-width to reach target, within the caps"""
+    mean, stdev = np.asarray(mean, dtype=float), np.asarray(stdev, dtype=float)
+    needed = np.ceil((z_value(confidence) * stdev / (target * np.abs(mean))) ** 2)
+    return np.clip(np.nan_to_num(needed, nan=max_iterations, posinf=max_iterations),
+                   min_iterations, max_iterations).astype(np.int64)
+
+
+class _Cell:
+    """Running state of one (question, method) cell"""
+
+    def __init__(self, key, metrics):
+        self.key = key
+        self.count = 0
+        self.mean = np.zeros(len(metrics))
+        self.m2 = np.zeros(len(metrics))
+        self.seconds = 0.0
+        self.exhausted = False
+
+    def add(self, values, seconds):
+        # Welford update, all driving metrics at once
+        self.count += 1
+        delta = values - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (values - self.mean)
+        self.seconds += seconds
+
+    def width(self, confidence, count=None):
+        """Worst relative half-width over the driving metrics (after count samples)"""
+        if self.count < 2:
+            return math.inf
+        stdev = np.sqrt(self.m2 / (self.count - 1))
+        return float(np.max(relative_half_width(count or self.count, self.mean, stdev, confidence)))
+
+
+class AdaptiveSampler:
+    """Samples cells until their CIs are tight enough
+
+    measure(question, method) runs one iteration and returns {metric: ms};
+    raising StopIteration marks the cell as exhausted (replayed samples).
+    Cells are driven by the worst relative half-width over metrics; every
+    returned metric is kept. An iteration costs its wall time, or the
+    cost_metric value it returns (replays: the recorded time); the time
+    budget counts that cost.
+
+        sampler = AdaptiveSampler(cells, measure, target=0.02, time_budget=600)
+        samples = sampler.run()   # {(question, method, metric): [ms, ...]}
+        print(sampler.report())
+    """
+
+    def __init__(self, cells, measure, metrics=('server_ms',), target=TARGET,
+                 min_iterations=MIN_ITERATIONS, max_iterations=MAX_ITERATIONS,
+                 time_budget=None, confidence=CONFIDENCE, step=STEP, cost_metric=None):
+        self.metrics = list(metrics)
+        self.cells = [_Cell(tuple(cell), self.metrics) for cell in cells]
+        self.measure = measure
+        self.target = target
+        self.min_iterations = min_iterations
+        self.max_iterations = max(max_iterations, min_iterations)
+        self.time_budget = time_budget
+        self.confidence = confidence
+        self.step = step
+        self.cost_metric = cost_metric
+        self.samples = {}
+        self.elapsed = 0.0
+
+    def _iterate(self, cell):
+        start = time.perf_counter()
+        try:
+            record = self.measure(*cell.key)
+        except StopIteration:
+            cell.exhausted = True
+            return
+        seconds = time.perf_counter() - start
+        if self.cost_metric is not None:
+            seconds = record[self.cost_metric] / 1000
+        self.elapsed += seconds
+        for metric, value in record.items():
+            self.samples.setdefault(cell.key + (metric,), []).append(value)
+        cell.add(np.array([record[metric] for metric in self.metrics], dtype=float), seconds)
+
+    def _open(self, cell):
+        return (not cell.exhausted and cell.count < self.max_iterations
+                and cell.width(self.confidence) > self.target)
+
+    def _priority(self, cell):
+        """Half-width drop towards the target of the next step, per second"""
+        after = max(cell.width(self.confidence, cell.count + self.step), self.target)
+        cost = cell.seconds / cell.count if cell.count else 0.0
+        return (cell.width(self.confidence) - after) / max(cost * self.step, 1e-9)
+
+    def _over_budget(self):
+        return self.time_budget is not None and self.elapsed >= self.time_budget
+
+    def run(self):
+        """Sample until every cell is done or the budget is spent; returns the samples"""
+        # Round robin first, so slow drift spreads over all cells alike
+        for _ in range(self.min_iterations):
+            for cell in self.cells:
+                if not cell.exhausted and cell.count < self.max_iterations:
+                    self._iterate(cell)
+            if self._over_budget():
+                return self.samples
+
+        heap = [(-self._priority(cell), i) for i, cell in enumerate(self.cells) if self._open(cell)]
+        heapq.heapify(heap)
+        while heap and not self._over_budget():
+            _, i = heapq.heappop(heap)
+            cell = self.cells[i]
+            for _ in range(min(self.step, self.max_iterations - cell.count)):
+                self._iterate(cell)
+                if cell.exhausted:
+                    break
+            if self._open(cell):
+                heapq.heappush(heap, (-self._priority(cell), i))
+        return self.samples
+
+    def report(self):
+        """Iterations, reached half-width and time spent per cell"""
+        rows = [{'question': cell.key[0], 'method': cell.key[1], 'iterations': cell.count,
+                 'rel_half_width': cell.width(self.confidence), 'seconds': cell.seconds,
+                 'reached': cell.width(self.confidence) <= self.target}
+                for cell in self.cells]
+        return pd.DataFrame(rows)
+
+    def to_frame(self):
+        """Aggregates of the collected samples in the benchmark_results.csv schema"""
+        aggregator = SampleAggregator()
+        for key, values in self.samples.items():
+            index = aggregator.key_index(key)
+            aggregator.add_chunk(np.full(len(values), index, dtype=np.intp),
+                                 np.asarray(values, dtype=float))
+        return aggregator.to_frame()
+
+
+def replay_measure(samples):
+    """measure() for AdaptiveSampler that replays recorded samples in run order
+
+    samples: {(question, method, metric): array}. Each call returns the next
+    recorded iteration of the cell; StopIteration once it runs out.
+    """
+    cells = {}
+    for (question, method, metric), values in samples.items():
+        cells.setdefault((question, method), {})[metric] = values
+    positions = dict.fromkeys(cells, 0)
+
+    def measure(question, method):
+        metrics = cells[(question, method)]
+        position = positions[(question, method)]
+        if position >= min(len(values) for values in metrics.values()):
+            raise StopIteration
+        positions[(question, method)] = position + 1
+        return {metric: float(values[position]) for metric, values in metrics.items()}
+    return measure
+
+
+def plan_frame(frame, metric='server_ms', target=TARGET, fixed=ITERATIONS, **caps):
+    """Estimated iterations and time per cell from the summary CSV, next to the fixed plan"""
+    rows = frame[frame['metric'] == metric]
+    iterations = required_iterations(rows['mean_ms'], rows['stdev_ms'], target, **caps)
+    return pd.DataFrame({
+        'question': rows['question'].to_numpy(), 'method': rows['method'].to_numpy(),
+        'iterations': iterations,
+        'rel_half_width': relative_half_width(iterations, rows['mean_ms'], rows['stdev_ms']),
+        'seconds': iterations * rows['mean_ms'].to_numpy() / 1000,
+        'fixed_seconds': fixed * rows['mean_ms'].to_numpy() / 1000,
+        'fixed_rel_half_width': relative_half_width(fixed, rows['mean_ms'], rows['stdev_ms']),
+    }, columns=PLAN_COLUMNS)
+
+
+def print_plan(plan, target, fixed=ITERATIONS):
+    print("="*80)
+    print(f"ADAPTIVE PLAN: {CONFIDENCE:.0%} CI half-width <= {target:.1%} of the mean "
+          f"(vs {fixed} fixed iterations)")
+    print("="*80)
+    print(f"{'Request':<8}{'Engine':<17}{'Iterations':>11}{'Half-width':>12}"
+          f"{'Fixed width':>13}{'Time (s)':>10}{'Fixed (s)':>11}")
+    for row in plan.itertuples():
+        print(f"{row.question:<8}{row.method:<17}{row.iterations:11d}{row.rel_half_width:12.2%}"
+              f"{row.fixed_rel_half_width:13.2%}{row.seconds:10.2f}{row.fixed_seconds:11.2f}")
+    missed = (plan['fixed_rel_half_width'] > target).sum()
+    print(f"\nTotal: {plan['iterations'].sum()} iterations, {plan['seconds'].sum():.1f} s "
+          f"(fixed: {fixed * len(plan)} iterations, {plan['fixed_seconds'].sum():.1f} s, "
+          f"{missed} cells above target)")
+    # A fixed count reaching the same precision everywhere must suit the noisiest cell
+    equal = plan['iterations'].max()
+    print(f"Fixed count for the same precision: {equal} iterations per cell, "
+          f"{(plan['seconds'] / plan['iterations']).sum() * equal:.1f} s")
+
+
+def print_replay(report, target, seconds):
+    print("="*80)
+    print(f"ADAPTIVE REPLAY: target {target:.1%} relative half-width")
+    print("="*80)
+    for row in report.itertuples():
+        print(f"{row.question:<8}{row.method:<17}{row.iterations:8d}{row.rel_half_width:10.2%}"
+              f"{'' if row.reached else '  (not reached)'}")
+    print(f"\nTotal: {report['iterations'].sum()} iterations, "
+          f"{report['reached'].sum()}/{len(report)} cells at target, {seconds:.1f} s of recorded time")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--target', type=float, default=TARGET,
+                        help=f'relative CI half-width (default: {TARGET})')
+    parser.add_argument('--min-iterations', type=int, default=MIN_ITERATIONS)
+    parser.add_argument('--max-iterations', type=int, default=MAX_ITERATIONS)
+    parser.add_argument('--metric', default='server_ms', help='metric driving the sampling')
+    commands = parser.add_subparsers(dest='command', required=True)
+    plan = commands.add_parser('plan', help='estimate iterations from a results CSV')
+    plan.add_argument('csv', nargs='?', default=RESULTS_CSV)
+    replay = commands.add_parser('replay', help='run the sampler on recorded samples')
+    replay.add_argument('samples', nargs='+', help='.jsonl or .samples files in run order')
+    replay.add_argument('--budget', type=float,
+                        help='global time budget (seconds of recorded time)')
+    replay.add_argument('-o', '--output', help='write aggregates of the sampled iterations')
+    args = parser.parse_args(argv)
+    caps = dict(min_iterations=args.min_iterations, max_iterations=args.max_iterations)
+
+    if args.command == 'plan':
+        print_plan(plan_frame(read_csv(args.csv), args.metric, args.target, **caps), args.target)
+        return 0
+
+    samples = ingest(args.samples, SampleCollector()).samples()
+    cells = list(dict.fromkeys(key[:2] for key in samples if key[2] == args.metric))
+    sampler = AdaptiveSampler(cells, replay_measure(samples), [args.metric], args.target,
+                              time_budget=args.budget, cost_metric=args.metric, **caps)
+    sampler.run()
+    print_replay(sampler.report(), args.target, sampler.elapsed)
+    if args.output:
+        write_csv(sampler.to_frame(), args.output)
+        sync_store(args.output)
+        print(f"[OK] aggregates -> {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
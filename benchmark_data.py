@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared in-memory results cube for the chart scripts
+Loads the benchmark results once (memory-mapped from the columnar store, see
+results_store.py) into a question x method x metric x statistic array with
+O(1) keyed access and cached pivots
+"""
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from results_store import KEY_COLUMNS, RESULTS_CSV, load_frame, source_mtime, sync_store
+
+REQUESTS = [f'R{i}' for i in range(1, 11)]
+METHODS = ['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']
+
+# Loaded cubes, keyed by (absolute path, mtime, rename) so every chart built in
+# the same process shares a single load of the results
+_CUBES = {}
+
+
+def _natural_key(label):
+    """Sort 'R2' before 'R10'"""
+    return [int(part) if part.isdigit() else part
+            for part in re.split(r'(\d+)', str(label))]
+
+
+class ResultsCube:
+    """Dense question x method x metric x statistic view of the benchmark results"""
+
+    def __init__(self, df):
+        keys = df[KEY_COLUMNS].astype('category')
+        self.statistics = [c for c in df.columns if c not in KEY_COLUMNS]
+
+        self.questions = sorted(keys['question'].cat.categories, key=_natural_key)
+        # Keep methods and metrics in first-seen CSV order
+        self.methods = list(pd.unique(df['method']))
+        self.metrics = list(pd.unique(df['metric']))
+
+        self._q = {q: i for i, q in enumerate(self.questions)}
+        self._m = {m: i for i, m in enumerate(self.methods)}
+        self._k = {k: i for i, k in enumerate(self.metrics)}
+        self._s = {s: i for i, s in enumerate(self.statistics)}
+
+        shape = (len(self.questions), len(self.methods), len(self.metrics), len(self.statistics))
+        self.values = np.full(shape, np.nan)
+        q_idx = keys['question'].map(self._q).to_numpy(dtype=np.intp)
+        m_idx = keys['method'].map(self._m).to_numpy(dtype=np.intp)
+        k_idx = keys['metric'].map(self._k).to_numpy(dtype=np.intp)
+        self.values[q_idx, m_idx, k_idx, :] = df[self.statistics].to_numpy(dtype=float)
+
+        self.frame = df.assign(**{col: keys[col] for col in KEY_COLUMNS})
+        self._pivots = {}
+        self._averages = {}
+
+    def value(self, question, method, metric, stat='mean_ms'):
+        """O(1) lookup of a single statistic; NaN if the cell was not measured"""
+        return self.values[self._q[question], self._m[method], self._k[metric], self._s[stat]]
+
+    def get(self, question, method, metric, stat='mean_ms', default=None):
+        """Like value() but returns default for unknown keys or missing cells"""
+        try:
+            value = self.value(question, method, metric, stat)
+        except KeyError:
+            return default
+        return default if np.isnan(value) else float(value)
+
+    def pivot(self, metric, stat='mean_ms'):
+        """Question x method table for one metric/statistic (cached, do not mutate)"""
+        key = (metric, stat)
+        if key not in self._pivots:
+            data = self.values[:, :, self._k[metric], self._s[stat]]
+            pivot = pd.DataFrame(data, index=pd.Index(self.questions, name='question'),
+                                 columns=pd.Index(self.methods, name='method'))
+            self._pivots[key] = pivot.dropna(how='all').dropna(axis=1, how='all')
+        return self._pivots[key]
+
+    def method_average(self, metric, stat='mean_ms'):
+        """Average of a statistic over all requests, per method (cached)"""
+        key = (metric, stat)
+        if key not in self._averages:
+            self._averages[key] = self.pivot(metric, stat).mean()
+        return self._averages[key]
+
+    def metric_rows(self, metric):
+        """Long-form rows of the original CSV for one metric"""
+        return self.frame[self.frame['metric'] == metric]
+
+
+def load_results(path=RESULTS_CSV, rename=None):
+    """Load (or reuse) the results cube for path, optionally renaming methods"""
+    rename = dict(rename or {})
+    sync_store(path)
+    key = (os.path.abspath(path), source_mtime(path), tuple(sorted(rename.items())))
+    if key not in _CUBES:
+        df = load_frame(path)
+        if rename:
+            df['method'] = df['method'].astype(str).replace(rename)
+        _CUBES[key] = ResultsCube(df)
+    return _CUBES[key]
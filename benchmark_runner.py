@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark runner: times registered targets and writes benchmark_results.csv
+Every (request ID, engine) pair is registered as a target: a Python callable
+(timed in-process with perf_counter_ns: server_ms) or an HTTP endpoint (the
+round trip is client_ms; server_ms comes from the response's Server-Timing
+header when the API sends one). A target can also carry a render hook that
+returns a browser render time (render_ms), e.g. a headless-browser driver.
+
+Every iteration is timed and kept, from the very first (cold) call: the
+warmup of each cell is detected from its samples (steady_state.py) and only the
+steady-state iterations are aggregated into the question;method;metric;mean_ms;
+median_ms;stdev_ms;min_ms;max_ms schema the chart scripts read, while each
+cell's warmup length and first call go to benchmark_warmup.csv. --warmup N
+forces a fixed warmup instead: N more iterations per target, all taken as
+warmup. Garbage collection can stay on, be disabled around each target's
+iterations, or be forced before every iteration (outside the timing).
+
+    python benchmark_runner.py --targets reference_engines [-o benchmark_results.csv]
+                               [--iterations 100] [--warmup N] [--gc off]
+                               [--samples run.samples] [--context] [--queries] [--record]
+    python benchmark_runner.py --http R1 "SPARQL Endpoint" http://localhost:8000/api/r1
+
+Targets register themselves when their module is imported (--targets):
+
+    @benchmark('R1', 'Web 1.0')
+    def r1_web():
+        ...
+"""
+import argparse
+import contextlib
+import gc
+import http.client
+import importlib
+import json
+import re
+import sys
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from history_store import record_run, run_metadata
+from iteration_probe import CONTEXT_FILE, IterationProbe
+from quantile_sketch import PERCENTILES
+from results_store import KEY_COLUMNS, RESULTS_CSV, sync_store, write_csv
+from sample_ingest import DECIMALS, METRICS, SampleWriter
+
+ITERATIONS = 100
+WARMUP = None  # detected per cell; an int forces that many warmup iterations
+GC_MODES = ['on', 'off', 'collect']
+
+# Columns of the original harness output; --tails adds the percentile columns
+RESULT_STATISTICS = ['mean_ms', 'median_ms', 'stdev_ms', 'min_ms', 'max_ms']
+
+# Server-Timing: app;dur=12.3, db;dur=4.1 (the first duration is the server time)
+_SERVER_TIMING = re.compile(r'dur=([0-9.]+)')
+
+# {(question, method): target}, in registration order
+REGISTRY = {}
+
+
+class CallableTarget:
+    """In-process target: the call's duration is server_ms"""
+
+    TIMED_METRIC = 'server_ms'
+
+    def __init__(self, question, method, call, render=None):
+        self.question, self.method = question, method
+        self.call = call
+        self.render = render
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def run(self):
+        """One iteration; returns {metric: ms}"""
+        clock = time.perf_counter_ns
+        start = clock()
+        self.call()
+        record = {self.TIMED_METRIC: (clock() - start) / 1e6}
+        if self.render is not None:
+            record['render_ms'] = self.render()
+        return record
+
+
+class HttpTarget:
+    """HTTP GET target on a keep-alive connection: the round trip is client_ms"""
+
+    TIMED_METRIC = 'client_ms'
+
+    def __init__(self, question, method, url, render=None, timeout=60):
+        self.question, self.method = question, method
+        self.url = url
+        self.render = render
+        self.timeout = timeout
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL {url!r}, expected http:// or https://")
+        self._parts = parts
+        self._path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        self.connection = None
+
+    def open(self):
+        cls = http.client.HTTPSConnection if self._parts.scheme == 'https' else http.client.HTTPConnection
+        self.connection = cls(self._parts.hostname, self._parts.port, timeout=self.timeout)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def run(self):
+        clock = time.perf_counter_ns
+        start = clock()
+        self.connection.request('GET', self._path)
+        response = self.connection.getresponse()
+        response.read()
+        record = {self.TIMED_METRIC: (clock() - start) / 1e6}
+        if response.status >= 400:
+            raise RuntimeError(f"{self.question} {self.method}: HTTP {response.status} from {self.url}")
+        timing = _SERVER_TIMING.search(response.getheader('Server-Timing') or '')
+        if timing:
+            record['server_ms'] = float(timing.group(1))
+        if self.render is not None:
+            record['render_ms'] = self.render()
+        return record
+
+
+def register(target):
+    """Add a target to REGISTRY (replacing any target of the same request and engine)"""
+    REGISTRY[(target.question, target.method)] = target
+    return target
+
+
+def benchmark(question, method, render=None):
+    """Decorator registering a function as the (question, method) target"""
+    def decorate(call):
+        register(CallableTarget(question, method, call, render))
+        return call
+    return decorate
+
+
+def register_http(question, method, url, render=None):
+    return register(HttpTarget(question, method, url, render))
+
+
+class BenchmarkRunner:
+    """Runs targets and collects their samples
+
+    probe: optional IterationProbe; each iteration's context is then kept
+    with its sample in records (the JSONL layout of iteration_probe.py).
+    warmup: None to detect each cell's warmup from its samples, or a fixed
+    number of leading iterations (run on top of iterations) taken as warmup.
+    counter: optional query_profile.QueryCounter (installed); each iteration
+    then also records its query count as queries_per_request, and the
+    query profile of every target is kept in query_profiles.
+    """
+
+    def __init__(self, targets, iterations=ITERATIONS, warmup=WARMUP, gc_mode='on', probe=None,
+                 counter=None):
+        if gc_mode not in GC_MODES:
+            raise ValueError(f"Unknown GC mode {gc_mode!r}, expected one of {GC_MODES}")
+        self.targets = list(targets)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.gc_mode = gc_mode
+        self.probe = probe
+        self.counter = counter
+        self.query_profiles = {}
+        self.samples = {}   # {(question, method, metric): [ms, ...]} in run order
+        self.records = []
+
+    def measure(self, target):
+        """One timed iteration of target; returns {metric: ms}"""
+        if self.gc_mode == 'collect':
+            gc.collect()
+        probe = self.probe.measure() if self.probe is not None else contextlib.nullcontext()
+        counter = self.counter.count() if self.counter is not None else contextlib.nullcontext()
+        with probe as context, counter as queries:
+            record = target.run()
+        if queries is not None:
+            from query_profile import QUERIES_METRIC
+
+            record[QUERIES_METRIC] = queries['queries']
+            self.query_profiles[(target.question, target.method)] = queries
+        if context is not None:
+            self.records.append({'question': target.question, 'method': target.method,
+                                 **record, **context})
+        for metric, value in record.items():
+            self.samples.setdefault((target.question, target.method, metric), []).append(value)
+        return record
+
+    def run_target(self, target, iterations=None):
+        """Time one target from its first call (GC disabled meanwhile in 'off' mode)"""
+        iterations = self.iterations if iterations is None else iterations
+        target.open()
+        enabled = gc.isenabled()
+        try:
+            if self.gc_mode == 'off':
+                gc.collect()
+                gc.disable()
+            for _ in range(iterations + (self.warmup or 0)):
+                self.measure(target)
+        finally:
+            if enabled:
+                gc.enable()
+            target.close()
+
+    def run(self, progress=None):
+        """Run every target in order; returns the samples"""
+        for target in self.targets:
+            self.run_target(target)
+            if progress:
+                progress(target)
+        return self.samples
+
+    def run_adaptive(self, **options):
+        """Let adaptive_sampling.AdaptiveSampler pick the iterations of every target
+
+        Each cell is driven by the time its target measures itself (TIMED_METRIC).
+        A fixed warmup is measured and kept before sampling starts; otherwise the
+        sampler sees every iteration and the warmup is split off afterwards.
+        """
+        from adaptive_sampling import AdaptiveSampler
+
+        targets = {(t.question, t.method): t for t in self.targets}
+
+        def measure(question, method):
+            target = targets[(question, method)]
+            return {'timed_ms': self.measure(target)[target.TIMED_METRIC]}
+
+        enabled = gc.isenabled()
+        if self.gc_mode == 'off':
+            gc.collect()
+            gc.disable()
+        try:
+            for target in self.targets:
+                target.open()
+                for _ in range(self.warmup or 0):
+                    self.measure(target)
+            sampler = AdaptiveSampler(list(targets), measure, ['timed_ms'], **options)
+            sampler.run()
+        finally:
+            if enabled:
+                gc.enable()
+            for target in self.targets:
+                target.close()
+        return sampler
+
+    def warmups(self):
+        """{(question, method, metric): leading warmup iterations} of the samples"""
+        if self.warmup is not None:
+            return {key: min(self.warmup, len(values) - 1) for key, values in self.samples.items()}
+        from steady_state import split_warmup
+
+        return split_warmup(self.samples)
+
+    def to_frame(self, tails=False):
+        """Exact steady-state aggregates in the benchmark_results.csv schema (percentiles with tails)"""
+        return results_frame(self.samples, tails, self.warmups())
+
+    def warmup_frame(self):
+        """Cold-start report of the timed cells (warmup length, first call) in the WARMUP_CSV schema"""
+        from steady_state import warmup_frame
+
+        timed = {key: np.asarray(values, dtype=float) for key, values in self.samples.items()
+                 if key[2] in METRICS}
+        warmups = self.warmups()
+        return warmup_frame(timed, {key: warmups[key] for key in timed})
+
+
+def results_frame(samples, tails=False, warmups=None):
+    """Aggregate {(question, method, metric): samples} exactly (nearest-rank percentiles)
+
+    warmups: {key: leading iterations to leave out}; all samples count without it.
+    """
+    statistics = RESULT_STATISTICS + ([f'{name}_ms' for name, _ in PERCENTILES] if tails else [])
+    # Cells in run order, metrics in the usual order within each cell
+    cells = list(dict.fromkeys(key[:2] for key in samples))
+    order = {metric: i for i, metric in enumerate(METRICS)}
+    keys = sorted(samples, key=lambda key: (cells.index(key[:2]), order.get(key[2], len(order))))
+    rows = []
+    for key in keys:
+        values = np.asarray(samples[key], dtype=float)[(warmups or {}).get(key, 0):]
+        row = dict(zip(KEY_COLUMNS, key), mean_ms=values.mean(), median_ms=np.median(values),
+                   stdev_ms=values.std(ddof=1) if len(values) > 1 else 0.0,
+                   min_ms=values.min(), max_ms=values.max())
+        if tails:
+            for name, q in PERCENTILES:
+                row[f'{name}_ms'] = np.percentile(values, 100 * q, method='inverted_cdf')
+        rows.append(row)
+    frame = pd.DataFrame(rows, columns=KEY_COLUMNS + statistics)
+    return frame.round({stat: DECIMALS for stat in statistics})
+
+
+def write_samples(samples, path):
+    """Raw samples as a binary .samples file (sample_ingest.py format)"""
+    questions = list(dict.fromkeys(q for q, _, _ in samples))
+    methods = list(dict.fromkeys(m for _, m, _ in samples))
+    metrics = list(dict.fromkeys(k for _, _, k in samples))
+    with SampleWriter(path, questions, methods, metrics) as writer:
+        for key, values in samples.items():
+            writer.write(*key, values)
+
+
+def write_records(records, path=CONTEXT_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+def main(argv=None):
+    from steady_state import WARMUP_CSV
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--targets', nargs='+', default=[], metavar='MODULE',
+                        help='modules whose import registers targets')
+    parser.add_argument('--http', nargs=3, action='append', default=[],
+                        metavar=('QUESTION', 'METHOD', 'URL'), help='register an HTTP endpoint')
+    parser.add_argument('--only', nargs='+', metavar='PATTERN',
+                        help='run only targets whose "question method" contains a pattern')
+    parser.add_argument('-o', '--output', default=RESULTS_CSV,
+                        help=f'results CSV to write (default: {RESULTS_CSV})')
+    parser.add_argument('--warmup-output', default=WARMUP_CSV,
+                        help=f'cold-start report of the timed cells (default: {WARMUP_CSV})')
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--warmup', type=int, default=WARMUP, metavar='N',
+                        help='fixed warmup iterations (default: detected per cell)')
+    parser.add_argument('--gc', choices=GC_MODES, default='on', dest='gc_mode',
+                        help='on (default), off during timed iterations, or collect before each')
+    parser.add_argument('--tails', action='store_true', help='also write p90/p95/p99/p999 columns')
+    parser.add_argument('--samples', metavar='PATH', help='also write the raw samples (.samples)')
+    parser.add_argument('--context', nargs='?', const=CONTEXT_FILE, metavar='PATH',
+                        help=f'record per-iteration context (default: {CONTEXT_FILE})')
+    parser.add_argument('--queries', action='store_true',
+                        help='count SPARQL queries per request (query_profile.py)')
+    parser.add_argument('--adaptive', type=float, metavar='TARGET',
+                        help='sample until this relative CI half-width (adaptive_sampling.py)')
+    parser.add_argument('--budget', type=float, help='time budget in seconds (with --adaptive)')
+    parser.add_argument('--record', action='store_true', help='append the run to the history')
+    parser.add_argument('--scale', type=float, help='dataset scale factor, for --record')
+    parser.add_argument('--note', help='note for --record')
+    args = parser.parse_args(argv)
+
+    for module in args.targets:
+        importlib.import_module(module)
+    for question, method, url in args.http:
+        register_http(question, method, url)
+    targets = [t for t in REGISTRY.values()
+               if not args.only or any(p in f'{t.question} {t.method}' for p in args.only)]
+    if not targets:
+        print("No targets registered: pass --targets MODULE or --http QUESTION METHOD URL")
+        return 1
+
+    probe = IterationProbe().open() if args.context else None
+    counter = None
+    if args.queries:
+        from query_profile import QueryCounter
+        counter = QueryCounter().install()
+    runner = BenchmarkRunner(targets, args.iterations, args.warmup, args.gc_mode, probe, counter)
+    warmup = 'detected warmup' if args.warmup is None else f'{args.warmup} warmup'
+    print(f"Running {len(targets)} targets ({warmup} + "
+          f"{'adaptive' if args.adaptive else args.iterations} iterations, GC {args.gc_mode})")
+    start = time.perf_counter()
+    try:
+        if args.adaptive:
+            runner.run_adaptive(target=args.adaptive, time_budget=args.budget)
+        else:
+            runner.run(lambda t: print(f"  {t.question:<4} {t.method:<17} done"))
+    finally:
+        if probe is not None:
+            probe.close()
+        if counter is not None:
+            counter.uninstall()
+    seconds = time.perf_counter() - start
+
+    frame = runner.to_frame(args.tails)
+    write_csv(frame, args.output)
+    sync_store(args.output)
+    print(f"[OK] {sum(len(v) for v in runner.samples.values())} samples in {seconds:.1f} s "
+          f"-> {len(frame)} rows in {args.output}")
+    write_csv(runner.warmup_frame(), args.warmup_output)
+    print(f"[OK] cold-start report -> {args.warmup_output}")
+    if args.samples:
+        write_samples(runner.samples, args.samples)
+        print(f"[OK] raw samples -> {args.samples}")
+    if args.queries:
+        from query_profile import PROFILE_CSV, print_report, profile_frame, write_profile
+        profile = profile_frame(runner.query_profiles)
+        write_profile(profile)
+        print(f"[OK] query profile -> {PROFILE_CSV}")
+        print_report(profile)
+    if args.context:
+        write_records(runner.records, args.context)
+        print(f"[OK] iteration context -> {args.context}")
+    if args.record:
+        run_id = record_run(frame, run_metadata(args.scale, args.note))
+        print(f"[OK] recorded as run {run_id}")
+    return 0
+
+
+if __name__ == '__main__':
+    # Target modules import benchmark_runner: register into this module, not a second copy
+    sys.modules.setdefault('benchmark_runner', sys.modules['__main__'])
+    sys.exit(main())
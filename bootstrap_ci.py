@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bootstrap confidence intervals for the benchmark cells
+The resampling indices of all (request, engine) cells are drawn together in
+one batched NumPy operation (cells x resamples x iterations per batch, from raw
+random bits); each cell's resamples are then gathered from its own row of a
+NaN-padded sample matrix. 40 cells x 10,000 resamples of 100 iterations take
+about 0.5 s for means (medians, from per-position tallies, about as much again).
+
+With raw per-iteration samples (sample_ingest.py) the bootstrap is exact for
+means and medians. From the summary CSV alone, cell means are resampled
+parametrically from mean, stdev and the iteration count; medians then need
+raw samples.
+
+    python bootstrap_ci.py [metric]   # per-cell and speedup CIs for a metric
+"""
+import sys
+import time
+
+import numpy as np
+
+from sample_ingest import SAMPLES_FILE, SampleCollector, file_signature, ingest
+
+CONFIDENCE = 0.95
+RESAMPLES = 10_000
+SEED = 20240601      # fixed so charts are reproducible
+BATCH = 500          # resamples per batch: memory is cells x BATCH x iterations
+BATCH_ELEMENTS = 20_000_000  # cap on cells x batch x iterations (160 MB of float64)
+EXACT_LIMIT = 10_000  # above this many samples per cell, mean CIs use the normal approximation
+ITERATIONS = 100     # measured iterations per cell (see README methodology)
+
+STATISTICS = ('mean', 'median')
+
+
+def sample_matrix(samples):
+    """NaN-padded cells x max_iterations matrix and the sample count of each cell"""
+    counts = np.array([len(values) for values in samples], dtype=np.int64)
+    matrix = np.full((len(samples), max(counts.max(initial=0), 1)), np.nan)
+    for row, values in enumerate(samples):
+        matrix[row, :len(values)] = values
+    return matrix, counts
+
+
+def bootstrap(matrix, counts, statistics=('mean',), resamples=RESAMPLES, seed=SEED, batch=BATCH):
+    """Bootstrap distribution of each statistic for every cell
+
+    Returns {statistic: cells x resamples array}. Cells are resampled with
+    replacement at their own sample count; all cells share each batched draw.
+    """
+    unknown = set(statistics) - set(STATISTICS)
+    if unknown:
+        raise ValueError(f"Unknown statistic(s) {sorted(unknown)}, expected {STATISTICS}")
+    rng = np.random.default_rng(seed)
+    cells, width = matrix.shape
+    draws = {name: np.empty((cells, resamples)) for name in statistics}
+    batch = max(1, min(batch, BATCH_ELEMENTS // (cells * width)))
+    scale = counts.astype(np.uint64)[:, None, None]
+    # Medians are read from per-position tallies over each cell's sorted samples
+    ordered = np.sort(matrix, axis=1) if 'median' in statistics else None
+
+    for start in range(0, resamples, batch):
+        size = min(batch, resamples - start)
+        # One draw for every cell: 32 random bits scaled to [0, count) (multiply-shift,
+        # bias below count / 2**32) are cheaper than floats or bounded integers
+        elements = cells * size * width
+        bits = rng.bit_generator.random_raw((elements + 1) // 2).view(np.uint32)[:elements]
+        positions = bits.reshape(cells, size, width).astype(np.uint64)
+        positions *= scale
+        positions >>= np.uint64(32)
+        positions = positions.view(np.intp)
+        # Gathered per cell so its samples stay in cache; a shorter cell uses its first `count` draws
+        for row, count in enumerate(counts):
+            drawn = positions[row, :, :count]
+            if 'mean' in statistics:
+                draws['mean'][row, start:start + size] = matrix[row].take(drawn).mean(axis=1)
+            if 'median' in statistics:
+                draws['median'][row, start:start + size] = _tally_median(ordered[row], drawn, count)
+    return draws
+
+
+def _tally_median(ordered, positions, count):
+    """Median of each row of ordered[positions] (ordered sorted), without partitioning"""
+    rows = len(positions)
+    offsets = np.arange(0, rows * count, count)[:, None]
+    tally = np.bincount((positions + offsets).ravel(), minlength=rows * count).reshape(rows, count)
+    cumulative = tally.cumsum(axis=1)
+    low = (cumulative <= (count - 1) // 2).sum(axis=1)
+    high = (cumulative <= count // 2).sum(axis=1)
+    return (ordered[low] + ordered[high]) / 2
+
+
+def summary_mean_draws(mean, stdev, iterations=ITERATIONS, resamples=RESAMPLES, seed=SEED):
+    """Parametric bootstrap of cell means from summary statistics (normal, stdev/sqrt(n))
+
+    mean, stdev (and iterations, if an array) broadcast together; the result
+    has a trailing resamples axis.
+    """
+    rng = np.random.default_rng(seed)
+    mean = np.asarray(mean, dtype=float)
+    stderr = np.asarray(stdev, dtype=float) / np.sqrt(iterations)
+    return mean[..., None] + stderr[..., None] * rng.standard_normal(mean.shape + (resamples,))
+
+
+def percentile_interval(draws, confidence=CONFIDENCE):
+    """(low, high) percentile interval along the last (resample) axis"""
+    alpha = (1 - confidence) / 2
+    low, high = np.nanpercentile(draws, [100 * alpha, 100 * (1 - alpha)], axis=-1)
+    return low, high
+
+
+def cell_draws(cube, metric, statistic='mean', sample_files=(SAMPLES_FILE,),
+               resamples=RESAMPLES, seed=SEED):
+    """Bootstrap draws aligned with cube.pivot(metric): questions x methods x resamples
+
+    Uses the raw samples when sample_files exist, otherwise the summary
+    statistics (means only). Raw samples are resampled from each cell's
+    steady state (its detected warmup dropped, as in the results CSV). Means of cells with more than EXACT_LIMIT samples
+    are drawn from the normal approximation, which is indistinguishable from
+    the resampled distribution at that size and costs nothing per sample.
+    """
+    pivot = cube.pivot(metric)
+    existing = [path for path, _, _ in file_signature(sample_files)]
+    if existing:
+        from steady_state import split_warmup
+
+        samples = ingest(existing, SampleCollector([metric])).samples()
+        warmups = split_warmup(samples)
+        samples = {key: values[warmups[key]:] for key, values in samples.items()}
+        cells = [(q, m) for q in pivot.index for m in pivot.columns]
+        values = [samples.get((q, m, metric), np.array([np.nan])) for q, m in cells]
+        if statistic == 'mean' and max(len(v) for v in values) > EXACT_LIMIT:
+            counts = np.array([len(v) for v in values])
+            means = np.array([v.mean() for v in values])
+            stdevs = np.array([v.std(ddof=1) if len(v) > 1 else 0.0 for v in values])
+            draws = summary_mean_draws(means, stdevs, counts, resamples, seed)
+            return draws.reshape(pivot.shape + (resamples,))
+        matrix, counts = sample_matrix(values)
+        draws = bootstrap(matrix, counts, (statistic,), resamples, seed)[statistic]
+        return draws.reshape(pivot.shape + (resamples,))
+    if statistic != 'mean':
+        raise ValueError(f"Bootstrap {statistic} intervals need raw samples ({SAMPLES_FILE})")
+    stdev = cube.pivot(metric, 'stdev_ms').reindex(index=pivot.index, columns=pivot.columns)
+    return summary_mean_draws(pivot.to_numpy(), stdev.to_numpy(), resamples=resamples, seed=seed)
+
+
+def main(argv):
+    from benchmark_data import load_results
+
+    metric = argv[0] if argv else 'server_ms'
+    cube = load_results()
+    pivot = cube.pivot(metric)
+    raw = bool(file_signature([SAMPLES_FILE]))
+
+    start = time.perf_counter()
+    draws = cell_draws(cube, metric)
+    seconds = time.perf_counter() - start
+    low, high = percentile_interval(draws)
+
+    print("="*80)
+    print(f"{metric} MEAN, {CONFIDENCE:.0%} BOOTSTRAP CI "
+          f"({'raw samples' if raw else 'parametric, from mean/stdev'})")
+    print("="*80)
+    for i, question in enumerate(pivot.index):
+        cells = [f"{pivot.iat[i, j]:8.2f} [{low[i, j]:7.2f}-{high[i, j]:7.2f}]"
+                 for j in range(len(pivot.columns))]
+        print(f"{question:4s} " + ' '.join(cells))
+    print(f"({pivot.size} cells x {RESAMPLES} resamples in {seconds:.2f} s; "
+          f"columns: {', '.join(pivot.columns)})")
+
+    baseline = list(pivot.columns).index('Web 1.0')
+    ratios = draws[:, [baseline], :] / draws
+    speedup = pivot.rdiv(pivot['Web 1.0'], axis=0)
+    low, high = percentile_interval(ratios)
+    print("\n" + "="*80)
+    print("SPEEDUP VS WEB 1.0 (>1 = faster), CI excluding 1 marked *")
+    print("="*80)
+    for j, method in enumerate(pivot.columns):
+        if j == baseline:
+            continue
+        cells = [f"{question}={speedup.iat[i, j]:.2f}x{'*' if low[i, j] > 1 or high[i, j] < 1 else ''}"
+                 for i, question in enumerate(pivot.index)]
+        print(f"{method:16s} " + ' '.join(cells))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
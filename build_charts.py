@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build every report chart in parallel
+Each chart of the generate_* scripts runs as a separate task on a process pool
+sized to the machine, with per-chart and total wall times reported.
+Charts whose declared inputs are unchanged since the last build are skipped.
+Several rendering profiles (preview, publication) can be built and compared.
+"""
+import argparse
+import contextlib
+import fnmatch
+import importlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from chart_cache import ChartCache, input_digests
+from render_profile import PROFILES, FORMATS, active_profile, output_path, set_profile
+
+# Chart scripts in report order. The benchmark charts are listed once per
+# language (English names, French *_fr names); generate_3_benchmark_charts.py
+# is only a French entry point into generate_benchmark_charts_full.py.
+CHART_MODULES = [
+    'generate_benchmark_charts_full',
+    'generate_loc_charts',
+    'generate_loc_vs_performance',
+    'pareto_skyline',
+    'generate_complexity_charts',
+    'generate_robustness_charts',
+    'generate_combined_dependencies',
+    'generate_distribution_charts',  # only when raw samples exist
+    'generate_significance_charts',  # only when raw samples exist
+    'generate_trend_charts',  # only once the history holds two runs
+    'spike_attribution',  # only when iteration context was captured
+    'steady_state',  # warmup curves, only when raw samples exist
+    'scaling_fit',  # only once runs at two or more scales are recorded
+    'calibration',  # baseline-subtracted means, only after a calibration run
+    'query_profile',  # queries per request, only once a query profile exists
+]
+
+
+def _matches(output, patterns):
+    if not patterns:
+        return True
+    return any(fnmatch.fnmatch(output, p) or p in output for p in patterns)
+
+
+def collect_tasks(patterns=None, modules=CHART_MODULES):
+    """List (module, output) pairs for every chart matching one of patterns"""
+    tasks = []
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        for output in module.CHARTS:
+            if _matches(output, patterns):
+                tasks.append((module_name, output))
+    return tasks
+
+
+def chart_renderer(module_name, output):
+    return importlib.import_module(module_name).CHARTS[output]
+
+
+def render_chart(module_name, output, profile_name='publication', fmt=None):
+    """Render a single chart and return (output, path, wall seconds, bytes)"""
+    import matplotlib.pyplot as plt
+
+    set_profile(profile_name, fmt)
+    render = chart_renderer(module_name, output)
+    start = time.perf_counter()
+    # Scripts print their own [OK] lines; keep the pool output to one line per chart
+    with contextlib.redirect_stdout(io.StringIO()):
+        render()
+    plt.close('all')
+    seconds = time.perf_counter() - start
+    path = output_path(output)
+    return output, path, seconds, os.path.getsize(path)
+
+
+def build_tier(tasks, profile_name, args, cache):
+    """Build the stale charts of tasks under one profile; returns the tier totals"""
+    set_profile(profile_name, args.format)
+    profile = active_profile()
+    totals = {'profile': profile_name, 'built': 0, 'skipped': 0, 'failed': 0,
+              'seconds': 0.0, 'bytes': 0, 'wall': 0.0}
+
+    digests = {}
+    reasons = {}
+    for module_name, output in tasks:
+        path = output_path(output, profile)
+        try:
+            digests[path] = input_digests(chart_renderer(module_name, output),
+                                          extra={'profile': profile})
+        except Exception as exc:
+            # An input that cannot be read fails this chart only, like a render error
+            totals['failed'] += 1
+            print(f"[FAIL] {output:38s} inputs: {exc!r}")
+            continue
+        reason = 'forced' if args.force else cache.stale_reason(path, digests[path])
+        if reason is None:
+            totals['skipped'] += 1
+            totals['bytes'] += os.path.getsize(path)
+            print(f"[SKIP] {path:38s} up to date")
+        else:
+            reasons[path] = reason
+    stale = [task for task in tasks if output_path(task[1], profile) in reasons]
+    if not stale:
+        print(f"All {profile_name} charts are up to date")
+        return totals
+
+    jobs = max(1, min(args.jobs, len(stale)))
+    print("="*80)
+    print(f"BUILDING {len(stale)} {profile_name.upper()} CHARTS ON {jobs} WORKER(S)")
+    print("="*80)
+
+    start = time.perf_counter()
+
+    def report(output, result):
+        try:
+            output, path, seconds, size = result()
+        except Exception as exc:
+            totals['failed'] += 1
+            print(f"[FAIL] {output:38s} {exc!r}")
+            return
+        totals['built'] += 1
+        totals['seconds'] += seconds
+        totals['bytes'] += size
+        cache.record(path, digests[path])
+        print(f"[OK] {path:40s} {seconds:7.2f} s {size / 1024:8.0f} KiB  ({reasons[path]})")
+
+    if jobs == 1:
+        for module_name, output in stale:
+            report(output, lambda: render_chart(module_name, output, profile_name, args.format))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(render_chart, module_name, output, profile_name, args.format): output
+                       for module_name, output in stale}
+            for future in as_completed(futures):
+                report(futures[future], future.result)
+
+    cache.save()
+    totals['wall'] = time.perf_counter() - start
+    print("-" * 80)
+    print(f"Wall time: {totals['wall']:.2f} s (sum of chart times: {totals['seconds']:.2f} s)")
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('charts', nargs='*',
+                        help='only build charts whose file name matches (glob or substring)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='number of worker processes (default: CPU count)')
+    parser.add_argument('--list', action='store_true', help='list charts and exit')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild every selected chart even if its inputs are unchanged')
+    parser.add_argument('-p', '--profile', action='append', choices=sorted(PROFILES),
+                        help='rendering profile; repeat to build and compare several tiers '
+                             '(default: publication)')
+    parser.add_argument('--format', choices=FORMATS,
+                        help="override the profile's output format")
+    args = parser.parse_args(argv)
+
+    tasks = collect_tasks(args.charts)
+    if args.list:
+        for module_name, output in tasks:
+            print(f"{output:40s} {module_name}.py")
+        return 0
+    if not tasks:
+        print("No chart matches", ' '.join(args.charts))
+        return 1
+
+    cache = ChartCache()
+    tiers = [build_tier(tasks, name, args, cache) for name in args.profile or ['publication']]
+
+    print("\n" + "="*80)
+    print("RENDERING TIERS")
+    print("="*80)
+    print(f"{'Profile':<14} {'Built':>6} {'Skipped':>8} {'Failed':>7} {'Wall (s)':>9} "
+          f"{'Charts (s)':>11} {'Size (KiB)':>11}")
+    for tier in tiers:
+        print(f"{tier['profile']:<14} {tier['built']:>6} {tier['skipped']:>8} {tier['failed']:>7} "
+              f"{tier['wall']:>9.2f} {tier['seconds']:>11.2f} {tier['bytes'] / 1024:>11.0f}")
+    return 1 if any(tier['failed'] for tier in tiers) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Timer resolution and harness overhead calibration
+Sub-millisecond cells (SPARQL at 0.6-0.9 ms) sit close to the floor that the
+measurement itself adds. This stage measures that floor on the benchmark
+machine and saves it to benchmark_calibration.csv:
+
+    timer_resolution  smallest non-zero step of perf_counter_ns
+    empty_call        timing an empty function the way the harness times a call
+    http_round_trip   an empty keep-alive GET against a local stand-in server
+
+Each metric is mapped to the probe that bounds it (METRIC_PROBES): server and
+render times are in-process calls, client times include an HTTP round trip.
+The floor (probe median) can be subtracted from the results, and differences
+smaller than the noise (probe spread, at least the timer resolution) are not
+distinguishable from measurement noise.
+
+    python calibration.py [--iterations 10000] [--charts]
+"""
+import argparse
+import functools
+import http.client
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from benchmark_data import METHODS, REQUESTS, load_results
+from chart_cache import chart_inputs
+from generate_distribution_charts import COLORS, METRIC_LABELS
+from render_profile import save_figure
+from results_store import CSV_SEPARATOR
+from sample_ingest import METRICS, file_signature
+
+CALIBRATION_CSV = 'benchmark_calibration.csv'
+CALIBRATION_COLUMNS = ['probe', 'median_ms', 'mean_ms', 'stdev_ms', 'min_ms', 'p99_ms', 'iterations']
+
+ITERATIONS = 10_000       # per probe (HTTP: a tenth of it)
+WARMUP = 100
+NOISE_MULTIPLE = 2.0      # cells within this many noise units of the floor are unresolved
+
+METRIC_PROBES = {'server_ms': 'empty_call', 'client_ms': 'http_round_trip', 'render_ms': 'empty_call'}
+
+
+def timer_resolution(samples=ITERATIONS):
+    """Smallest non-zero step between consecutive perf_counter_ns readings (ns)"""
+    readings = np.empty(samples, dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i in range(samples):
+        readings[i] = clock()
+    steps = np.diff(readings)
+    steps = steps[steps > 0]
+    declared = time.get_clock_info('perf_counter').resolution * 1e9
+    return np.maximum(steps, declared) if len(steps) else np.array([declared])
+
+
+def _time_calls(call, iterations, warmup=WARMUP):
+    """Harness-style timings of call() in ns: perf_counter_ns around each call"""
+    clock = time.perf_counter_ns
+    for _ in range(warmup):
+        call()
+    timings = np.empty(iterations, dtype=np.int64)
+    for i in range(iterations):
+        start = clock()
+        call()
+        timings[i] = clock() - start
+    return timings
+
+
+def empty_call_overhead(iterations=ITERATIONS):
+    """Timings (ns) of an empty function call"""
+    def empty():
+        pass
+    return _time_calls(empty, iterations)
+
+
+class _EmptyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the benchmark clients
+
+    def do_GET(self):
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer:
+    """Local HTTP server answering every GET with an empty 204 (runs in a thread)
+
+        with StandInServer() as server:
+            connection = http.client.HTTPConnection(server.host, server.port)
+    """
+
+    def __init__(self, handler=_EmptyHandler, host='127.0.0.1', port=0):
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.host, self.port = self.server.server_address[:2]
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f'http://{self.host}:{self.port}/'
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def http_round_trip(iterations=ITERATIONS // 10):
+    """Timings (ns) of an empty keep-alive GET against a StandInServer"""
+    with StandInServer() as server:
+        connection = http.client.HTTPConnection(server.host, server.port)
+
+        def get():
+            connection.request('GET', '/')
+            connection.getresponse().read()
+        try:
+            return _time_calls(get, iterations, warmup=WARMUP // 10)
+        finally:
+            connection.close()
+
+
+def summarize(probe, timings_ns):
+    values = np.asarray(timings_ns, dtype=float) / 1e6
+    return {'probe': probe, 'median_ms': np.median(values), 'mean_ms': values.mean(),
+            'stdev_ms': values.std(ddof=1) if len(values) > 1 else 0.0, 'min_ms': values.min(),
+            'p99_ms': np.percentile(values, 99), 'iterations': len(values)}
+
+
+def calibrate(iterations=ITERATIONS):
+    """Run every probe; one row per probe in the CALIBRATION_CSV schema"""
+    rows = [summarize('timer_resolution', timer_resolution(iterations)),
+            summarize('empty_call', empty_call_overhead(iterations)),
+            summarize('http_round_trip', http_round_trip(max(iterations // 10, 2)))]
+    return pd.DataFrame(rows, columns=CALIBRATION_COLUMNS)
+
+
+def read_calibration(path=CALIBRATION_CSV):
+    return pd.read_csv(path, sep=CSV_SEPARATOR)
+
+
+def write_calibration(frame, path=CALIBRATION_CSV):
+    frame.round(6).to_csv(path, sep=CSV_SEPARATOR, index=False)
+
+
+def noise_floors(calibration):
+    """{metric: (floor_ms, noise_ms)}: probe median, and probe stdev or timer step if larger"""
+    probes = calibration.set_index('probe')
+    resolution = probes.at['timer_resolution', 'median_ms']
+    return {metric: (probes.at[probe, 'median_ms'], max(probes.at[probe, 'stdev_ms'], resolution))
+            for metric, probe in METRIC_PROBES.items() if probe in probes.index}
+
+
+def subtract_floor(pivot, floor_ms):
+    """Baseline-subtracted means (never below zero)"""
+    return (pivot - floor_ms).clip(lower=0.0)
+
+
+def calibration_signature():
+    return file_signature([CALIBRATION_CSV])
+
+
+@functools.lru_cache(maxsize=None)
+def _floors(signature):
+    return noise_floors(read_calibration())
+
+
+def load_floors():
+    """noise_floors() of CALIBRATION_CSV (read once per file state)"""
+    return _floors(repr(calibration_signature()))
+
+
+# ============================================================================
+# CHART 1: Baseline-subtracted means per request
+# ============================================================================
+@chart_inputs(data=lambda: [load_results().pivot(m) for m in measured_metrics()],
+              calibration=calibration_signature, colors=COLORS, noise=NOISE_MULTIPLE)
+def chart_calibrated(metric='server_ms'):
+    floor, noise = load_floors()[metric]
+    pivot = load_results().pivot(metric).reindex(index=REQUESTS)
+    methods = [m for m in METHODS if m in pivot.columns]
+    corrected = subtract_floor(pivot[methods], floor)
+    unresolved = corrected < NOISE_MULTIPLE * noise
+    # Log axis: show values at the floor noise level at least
+    shown = corrected.clip(lower=noise / 2)
+
+    fig, ax = plt.subplots(figsize=(14, 7))
+    x = np.arange(len(REQUESTS))
+    width = 0.8 / len(methods)
+    for i, method in enumerate(methods):
+        offset = (i - (len(methods) - 1) / 2) * width
+        bars = ax.bar(x + offset, shown[method], width, color=COLORS.get(method, 'gray'),
+                      alpha=0.85, label=method)
+        for bar, flag in zip(bars, unresolved[method]):
+            if flag:
+                bar.set_hatch('///')
+                bar.set_alpha(0.4)
+    ax.axhspan(noise / 2, NOISE_MULTIPLE * noise, color='gray', alpha=0.15,
+               label=f'Within {NOISE_MULTIPLE:g}x measurement noise ({noise * 1000:.1f} µs)')
+    ax.set_yscale('log')
+    ax.set_xticks(x)
+    ax.set_xticklabels(REQUESTS)
+    ax.set_xlabel('Request', fontsize=12, fontweight='bold')
+    ax.set_ylabel(f'Mean minus {floor * 1000:.1f} µs floor (ms) - Log Scale', fontsize=12,
+                  fontweight='bold')
+    ax.set_title(f'{METRIC_LABELS[metric]} Time Minus Harness Floor ({METRIC_PROBES[metric]})\n'
+                 'Hatched = not resolvable from measurement noise', fontsize=14, fontweight='bold', pad=20)
+    ax.legend(loc='upper left', fontsize=10)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    fig.tight_layout()
+    save_figure(f"calibrated_{metric.replace('_ms', '')}.png", fig)
+    plt.close(fig)
+    print(f"[OK] Chart 1: calibrated_{metric.replace('_ms', '')}.png")
+
+
+def print_calibration(calibration):
+    print("="*80)
+    print("HARNESS CALIBRATION (µs)")
+    print("="*80)
+    print(f"{'Probe':<18}{'Median':>10}{'Mean':>10}{'Stdev':>10}{'Min':>10}{'p99':>10}{'N':>8}")
+    for row in calibration.itertuples():
+        print(f"{row.probe:<18}{row.median_ms * 1000:10.2f}{row.mean_ms * 1000:10.2f}"
+              f"{row.stdev_ms * 1000:10.2f}{row.min_ms * 1000:10.2f}{row.p99_ms * 1000:10.2f}"
+              f"{row.iterations:8d}")
+
+
+def print_resolvability(floors):
+    """Engine pairs per request whose difference is below the measurement noise"""
+    results = load_results()
+    print("\n" + "="*80)
+    print(f"DIFFERENCES WITHIN {NOISE_MULTIPLE:g}x MEASUREMENT NOISE (vs Web 1.0)")
+    print("="*80)
+    for metric, (floor, noise) in floors.items():
+        if metric not in results.metrics:
+            continue
+        pivot = results.pivot(metric)
+        corrected = subtract_floor(pivot, floor)
+        share = (floor / pivot).max().max()
+        print(f"{metric}: floor {floor * 1000:.1f} µs (up to {share:.1%} of a cell), "
+              f"noise {noise * 1000:.1f} µs")
+        for method in [m for m in pivot.columns if m != 'Web 1.0']:
+            close = [q for q in pivot.index
+                     if abs(corrected.at[q, method] - corrected.at[q, 'Web 1.0']) < NOISE_MULTIPLE * noise]
+            if close:
+                print(f"  {method:<17} {', '.join(close)}")
+
+
+def measured_metrics():
+    """METRICS present in the results (in-process runner targets only measure server_ms)"""
+    return [m for m in METRICS if m in load_results().metrics]
+
+
+def calibration_charts():
+    """One chart per measured metric once a calibration has been saved"""
+    charts = {}
+    if calibration_signature():
+        for metric in [m for m in measured_metrics() if m in load_floors()]:
+            charts[f"calibrated_{metric.replace('_ms', '')}.png"] = functools.partial(
+                chart_calibrated, metric=metric)
+    return charts
+
+
+CHARTS = calibration_charts()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=ITERATIONS,
+                        help=f'iterations per probe (default: {ITERATIONS})')
+    parser.add_argument('--reuse', action='store_true',
+                        help=f'report from the saved {CALIBRATION_CSV} instead of measuring')
+    parser.add_argument('--charts', action='store_true', help='draw calibrated_<metric>.png')
+    args = parser.parse_args(argv)
+
+    if args.reuse and os.path.exists(CALIBRATION_CSV):
+        calibration = read_calibration()
+    else:
+        calibration = calibrate(args.iterations)
+        write_calibration(calibration)
+        print(f"[OK] noise floor -> {CALIBRATION_CSV}")
+    print_calibration(calibration)
+    print_resolvability(noise_floors(calibration))
+    if args.charts:
+        for render in calibration_charts().values():
+            render()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-addressed cache for the report charts
+Charts declare their inputs with @chart_inputs; each output is keyed by a hash
+of those inputs plus the source of the chart's module and of every repo
+module it imports (directly or not), so unchanged charts can be skipped
+"""
+import ast
+import functools
+import hashlib
+import inspect
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = '.chart_cache.json'
+
+# Imports resolving to a module file in this directory are hashed with the chart
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def chart_inputs(**inputs):
+    """Declare the data a chart depends on (values, or callables evaluated lazily)"""
+    def decorate(render):
+        render.chart_inputs = inputs
+        return render
+    return decorate
+
+
+def _feed(h, value):
+    """Feed value into hash h in a type-stable way"""
+    if callable(value) and not isinstance(value, type):
+        value = value()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        h.update(b'pandas')
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        if isinstance(value, pd.DataFrame):
+            h.update(json.dumps([str(c) for c in value.columns]).encode())
+    elif isinstance(value, np.ndarray):
+        h.update(str((value.dtype, value.shape)).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)) and any(
+            isinstance(v, (pd.DataFrame, pd.Series, np.ndarray)) or callable(v) for v in value):
+        for item in value:
+            _feed(h, item)
+    else:
+        h.update(json.dumps(value, sort_keys=True, default=str).encode())
+
+
+def digest(value):
+    h = hashlib.sha256()
+    _feed(h, value)
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def source_digest(path):
+    """Digest of a source file (read once per build)"""
+    with open(path, encoding='utf-8') as f:
+        return digest(f.read())
+
+
+@functools.lru_cache(maxsize=None)
+def local_imports(path):
+    """Source files of the repo modules imported anywhere in path (lazy imports too)"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    paths = (os.path.join(SOURCE_DIR, name.split('.')[0] + '.py') for name in names)
+    return frozenset(p for p in paths if os.path.exists(p))
+
+
+@functools.lru_cache(maxsize=None)
+def source_closure(path):
+    """Source files path depends on: the repo modules it imports, transitively"""
+    seen, pending = set(), [path]
+    while pending:
+        for imported in local_imports(pending.pop()):
+            if imported not in seen and imported != path:
+                seen.add(imported)
+                pending.append(imported)
+    return sorted(seen)
+
+
+def input_digests(render, extra=None):
+    """Per-input digests for a chart renderer, including its module and imported sources"""
+    # Localized charts are partials of a shared renderer: hash the bound arguments too
+    arguments = {}
+    while isinstance(render, functools.partial):
+        arguments = {**render.keywords, **arguments}
+        render = render.func
+    # The whole script, not only the function: module-level constants and helpers count too
+    path = os.path.abspath(inspect.getsourcefile(render))
+    digests = {'code': digest(inspect.getsource(render)), 'module': source_digest(path)}
+    # Shared helpers and data loaders (bootstrap_ci, results_store, ...) invalidate the chart too
+    for imported in source_closure(path):
+        name = os.path.splitext(os.path.basename(imported))[0]
+        digests[f'module:{name}'] = source_digest(imported)
+    for name, value in arguments.items():
+        digests[f'arg:{name}'] = digest(value)
+    for name, value in getattr(render, 'chart_inputs', {}).items():
+        digests[name] = digest(value)
+    for name, value in (extra or {}).items():
+        digests[name] = digest(value)
+    return digests
+
+
+def combined_key(digests):
+    return digest(sorted(digests.items()))
+
+
+class ChartCache:
+    """Manifest of output file -> input digests from the last successful build"""
+
+    def __init__(self, path=MANIFEST):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def stale_reason(self, output, digests):
+        """None if output is up to date, otherwise why it has to be rebuilt"""
+        entry = self.entries.get(output)
+        if entry is None:
+            return 'not built yet'
+        if not os.path.exists(output):
+            return 'output missing'
+        if entry['key'] == combined_key(digests):
+            return None
+        changed = sorted(name for name in set(digests) | set(entry['inputs'])
+                         if digests.get(name) != entry['inputs'].get(name))
+        return 'changed: ' + ', '.join(changed)
+
+    def record(self, output, digests):
+        self.entries[output] = {'key': combined_key(digests), 'inputs': digests}
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
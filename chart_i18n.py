@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Localization helpers for the chart scripts
+Charts compute their data once and render one output per language; English
+keeps the historical file names, other languages get a _<lang> suffix
+"""
+import functools
+import os
+
+LANGUAGES = ['en', 'fr']
+DEFAULT_LANGUAGE = 'en'
+
+
+def localized_output(filename, lang):
+    """benchmark_heatmap.png -> benchmark_heatmap_fr.png (unchanged for English)"""
+    if lang == DEFAULT_LANGUAGE:
+        return filename
+    base, ext = os.path.splitext(filename)
+    return f"{base}_{lang}{ext}"
+
+
+def localized_charts(charts, languages=LANGUAGES):
+    """Expand {output: render(lang)} into one entry per language"""
+    expanded = {}
+    for lang in languages:
+        for output, render in charts.items():
+            expanded[localized_output(output, lang)] = functools.partial(render, lang=lang)
+    return expanded
+
+
+def parse_languages(argv):
+    """Languages requested on a script command line (default: all)"""
+    languages = [arg for arg in argv if not arg.startswith('-')] or LANGUAGES
+    unknown = sorted(set(languages) - set(LANGUAGES))
+    if unknown:
+        raise SystemExit(f"Unknown language(s) {', '.join(unknown)}, expected {', '.join(LANGUAGES)}")
+    return languages
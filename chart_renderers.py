@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reusable figure layouts for the chart scripts
+A renderer builds its figure, axes, bars and legend once and then swaps in the
+data of each chart, so rendering many request/metric combinations does not
+rebuild the layout or accumulate figures
+"""
+import numpy as np
+from matplotlib.figure import Figure
+import seaborn as sns
+from seaborn.utils import relative_luminance
+
+# Renderers shared by the charts of a process, keyed by their layout
+_RENDERERS = {}
+
+SUBPLOT_PARAMS = ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+
+
+def _fresh_tight_layout(fig, subplot_params):
+    """tight_layout from the figure's initial margins, not from the previous chart's"""
+    fig.subplots_adjust(**subplot_params)
+    fig.tight_layout()
+
+
+class GroupedBarRenderer:
+    """One bar per series for every category (e.g. one bar per engine per request)"""
+
+    def __init__(self, categories, series, colors, width=0.2, figsize=(14, 7),
+                 legend_loc='upper left'):
+        self.categories = list(categories)
+        self.series = list(series)
+        # Not registered with pyplot: the figure lives exactly as long as the renderer
+        self.fig = Figure(figsize=figsize)
+        self.ax = self.fig.subplots()
+        self._subplot_params = {k: getattr(self.fig.subplotpars, k) for k in SUBPLOT_PARAMS}
+        self._labels = []
+
+        x = np.arange(len(self.categories))
+        zeros = np.zeros(len(self.categories))
+        self.containers = {}
+        for i, name in enumerate(self.series):
+            offset = (i - (len(self.series) - 1) / 2) * width
+            self.containers[name] = self.ax.bar(x + offset, zeros, width, label=name,
+                                                color=colors[name], alpha=0.85)
+
+        self.ax.set_xticks(x)
+        self.ax.set_xticklabels(self.categories)
+        self.ax.legend(loc=legend_loc, fontsize=10)
+        self.ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    def render(self, data, xlabel, ylabel, title, log=False, label=None, fontsize=7):
+        """Show data (categories x series DataFrame) and return the figure
+
+        label(height) returns the text drawn above a bar ('' for none); all
+        labels of a series are added in a single bar_label call.
+        """
+        for artist in self._labels:
+            artist.remove()
+        self._labels = []
+
+        for name, container in self.containers.items():
+            present = name in data.columns
+            values = data[name].reindex(self.categories).to_numpy() if present else ()
+            for patch, value in zip(container.patches, values):
+                patch.set_height(value)
+            for patch in container.patches:
+                patch.set_visible(present)
+            if present and label is not None:
+                self._labels.extend(self.ax.bar_label(
+                    container, labels=[label(value) for value in values],
+                    fontsize=fontsize))
+
+        self.ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+        self.ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+        self.ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        self.ax.relim()
+        self.ax.set_yscale('log' if log else 'linear')
+        self.ax.autoscale_view()
+        _fresh_tight_layout(self.fig, self._subplot_params)
+        return self.fig
+
+    def close(self):
+        """Drop every artist so the figure memory is released now"""
+        self.fig.clear()
+        self.containers = {}
+        self._labels = []
+
+
+class HeatmapRenderer:
+    """Annotated seaborn heatmap whose mesh, colorbar and labels are updated in place"""
+
+    def __init__(self, figsize=(12, 8), cmap='YlOrRd', fmt='.1f', center=None):
+        self.fig = Figure(figsize=figsize)
+        self.ax = self.fig.subplots()
+        self._subplot_params = {k: getattr(self.fig.subplotpars, k) for k in SUBPLOT_PARAMS}
+        self.cmap = cmap
+        self.fmt = fmt
+        self.center = center  # diverging maps: color limits symmetric around center
+        self._shape = None
+
+    def _limits(self, values):
+        if self.center is None:
+            return values.min(), values.max()
+        spread = np.abs(values - self.center).max() or 1.0
+        return self.center - spread, self.center + spread
+
+    def render(self, data, title, xlabel, ylabel, cbar_label, annot=None):
+        """Color cells by data, annotate them with annot (default: data)"""
+        annot = data if annot is None else annot
+        if self._shape is None:
+            limits = {}
+            if self.center is not None:
+                limits = dict(zip(('vmin', 'vmax'), self._limits(
+                    np.ma.masked_invalid(data.to_numpy(dtype=float)))))
+            sns.heatmap(data, annot=annot, fmt=self.fmt, cmap=self.cmap,
+                        cbar_kws={'label': cbar_label}, ax=self.ax,
+                        linewidths=0.5, linecolor='gray', **limits)
+            self._shape = (list(data.index), list(data.columns))
+        elif self._shape == (list(data.index), list(data.columns)):
+            values = np.ma.masked_invalid(data.to_numpy(dtype=float))
+            mesh = self.ax.collections[0]
+            mesh.set_array(values.ravel())
+            mesh.set_clim(*self._limits(values))
+            self.fig.axes[-1].set_ylabel(cbar_label)
+            # seaborn only annotates valid cells: match labels to cells by position
+            texts = {(int(y), int(x)): text for text in self.ax.texts
+                     for x, y in [text.get_position()]}
+            missing = np.ma.getmaskarray(values)
+            for (row, col), shown in np.ndenumerate(annot.to_numpy()):
+                text = texts.get((row, col))
+                if missing[row, col]:
+                    if text is not None:
+                        text.set_visible(False)
+                    continue
+                if text is None:
+                    text = self.ax.text(col + .5, row + .5, '', ha='center', va='center')
+                # seaborn picks dark or white text depending on the cell color
+                lum = relative_luminance(mesh.cmap(mesh.norm(values[row, col])))
+                text.set_text(format(shown, self.fmt))
+                text.set_color('.15' if lum > .408 else 'w')
+                text.set_visible(True)
+        else:
+            raise ValueError("HeatmapRenderer layouts cannot change shape, use a new renderer")
+
+        self.ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        self.ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+        self.ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+        _fresh_tight_layout(self.fig, self._subplot_params)
+        return self.fig
+
+    def close(self):
+        self.fig.clear()
+        self._shape = None
+
+
+def grouped_bar_renderer(categories, series, colors, **layout):
+    """Shared GroupedBarRenderer for this layout (built on first use)"""
+    key = ('bars', tuple(categories), tuple(series), tuple(sorted(layout.items())))
+    if key not in _RENDERERS:
+        _RENDERERS[key] = GroupedBarRenderer(categories, series, colors, **layout)
+    return _RENDERERS[key]
+
+
+def heatmap_renderer(rows, columns, **layout):
+    """Shared HeatmapRenderer for a rows x columns table (built on first use)"""
+    key = ('heatmap', tuple(rows), tuple(columns), tuple(sorted(layout.items())))
+    if key not in _RENDERERS:
+        _RENDERERS[key] = HeatmapRenderer(**layout)
+    return _RENDERERS[key]
+
+
+def release_renderers():
+    """Close every shared renderer (call when a batch of charts is done)"""
+    for renderer in _RENDERERS.values():
+        renderer.close()
+    _RENDERERS.clear()
@@ -3,19 +3,27 @@
 """
 Generate comprehensive benchmark comparison charts from benchmark_results.csv
 Compares execution times across Web 1.0, RDFa, Knowledge Graph, and SPARQL Endpoint
+Pivots, speedups and statistics are computed once and rendered in every language
 """
+import functools
+import sys
+
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
-import seaborn as sns
+import pandas as pd
 
-# Load the benchmark results
-df = pd.read_csv('benchmark_results.csv', sep=';')
+from benchmark_data import load_results
+from bootstrap_ci import cell_draws, percentile_interval
+from chart_cache import chart_inputs
+from chart_i18n import localized_charts, localized_output, parse_languages
+from chart_renderers import grouped_bar_renderer, heatmap_renderer, release_renderers
+from render_profile import save_figure
+from sample_ingest import SAMPLES_FILE, file_signature
 
-# Clean up method names for better display
-df['method'] = df['method'].replace({'Knowledge Graph': 'Knowledge Graph'})
+# Load the benchmark results once into the shared question x method x metric cube
+results = load_results()
 
 # Define color palette for consistency
 COLORS = {
@@ -26,301 +34,460 @@ COLORS = {
 }
 
 REQUESTS = [f'R{i}' for i in range(1, 11)]
+METRICS = ['server_ms', 'client_ms', 'render_ms']
+# Metrics present in the results (in-process runner targets only measure server_ms)
+MEASURED_METRICS = [m for m in METRICS if m in results.metrics]
+
+# SLO percentile for the tail-latency charts (column written by sample_ingest.py)
+TAIL_STAT = 'p99_ms'
+
+# Engines shown in each language's report (the French report compares the three
+# engines of the original study, without the Knowledge Graph)
+REPORT_METHODS = {
+    'en': ['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint'],
+    'fr': ['Web 1.0', 'RDFa', 'SPARQL Endpoint'],
+}
+
+TEXT = {
+    'en': {
+        'header': "GENERATING BENCHMARK COMPARISON CHARTS",
+        'done': "All charts generated successfully!",
+        'chart': "Chart",
+        'request': 'Request',
+        'engine': 'Engine',
+        'server_ylabel': 'Server Processing Time (ms) - Log Scale',
+        'server_title': 'Server-Side Processing Time Comparison by Request',
+        'server_ok': "Server-side processing",
+        'client_ylabel': 'Client Round-Trip Time (ms) - Log Scale',
+        'client_title': 'Client-Side Round-Trip Time Comparison by Request',
+        'client_ok': "Client round-trip",
+        'render_ylabel': 'Browser Render Time (ms)',
+        'render_title': 'Browser Render Time Comparison by Request',
+        'render_ok': "Browser render",
+        'metric_labels': ['Server Processing', 'Client Round-Trip', 'Browser Render'],
+        'average_ylabel': 'Average Time (ms)',
+        'average_subtitle': 'Average Time',
+        'average_title': 'Average Execution Time by Metric and Engine\n(error bars = 95% bootstrap CI of the mean)',
+        'average_ok': "Overall averages",
+        'heatmap_cbar': 'Log10(Processing Time + 1)',
+        'heatmap_title': 'Server Processing Time Heatmap (ms)\nLog scale coloring, actual values shown',
+        'heatmap_ok': "Performance heatmap",
+        'stdev_ylabel': 'Standard Deviation (ms)',
+        'stdev_title': 'Performance Consistency (Standard Deviation of Server Time)',
+        'stdev_ok': "Performance consistency",
+        'speedup_baseline': 'Web 1.0 Baseline',
+        'speedup_ylabel': 'Speedup Factor (log scale)',
+        'speedup_title': 'Performance Speedup Relative to Web 1.0 Baseline\n(>1 = faster, <1 = slower; '
+                         'error bars = 95% bootstrap CI, ~ = CI includes 1)',
+        'speedup_ok': "Relative speedup",
+        'tail_ylabel': 'p99 {label} Time (ms) - Log Scale',
+        'tail_title': 'p99 {label} Time by Request (tail latency)',
+        'tail_ok': "p99 {label}",
+        'tail_header': "P99 TAIL LATENCY (average over requests)",
+        'summary_header': "BENCHMARK STATISTICS SUMMARY",
+        'summary_metric': "{label} Time (ms):",
+        'summary_average': "average",
+        'summary_fastest': "Fastest",
+        'summary_slowest': "Slowest",
+        'summary_ratio': "Speed ratio: {ratio:.2f}x slower",
+        'slowest_header': "SLOWEST REQUESTS (Server Processing Time)",
+    },
+    'fr': {
+        'header': "GÉNÉRATION DES GRAPHIQUES DE COMPARAISON DES BENCHMARKS",
+        'done': "Tous les graphiques ont été générés avec succès!",
+        'chart': "Graphique",
+        'request': 'Requête',
+        'engine': 'Moteur',
+        'server_ylabel': 'Temps de traitement serveur (ms) - Échelle log',
+        'server_title': 'Comparaison du temps de traitement côté serveur par requête',
+        'server_ok': "Traitement côté serveur",
+        'client_ylabel': 'Temps aller-retour client (ms) - Échelle log',
+        'client_title': 'Comparaison du temps aller-retour côté client par requête',
+        'client_ok': "Aller-retour client",
+        'render_ylabel': 'Temps de rendu navigateur (ms)',
+        'render_title': 'Comparaison du temps de rendu navigateur par requête',
+        'render_ok': "Rendu navigateur",
+        'metric_labels': ['Traitement serveur', 'Aller-retour client', 'Rendu navigateur'],
+        'average_ylabel': 'Temps moyen (ms)',
+        'average_subtitle': 'Temps moyen',
+        'average_title': 'Temps d\'exécution moyen par métrique et moteur\n'
+                         '(barres d\'erreur = IC bootstrap à 95 % de la moyenne)',
+        'average_ok': "Moyennes générales",
+        'heatmap_cbar': 'Log10(Temps de traitement + 1)',
+        'heatmap_title': 'Carte thermique du temps de traitement serveur (ms)\nColoration en échelle log, valeurs réelles affichées',
+        'heatmap_ok': "Carte thermique de performance",
+        'stdev_ylabel': 'Écart-type (ms)',
+        'stdev_title': 'Cohérence de la performance (Écart-type du temps serveur)',
+        'stdev_ok': "Cohérence de la performance",
+        'speedup_baseline': 'Référence Web 1.0',
+        'speedup_ylabel': 'Facteur d\'accélération (échelle log)',
+        'speedup_title': 'Accélération de la performance relative à la référence Web 1.0\n(>1 = plus rapide, '
+                         '<1 = plus lent ; barres d\'erreur = IC bootstrap à 95 %, ~ = IC contient 1)',
+        'speedup_ok': "Accélération relative",
+        'tail_ylabel': '{label} p99 (ms) - Échelle log',
+        'tail_title': 'Temps de {label} p99 par requête (latence de queue)',
+        'tail_ok': "{label} p99",
+        'tail_header': "LATENCE DE QUEUE P99 (moyenne sur les requêtes)",
+        'summary_header': "RÉSUMÉ DES STATISTIQUES DES BENCHMARKS",
+        'summary_metric': "Temps de {label} (ms):",
+        'summary_average': "moyenne",
+        'summary_fastest': "Plus rapide",
+        'summary_slowest': "Plus lent",
+        'summary_ratio': "Ratio de vitesse: {ratio:.2f}x plus lent",
+        'slowest_header': "REQUÊTES LES PLUS LENTES (Temps de traitement serveur)",
+    },
+}
+
+# Shared grouped-bar layout
+x = np.arange(len(REQUESTS))
+width = 0.2
+
+
+def bar_offset(i, count):
+    """Offset of the i-th of count bars centred on each request tick"""
+    return (i - (count - 1) / 2) * width
+
+
+@functools.lru_cache(maxsize=None)
+def speedup_table():
+    """Server-time speedup of every engine relative to Web 1.0 (computed once)"""
+    server_pivot = results.pivot('server_ms').reindex(REQUESTS)
+    # Speedup = baseline / method (>1 means faster than baseline, <1 means slower)
+    return server_pivot.rdiv(server_pivot['Web 1.0'], axis=0)
+
+
+@functools.lru_cache(maxsize=None)
+def mean_draws(metric):
+    """Bootstrap draws of every cell mean, aligned with results.pivot(metric) (computed once)"""
+    return cell_draws(results, metric)
+
+
+@functools.lru_cache(maxsize=None)
+def speedup_interval():
+    """(low, high) 95% bootstrap interval of every speedup, laid out like speedup_table()"""
+    server_pivot = results.pivot('server_ms')
+    draws = mean_draws('server_ms')
+    baseline = list(server_pivot.columns).index('Web 1.0')
+    return tuple(pd.DataFrame(bound, index=server_pivot.index, columns=server_pivot.columns).reindex(REQUESTS)
+                 for bound in percentile_interval(draws[:, [baseline], :] / draws))
+
+
+def average_interval(metric):
+    """(low, high) 95% bootstrap interval of each engine's average over requests"""
+    columns = results.pivot(metric).columns
+    low, high = percentile_interval(np.nanmean(mean_draws(metric), axis=0))
+    return pd.Series(low, index=columns), pd.Series(high, index=columns)
+
+
+def ci_inputs():
+    """Cache inputs of the bootstrap intervals: summary stdevs and raw sample files"""
+    return [results.pivot(m, 'stdev_ms') for m in MEASURED_METRICS], file_signature([SAMPLES_FILE])
+
+
+def short_bar_label(height):
+    # Value labels only if < 50ms for readability
+    return f'{height:.1f}' if height < 50 else ''
+
+
+def request_bars(lang):
+    """Grouped-bar layout (one bar per engine per request) shared by charts 1, 2, 3 and 6"""
+    return grouped_bar_renderer(REQUESTS, REPORT_METHODS[lang], COLORS, width=width)
+
+
+def finish_request_axis(ax, text, ylabel, title, legend_loc='upper left'):
+    ax.set_xlabel(text['request'], fontsize=12, fontweight='bold')
+    ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(REQUESTS)
+    ax.legend(loc=legend_loc, fontsize=10)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+
+def save_chart(number, filename, ok, lang, fig=None):
+    output = localized_output(filename, lang)
+    if fig is None:
+        # pyplot figure: lay it out, save it and release it right away
+        fig = plt.gcf()
+        fig.tight_layout()
+        save_figure(output, fig)
+        plt.close(fig)
+    else:
+        save_figure(output, fig)
+    print(f"[OK] {TEXT[lang]['chart']} {number}: {output} ({ok})")
 
-print("="*80)
-print("GENERATING BENCHMARK COMPARISON CHARTS")
-print("="*80)
 
 # ============================================================================
 # CHART 1: Server-side processing time comparison (server_ms)
 # ============================================================================
-fig1, ax1 = plt.subplots(figsize=(14, 7))
+@chart_inputs(data=lambda: results.pivot('server_ms'), colors=COLORS, requests=REQUESTS,
+              methods=REPORT_METHODS, text=TEXT)
+def chart_server_time(lang='en'):
+    text = TEXT[lang]
+    # Log scale because R9 is much slower
+    fig1 = request_bars(lang).render(results.pivot('server_ms'), text['request'],
+                                     text['server_ylabel'], text['server_title'],
+                                     log=True, label=short_bar_label)
 
-server_data = df[df['metric'] == 'server_ms']
-pivot_server = server_data.pivot(index='question', columns='method', values='mean_ms')
-pivot_server = pivot_server.reindex(REQUESTS)
+    save_chart(1, 'benchmark_server_time.png', text['server_ok'], lang, fig1)
 
-x = np.arange(len(REQUESTS))
-width = 0.2
-
-for i, method in enumerate(['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']):
-    if method in pivot_server.columns:
-        offset = (i - 1.5) * width
-        bars = ax1.bar(x + offset, pivot_server[method], width, 
-                      label=method, color=COLORS[method], alpha=0.85)
-        
-        # Add value labels on bars (only if < 50ms for readability)
-        for bar in bars:
-            height = bar.get_height()
-            if height < 50:
-                ax1.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}',
-                        ha='center', va='bottom', fontsize=7, rotation=0)
-
-ax1.set_xlabel('Request', fontsize=12, fontweight='bold')
-ax1.set_ylabel('Server Processing Time (ms)', fontsize=12, fontweight='bold')
-ax1.set_title('Server-Side Processing Time Comparison by Request', 
-             fontsize=14, fontweight='bold', pad=20)
-ax1.set_xticks(x)
-ax1.set_xticklabels(REQUESTS)
-ax1.legend(loc='upper left', fontsize=10)
-ax1.grid(axis='y', alpha=0.3, linestyle='--')
-ax1.set_yscale('log')  # Log scale because R9 is much slower
-ax1.set_ylabel('Server Processing Time (ms) - Log Scale', fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('benchmark_server_time.png', dpi=300, bbox_inches='tight')
-print("[OK] Chart 1: benchmark_server_time.png (Server-side processing)")
 
 # ============================================================================
 # CHART 2: Client-side round-trip time comparison (client_ms)
 # ============================================================================
-fig2, ax2 = plt.subplots(figsize=(14, 7))
-
-client_data = df[df['metric'] == 'client_ms']
-pivot_client = client_data.pivot(index='question', columns='method', values='mean_ms')
-pivot_client = pivot_client.reindex(REQUESTS)
-
-for i, method in enumerate(['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']):
-    if method in pivot_client.columns:
-        offset = (i - 1.5) * width
-        bars = ax2.bar(x + offset, pivot_client[method], width,
-                      label=method, color=COLORS[method], alpha=0.85)
-        
-        for bar in bars:
-            height = bar.get_height()
-            if height < 50:
-                ax2.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}',
-                        ha='center', va='bottom', fontsize=7)
-
-ax2.set_xlabel('Request', fontsize=12, fontweight='bold')
-ax2.set_ylabel('Client Round-Trip Time (ms) - Log Scale', fontsize=12, fontweight='bold')
-ax2.set_title('Client-Side Round-Trip Time Comparison by Request',
-             fontsize=14, fontweight='bold', pad=20)
-ax2.set_xticks(x)
-ax2.set_xticklabels(REQUESTS)
-ax2.legend(loc='upper left', fontsize=10)
-ax2.grid(axis='y', alpha=0.3, linestyle='--')
-ax2.set_yscale('log')
-
-plt.tight_layout()
-plt.savefig('benchmark_client_time.png', dpi=300, bbox_inches='tight')
-print("[OK] Chart 2: benchmark_client_time.png (Client round-trip)")
+@chart_inputs(data=lambda: results.pivot('client_ms'), colors=COLORS, requests=REQUESTS,
+              methods=REPORT_METHODS, text=TEXT)
+def chart_client_time(lang='en'):
+    text = TEXT[lang]
+    fig2 = request_bars(lang).render(results.pivot('client_ms'), text['request'],
+                                     text['client_ylabel'], text['client_title'],
+                                     log=True, label=short_bar_label)
+
+    save_chart(2, 'benchmark_client_time.png', text['client_ok'], lang, fig2)
+
 
 # ============================================================================
 # CHART 3: Browser render time comparison (render_ms)
 # ============================================================================
-fig3, ax3 = plt.subplots(figsize=(14, 7))
-
-render_data = df[df['metric'] == 'render_ms']
-pivot_render = render_data.pivot(index='question', columns='method', values='mean_ms')
-pivot_render = pivot_render.reindex(REQUESTS)
-
-for i, method in enumerate(['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']):
-    if method in pivot_render.columns:
-        offset = (i - 1.5) * width
-        bars = ax3.bar(x + offset, pivot_render[method], width,
-                      label=method, color=COLORS[method], alpha=0.85)
-
-ax3.set_xlabel('Request', fontsize=12, fontweight='bold')
-ax3.set_ylabel('Browser Render Time (ms)', fontsize=12, fontweight='bold')
-ax3.set_title('Browser Render Time Comparison by Request',
-             fontsize=14, fontweight='bold', pad=20)
-ax3.set_xticks(x)
-ax3.set_xticklabels(REQUESTS)
-ax3.legend(loc='upper left', fontsize=10)
-ax3.grid(axis='y', alpha=0.3, linestyle='--')
-
-plt.tight_layout()
-plt.savefig('benchmark_render_time.png', dpi=300, bbox_inches='tight')
-print("[OK] Chart 3: benchmark_render_time.png (Browser render)")
+@chart_inputs(data=lambda: results.pivot('render_ms'), colors=COLORS, requests=REQUESTS,
+              methods=REPORT_METHODS, text=TEXT)
+def chart_render_time(lang='en'):
+    text = TEXT[lang]
+    fig3 = request_bars(lang).render(results.pivot('render_ms'), text['request'],
+                                     text['render_ylabel'], text['render_title'])
+
+    save_chart(3, 'benchmark_render_time.png', text['render_ok'], lang, fig3)
+
 
 # ============================================================================
 # CHART 4: Average performance across all requests
 # ============================================================================
-fig4, (ax4a, ax4b, ax4c) = plt.subplots(1, 3, figsize=(18, 6))
-
-# Calculate averages for each metric
-metrics = ['server_ms', 'client_ms', 'render_ms']
-metric_labels = ['Server Processing', 'Client Round-Trip', 'Browser Render']
-axes = [ax4a, ax4b, ax4c]
-
-for idx, (metric, label, ax) in enumerate(zip(metrics, metric_labels, axes)):
-    metric_data = df[df['metric'] == metric]
-    avg_by_method = metric_data.groupby('method')['mean_ms'].mean()
-    
-    methods = ['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']
-    values = [avg_by_method.get(m, 0) for m in methods]
-    colors_list = [COLORS[m] for m in methods]
-    
-    bars = ax.bar(range(len(methods)), values, color=colors_list, alpha=0.85)
-    
-    # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{height:.1f}',
-               ha='center', va='bottom', fontsize=11, fontweight='bold')
-    
-    ax.set_ylabel('Average Time (ms)', fontsize=11, fontweight='bold')
-    ax.set_title(f'{label}\nAverage Time', fontsize=12, fontweight='bold')
-    ax.set_xticks(range(len(methods)))
-    ax.set_xticklabels(methods, rotation=15, ha='right')
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
+@chart_inputs(data=lambda: [results.pivot(m) for m in MEASURED_METRICS], ci=ci_inputs, colors=COLORS,
+              methods=REPORT_METHODS, text=TEXT)
+def chart_averages(lang='en'):
+    text = TEXT[lang]
+    methods = REPORT_METHODS[lang]
+    fig4, axes = plt.subplots(1, len(MEASURED_METRICS), figsize=(6 * len(MEASURED_METRICS), 6),
+                              squeeze=False)
+
+    for metric, ax in zip(MEASURED_METRICS, axes[0]):
+        label = text['metric_labels'][METRICS.index(metric)]
+        avg_by_method = results.method_average(metric)
+        low, high = average_interval(metric)
+
+        values = np.array([avg_by_method.get(m, 0) for m in methods])
+        tops = np.array([high.get(m, v) for m, v in zip(methods, values)])
+        bottoms = np.array([low.get(m, v) for m, v in zip(methods, values)])
+        colors_list = [COLORS[m] for m in methods]
+
+        bars = ax.bar(range(len(methods)), values, color=colors_list, alpha=0.85,
+                      yerr=np.clip([values - bottoms, tops - values], 0, None), capsize=4,
+                      error_kw={'elinewidth': 1, 'ecolor': 'black'})
+
+        # Add value labels above the error bars
+        for bar, top in zip(bars, tops):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., top,
+                   f'{height:.1f}',
+                   ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+        ax.set_ylabel(text['average_ylabel'], fontsize=11, fontweight='bold')
+        ax.set_title(f"{label}\n{text['average_subtitle']}", fontsize=12, fontweight='bold')
+        ax.set_xticks(range(len(methods)))
+        ax.set_xticklabels(methods, rotation=15, ha='right')
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+    plt.suptitle(text['average_title'], fontsize=14, fontweight='bold', y=1.02)
+    save_chart(4, 'benchmark_averages.png', text['average_ok'], lang)
 
-plt.suptitle('Average Execution Time by Metric and Engine', 
-            fontsize=14, fontweight='bold', y=1.02)
-plt.tight_layout()
-plt.savefig('benchmark_averages.png', dpi=300, bbox_inches='tight')
-print("[OK] Chart 4: benchmark_averages.png (Overall averages)")
 
 # ============================================================================
 # CHART 5: Heatmap of server processing times
 # ============================================================================
-fig5, ax5 = plt.subplots(figsize=(12, 8))
-
-server_data = df[df['metric'] == 'server_ms']
-heatmap_data = server_data.pivot(index='question', columns='method', values='mean_ms')
-heatmap_data = heatmap_data.reindex(REQUESTS)
-heatmap_data = heatmap_data[['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']]
+@chart_inputs(data=lambda: results.pivot('server_ms'), requests=REQUESTS,
+              methods=REPORT_METHODS, text=TEXT)
+def chart_heatmap(lang='en'):
+    text = TEXT[lang]
+    heatmap_data = results.pivot('server_ms').reindex(REQUESTS)[REPORT_METHODS[lang]]
 
-# Use log scale for better visualization due to large range
-heatmap_data_log = np.log10(heatmap_data + 1)
+    # Use log scale for better visualization due to large range
+    heatmap_data_log = np.log10(heatmap_data + 1)
 
-sns.heatmap(heatmap_data_log, annot=heatmap_data, fmt='.1f', cmap='YlOrRd',
-           cbar_kws={'label': 'Log10(Processing Time + 1)'}, ax=ax5,
-           linewidths=0.5, linecolor='gray')
+    fig5 = heatmap_renderer(REQUESTS, REPORT_METHODS[lang]).render(
+        heatmap_data_log, text['heatmap_title'], text['engine'], text['request'],
+        text['heatmap_cbar'], annot=heatmap_data)
 
-ax5.set_title('Server Processing Time Heatmap (ms)\nLog scale coloring, actual values shown',
-             fontsize=14, fontweight='bold', pad=20)
-ax5.set_xlabel('Engine', fontsize=12, fontweight='bold')
-ax5.set_ylabel('Request', fontsize=12, fontweight='bold')
+    save_chart(5, 'benchmark_heatmap.png', text['heatmap_ok'], lang, fig5)
 
-plt.tight_layout()
-plt.savefig('benchmark_heatmap.png', dpi=300, bbox_inches='tight')
-print("[OK] Chart 5: benchmark_heatmap.png (Performance heatmap)")
 
 # ============================================================================
 # CHART 6: Performance variability (standard deviation)
 # ============================================================================
-fig6, ax6 = plt.subplots(figsize=(14, 7))
-
-server_stdev = df[df['metric'] == 'server_ms']
-pivot_stdev = server_stdev.pivot(index='question', columns='method', values='stdev_ms')
-pivot_stdev = pivot_stdev.reindex(REQUESTS)
-
-for i, method in enumerate(['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']):
-    if method in pivot_stdev.columns:
-        offset = (i - 1.5) * width
-        ax6.bar(x + offset, pivot_stdev[method], width,
-               label=method, color=COLORS[method], alpha=0.85)
-
-ax6.set_xlabel('Request', fontsize=12, fontweight='bold')
-ax6.set_ylabel('Standard Deviation (ms)', fontsize=12, fontweight='bold')
-ax6.set_title('Performance Consistency (Standard Deviation of Server Time)',
-             fontsize=14, fontweight='bold', pad=20)
-ax6.set_xticks(x)
-ax6.set_xticklabels(REQUESTS)
-ax6.legend(loc='upper left', fontsize=10)
-ax6.grid(axis='y', alpha=0.3, linestyle='--')
-
-plt.tight_layout()
-plt.savefig('benchmark_variability.png', dpi=300, bbox_inches='tight')
-print("[OK] Chart 6: benchmark_variability.png (Performance consistency)")
+@chart_inputs(data=lambda: results.pivot('server_ms', 'stdev_ms'), colors=COLORS,
+              requests=REQUESTS, methods=REPORT_METHODS, text=TEXT)
+def chart_variability(lang='en'):
+    text = TEXT[lang]
+    fig6 = request_bars(lang).render(results.pivot('server_ms', 'stdev_ms'), text['request'],
+                                     text['stdev_ylabel'], text['stdev_title'])
+
+    save_chart(6, 'benchmark_variability.png', text['stdev_ok'], lang, fig6)
+
 
 # ============================================================================
 # CHART 7: Speedup comparison (relative to Web 1.0 baseline)
 # ============================================================================
-fig7, ax7 = plt.subplots(figsize=(14, 7))
-
-server_pivot = df[df['metric'] == 'server_ms'].pivot(
-    index='question', columns='method', values='mean_ms'
-).reindex(REQUESTS)
-
-# Calculate speedup relative to Web 1.0
-speedup_data = {}
-for method in ['RDFa', 'Knowledge Graph', 'SPARQL Endpoint']:
-    if method in server_pivot.columns:
-        # Speedup = baseline / method (>1 means faster than baseline, <1 means slower)
-        speedup_data[method] = server_pivot['Web 1.0'] / server_pivot[method]
-
-speedup_df = pd.DataFrame(speedup_data, index=REQUESTS)
-
-for i, method in enumerate(['RDFa', 'Knowledge Graph', 'SPARQL Endpoint']):
-    if method in speedup_df.columns:
-        offset = (i - 1) * width
-        bars = ax7.bar(x + offset, speedup_df[method], width,
-                      label=method, color=COLORS[method], alpha=0.85)
-        
-        # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax7.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}x',
-                    ha='center', va='bottom' if height > 1 else 'top', 
-                    fontsize=8)
-
-# Add horizontal line at y=1 (baseline)
-ax7.axhline(y=1, color='red', linestyle='--', linewidth=2, 
-           label='Web 1.0 Baseline', alpha=0.7)
-
-ax7.set_xlabel('Request', fontsize=12, fontweight='bold')
-ax7.set_ylabel('Speedup Factor (relative to Web 1.0)', fontsize=12, fontweight='bold')
-ax7.set_title('Performance Speedup Relative to Web 1.0 Baseline\n(>1 = faster, <1 = slower)',
-             fontsize=14, fontweight='bold', pad=20)
-ax7.set_xticks(x)
-ax7.set_xticklabels(REQUESTS)
-ax7.legend(loc='upper right', fontsize=10)
-ax7.grid(axis='y', alpha=0.3, linestyle='--')
-ax7.set_yscale('log')
-ax7.set_ylabel('Speedup Factor (log scale)', fontsize=12, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('benchmark_speedup.png', dpi=300, bbox_inches='tight')
-print("[OK] Chart 7: benchmark_speedup.png (Relative speedup)")
+@chart_inputs(data=lambda: results.pivot('server_ms'), ci=ci_inputs, colors=COLORS,
+              requests=REQUESTS, methods=REPORT_METHODS, text=TEXT)
+def chart_speedup(lang='en'):
+    text = TEXT[lang]
+    fig7, ax7 = plt.subplots(figsize=(14, 7))
+
+    speedup_df = speedup_table()
+    low_df, high_df = speedup_interval()
+    methods = [m for m in REPORT_METHODS[lang] if m != 'Web 1.0']
+
+    for i, method in enumerate(methods):
+        if method in speedup_df.columns:
+            speedup, low, high = speedup_df[method], low_df[method], high_df[method]
+            bars = ax7.bar(x + bar_offset(i, len(methods)), speedup, width,
+                          label=method, color=COLORS[method], alpha=0.85,
+                          yerr=np.clip([speedup - low, high - speedup], 0, None), capsize=2,
+                          error_kw={'elinewidth': 0.8, 'ecolor': 'black'})
+
+            # Add value labels past the error bar; ~ marks a CI that includes 1 (no clear difference)
+            for bar, bottom, top in zip(bars, low, high):
+                height = bar.get_height()
+                marker = '~' if bottom <= 1 <= top else ''
+                ax7.text(bar.get_x() + bar.get_width()/2., top if height > 1 else bottom,
+                        f'{marker}{height:.2f}x',
+                        ha='center', va='bottom' if height > 1 else 'top',
+                        fontsize=8)
+
+    # Add horizontal line at y=1 (baseline)
+    ax7.axhline(y=1, color='red', linestyle='--', linewidth=2,
+               label=text['speedup_baseline'], alpha=0.7)
+
+    finish_request_axis(ax7, text, text['speedup_ylabel'], text['speedup_title'],
+                        legend_loc='upper right')
+    ax7.set_yscale('log')
+
+    save_chart(7, 'benchmark_speedup.png', text['speedup_ok'], lang)
+
+
+# ============================================================================
+# CHARTS 8-10: Tail latency (p99) of each metric, when the results have percentiles
+# ============================================================================
+@chart_inputs(data=lambda: [results.pivot(m, TAIL_STAT) for m in MEASURED_METRICS], colors=COLORS,
+              requests=REQUESTS, methods=REPORT_METHODS, text=TEXT)
+def chart_tail_latency(metric='server_ms', lang='en'):
+    text = TEXT[lang]
+    label = text['metric_labels'][METRICS.index(metric)]
+    title_label = label if lang == 'en' else label.lower()
+
+    fig = request_bars(lang).render(results.pivot(metric, TAIL_STAT), text['request'],
+                                    text['tail_ylabel'].format(label=label),
+                                    text['tail_title'].format(label=title_label),
+                                    log=True, label=short_bar_label)
+
+    save_chart(8 + METRICS.index(metric), f"benchmark_{metric.replace('_ms', '')}_time_p99.png",
+               text['tail_ok'].format(label=label), lang, fig)
+
 
 # ============================================================================
 # STATISTICS SUMMARY
 # ============================================================================
-print("\n" + "="*80)
-print("BENCHMARK STATISTICS SUMMARY")
-print("="*80)
-
-for metric, label in [('server_ms', 'Server Processing'), 
-                      ('client_ms', 'Client Round-Trip'),
-                      ('render_ms', 'Browser Render')]:
-    print(f"\n{label} Time (ms):")
-    print("-" * 80)
-    
-    metric_data = df[df['metric'] == metric]
-    avg_by_method = metric_data.groupby('method')['mean_ms'].mean().sort_values()
-    
-    for method, avg_time in avg_by_method.items():
-        print(f"  {method:20s}: {avg_time:8.2f} ms (average)")
-    
-    fastest = avg_by_method.index[0]
-    slowest = avg_by_method.index[-1]
-    ratio = avg_by_method[slowest] / avg_by_method[fastest]
-    
-    print(f"\n  Fastest: {fastest} ({avg_by_method[fastest]:.2f} ms)")
-    print(f"  Slowest: {slowest} ({avg_by_method[slowest]:.2f} ms)")
-    print(f"  Speed ratio: {ratio:.2f}x slower")
-
-# Most problematic requests
-print("\n" + "="*80)
-print("SLOWEST REQUESTS (Server Processing Time)")
-print("="*80)
-
-server_data = df[df['metric'] == 'server_ms']
-for method in ['Web 1.0', 'RDFa', 'Knowledge Graph', 'SPARQL Endpoint']:
-    method_data = server_data[server_data['method'] == method]
-    slowest_3 = method_data.nlargest(3, 'mean_ms')[['question', 'mean_ms']]
-    
-    print(f"\n{method}:")
-    for _, row in slowest_3.iterrows():
-        print(f"  {row['question']}: {row['mean_ms']:.2f} ms")
-
-print("\n" + "="*80)
-print("All charts generated successfully!")
-print("="*80)
+def print_summary(lang='en'):
+    text = TEXT[lang]
+    methods = REPORT_METHODS[lang]
+
+    print("\n" + "="*80)
+    print(text['summary_header'])
+    print("="*80)
+
+    for metric in MEASURED_METRICS:
+        label = text['metric_labels'][METRICS.index(metric)]
+        print("\n" + text['summary_metric'].format(label=label))
+        print("-" * 80)
+
+        avg_by_method = results.method_average(metric).sort_values()
+
+        for method, avg_time in avg_by_method.items():
+            print(f"  {method:20s}: {avg_time:8.2f} ms ({text['summary_average']})")
+
+        fastest = avg_by_method.index[0]
+        slowest = avg_by_method.index[-1]
+        ratio = avg_by_method[slowest] / avg_by_method[fastest]
+
+        print(f"\n  {text['summary_fastest']}: {fastest} ({avg_by_method[fastest]:.2f} ms)")
+        print(f"  {text['summary_slowest']}: {slowest} ({avg_by_method[slowest]:.2f} ms)")
+        print("  " + text['summary_ratio'].format(ratio=ratio))
+
+    # Most problematic requests
+    print("\n" + "="*80)
+    print(text['slowest_header'])
+    print("="*80)
+
+    server_pivot = results.pivot('server_ms')
+    for method in methods:
+        slowest_3 = server_pivot[method].nlargest(3)
+
+        print(f"\n{method}:")
+        for question, mean_ms in slowest_3.items():
+            print(f"  {question}: {mean_ms:.2f} ms")
+
+    if TAIL_STAT in results.statistics:
+        print("\n" + "="*80)
+        print(text['tail_header'])
+        print("="*80)
+        for metric in MEASURED_METRICS:
+            label = text['metric_labels'][METRICS.index(metric)]
+            p99 = results.method_average(metric, TAIL_STAT)
+            mean = results.method_average(metric)
+            print(f"\n{label}:")
+            for method in methods:
+                print(f"  {method:20s}: p99 {p99[method]:8.2f} ms (mean {mean[method]:8.2f} ms)")
+
+
+REPORT_CHARTS = {
+    'benchmark_server_time.png': chart_server_time,
+    'benchmark_averages.png': chart_averages,
+    'benchmark_heatmap.png': chart_heatmap,
+    'benchmark_variability.png': chart_variability,
+    'benchmark_speedup.png': chart_speedup,
+}
+# Client and render charts only when those metrics were measured
+if 'client_ms' in MEASURED_METRICS:
+    REPORT_CHARTS['benchmark_client_time.png'] = chart_client_time
+if 'render_ms' in MEASURED_METRICS:
+    REPORT_CHARTS['benchmark_render_time.png'] = chart_render_time
+# Tail-latency charts need the percentile columns of sample-based results
+if TAIL_STAT in results.statistics:
+    for metric in MEASURED_METRICS:
+        REPORT_CHARTS[f"benchmark_{metric.replace('_ms', '')}_time_p99.png"] = \
+            functools.partial(chart_tail_latency, metric=metric)
+
+CHARTS = localized_charts(REPORT_CHARTS)
+
+
+def main(languages):
+    for lang in languages:
+        text = TEXT[lang]
+        print("="*80)
+        print(text['header'])
+        print("="*80)
+
+        for output, render in CHARTS.items():
+            if render.keywords['lang'] == lang:
+                render()
+
+        release_renderers()
+        print_summary(lang)
+
+        print("\n" + "="*80)
+        print(text['done'])
+        print("="*80)
+
+
+if __name__ == '__main__':
+    # python generate_benchmark_charts_full.py [en] [fr]
+    main(parse_languages(sys.argv[1:]))
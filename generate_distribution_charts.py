@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generate latency distribution charts from raw per-iteration samples
+ECDF, violin and HDR percentile-spectrum plots per request and engine, drawn
+from pre-binned log histograms (quantile_sketch.LogHistogram), so millions of
+samples per cell cost no more to plot than a hundred
+
+    python generate_distribution_charts.py [samples files...]
+"""
+import functools
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from chart_cache import chart_inputs
+from render_profile import save_figure
+from sample_ingest import METRICS, SAMPLES_FILE, file_signature, ingest
+
+# Raw sample files (.samples or .jsonl); override on the command line
+SAMPLE_FILES = [SAMPLES_FILE]
+
+COLORS = {
+    'Web 1.0': '#FF6B6B',
+    'RDFa': '#4ECDC4',
+    'Knowledge Graph': '#95E1D3',
+    'SPARQL Endpoint': '#45B7D1'
+}
+
+METRIC_LABELS = {'server_ms': 'Server Processing', 'client_ms': 'Client Round-Trip',
+                 'render_ms': 'Browser Render'}
+
+# HDR percentile spectrum: x = 1 / (1 - q), from the minimum to p99.99
+SPECTRUM_X = np.logspace(0, 4, 241)
+SPECTRUM_TICKS = {1: '0%', 2: '50%', 10: '90%', 100: '99%', 1000: '99.9%', 10000: '99.99%'}
+
+VIOLIN_BINS = 120
+
+
+def sample_signature():
+    return file_signature(SAMPLE_FILES)
+
+
+@functools.lru_cache(maxsize=None)
+def _load(paths):
+    aggregator = ingest(list(paths))
+    sketches = dict(zip(aggregator.keys, aggregator.sketches))
+    requests = list(dict.fromkeys(q for q, _, _ in aggregator.keys))
+    methods = list(dict.fromkeys(m for _, m, _ in aggregator.keys))
+    return sketches, requests, methods
+
+
+def load_sketches():
+    """{(question, method, metric): LogHistogram}, requests and methods (one streaming pass)"""
+    return _load(tuple(path for path in SAMPLE_FILES if os.path.exists(path)))
+
+
+def sampled_metrics():
+    """METRICS with raw samples, in METRICS order (runner samples may be server_ms only)"""
+    present = {metric for _, _, metric in load_sketches()[0]}
+    return [metric for metric in METRICS if metric in present]
+
+
+def request_grid(requests, title):
+    """One subplot per request (2 rows), shared figure title"""
+    columns = (len(requests) + 1) // 2
+    fig, axes = plt.subplots(2, columns, figsize=(4.4 * columns, 9), squeeze=False)
+    axes = axes.ravel()
+    for ax in axes[len(requests):]:
+        ax.set_visible(False)
+    fig.suptitle(title, fontsize=14, fontweight='bold')
+    return fig, axes
+
+
+def engine_legend(fig, methods):
+    handles = [plt.Rectangle((0, 0), 1, 1, color=COLORS.get(m, 'gray'), alpha=0.85) for m in methods]
+    fig.legend(handles, methods, loc='lower center', ncol=len(methods), fontsize=10)
+
+
+# ============================================================================
+# CHART 1: Empirical CDF per request
+# ============================================================================
+@chart_inputs(samples=sample_signature, colors=COLORS)
+def chart_ecdf(metric='server_ms'):
+    sketches, requests, methods = load_sketches()
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time ECDF by Request\n'
+                                       'Steps and plateaus reveal bimodality, the top tail shows spikes')
+
+    for ax, req in zip(axes, requests):
+        for method in methods:
+            sketch = sketches.get((req, method, metric))
+            if sketch is None:
+                continue
+            values, cumulative = sketch.cdf()
+            ax.step(values, cumulative, where='post', color=COLORS.get(method, 'gray'),
+                    linewidth=1.5, alpha=0.9)
+        ax.axhline(y=0.99, color='gray', linestyle=':', linewidth=1)
+        ax.set_xscale('log')
+        ax.set_ylim(0, 1.01)
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.set_xlabel('Time (ms) - Log Scale', fontsize=9)
+        ax.grid(alpha=0.3, linestyle='--')
+    axes[0].set_ylabel('Fraction of iterations', fontsize=10, fontweight='bold')
+
+    engine_legend(fig, methods)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure(f"distribution_ecdf_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 1: distribution_ecdf_{metric.replace('_ms', '')}.png")
+
+
+# ============================================================================
+# CHART 2: Violin plots (log-binned densities) per request
+# ============================================================================
+@chart_inputs(samples=sample_signature, colors=COLORS)
+def chart_violin(metric='server_ms'):
+    sketches, requests, methods = load_sketches()
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time Distribution by Request\n'
+                                       'Violin width = share of iterations, bars = median and p99')
+
+    for ax, req in zip(axes, requests):
+        cells = [(i, m, sketches[(req, m, metric)]) for i, m in enumerate(methods)
+                 if (req, m, metric) in sketches]
+        if not cells:
+            continue
+        low = min(s.quantile(0) for _, _, s in cells)
+        high = max(s.quantile(1) for _, _, s in cells)
+        edges = np.geomspace(low, high * 1.0001, VIOLIN_BINS + 1)
+        centers = np.sqrt(edges[:-1] * edges[1:])
+
+        for i, method, sketch in cells:
+            density = sketch.density(edges)
+            half_width = 0.4 * density / density.max()
+            color = COLORS.get(method, 'gray')
+            ax.fill_betweenx(centers, i - half_width, i + half_width, color=color,
+                             alpha=0.75, linewidth=0)
+            median, p99 = sketch.quantiles([0.5, 0.99])
+            ax.hlines(median, i - 0.3, i + 0.3, color='black', linewidth=1.5)
+            ax.hlines(p99, i - 0.2, i + 0.2, color='black', linewidth=1, linestyle='--')
+
+        ax.set_yscale('log')
+        ax.set_xticks(range(len(methods)))
+        ax.set_xticklabels([m.replace(' ', '\n') for m in methods], fontsize=8)
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+    axes[0].set_ylabel('Time (ms) - Log Scale', fontsize=10, fontweight='bold')
+
+    engine_legend(fig, methods)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure(f"distribution_violin_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 2: distribution_violin_{metric.replace('_ms', '')}.png")
+
+
+# ============================================================================
+# CHART 3: HDR percentile spectrum per request
+# ============================================================================
+@chart_inputs(samples=sample_signature, colors=COLORS)
+def chart_percentile_spectrum(metric='server_ms'):
+    sketches, requests, methods = load_sketches()
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time Percentile Spectrum by Request\n'
+                                       'Latency at each percentile, up to p99.99')
+
+    quantiles = 1 - 1 / SPECTRUM_X
+    for ax, req in zip(axes, requests):
+        for method in methods:
+            sketch = sketches.get((req, method, metric))
+            if sketch is None:
+                continue
+            ax.plot(SPECTRUM_X, sketch.quantiles(quantiles), color=COLORS.get(method, 'gray'),
+                    linewidth=1.5, alpha=0.9)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xticks(list(SPECTRUM_TICKS))
+        ax.set_xticklabels(list(SPECTRUM_TICKS.values()), fontsize=8)
+        ax.minorticks_off()
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.set_xlabel('Percentile', fontsize=9)
+        ax.grid(alpha=0.3, linestyle='--')
+    axes[0].set_ylabel('Time (ms) - Log Scale', fontsize=10, fontweight='bold')
+
+    engine_legend(fig, methods)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure(f"distribution_spectrum_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 3: distribution_spectrum_{metric.replace('_ms', '')}.png")
+
+
+# ============================================================================
+# STATISTICS SUMMARY
+# ============================================================================
+def print_summary():
+    sketches, requests, methods = load_sketches()
+
+    print("\n" + "="*80)
+    print("TAIL SHAPE (p99 / median, server processing)")
+    print("="*80)
+    print(f"{'Request':<8}" + ''.join(f"{m:>18s}" for m in methods))
+    for req in requests:
+        cells = []
+        for method in methods:
+            sketch = sketches.get((req, method, 'server_ms'))
+            cells.append(f"{sketch.quantile(0.99) / sketch.median():17.2f}x" if sketch else f"{'-':>18s}")
+        print(f"{req:<8}" + ''.join(cells))
+
+
+def distribution_charts():
+    """Three charts per sampled metric, or none when there are no raw samples"""
+    charts = {}
+    if sample_signature():
+        for metric in sampled_metrics():
+            name = metric.replace('_ms', '')
+            charts[f'distribution_ecdf_{name}.png'] = functools.partial(chart_ecdf, metric=metric)
+            charts[f'distribution_violin_{name}.png'] = functools.partial(chart_violin, metric=metric)
+            charts[f'distribution_spectrum_{name}.png'] = functools.partial(
+                chart_percentile_spectrum, metric=metric)
+    return charts
+
+
+CHARTS = distribution_charts()
+
+
+def main(paths):
+    if paths:
+        SAMPLE_FILES[:] = paths
+    if not sample_signature():
+        print(f"No raw samples found ({', '.join(SAMPLE_FILES)}): run the benchmarks with "
+              "sample output or pass sample files on the command line")
+        return 1
+
+    print("="*80)
+    print("GENERATING LATENCY DISTRIBUTION CHARTS")
+    print("="*80)
+
+    for render in distribution_charts().values():
+        render()
+
+    print_summary()
+
+    print("\n" + "="*80)
+    print("All distribution charts generated successfully!")
+    print("="*80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -10,6 +10,10 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
+from benchmark_data import load_results
+from chart_cache import chart_inputs
+from render_profile import save_figure
+
 # LOC data from function_comparison_metrics.md
 loc_data = {
     'R1': {'Web 1.0': 14, 'RDFa': 22, 'SPARQL': 23},
@@ -25,11 +29,9 @@ loc_data = {
 }
 
 # Performance data from benchmark_results.csv
-df = pd.read_csv('benchmark_results.csv', sep=';')
-server_data = df[df['metric'] == 'server_ms']
-
 # Map SPARQL Endpoint to SPARQL for consistency
-server_data['method'] = server_data['method'].replace({'SPARQL Endpoint': 'SPARQL'})
+results = load_results(rename={'SPARQL Endpoint': 'SPARQL'})
+server_avg = results.method_average('server_ms')
 
 # Prepare data for scatter plot
 requests = [f'R{i}' for i in range(1, 11)]
@@ -40,242 +42,260 @@ markers = {'Web 1.0': 'o', 'RDFa': 's', 'SPARQL': '^'}
 # ============================================================================
 # CHART: LOC vs Performance Trade-off
 # ============================================================================
-fig, ax = plt.subplots(figsize=(14, 10))
+@chart_inputs(loc_data=loc_data, data=lambda: results.pivot('server_ms'), colors=colors, markers=markers)
+def chart_tradeoff():
+    fig, ax = plt.subplots(figsize=(14, 10))
+
+    for method in methods:
+        locs = []
+        times = []
+        labels = []
+
+        for req in requests:
+            if req in loc_data and method in loc_data[req]:
+                loc = loc_data[req][method]
+                time = results.get(req, method, 'server_ms')
+                if time is not None:
+                    locs.append(loc)
+                    times.append(time)
+                    labels.append(req)
+
+        # Plot scatter
+        scatter = ax.scatter(locs, times, s=150, alpha=0.7, 
+                            color=colors[method], marker=markers[method],
+                            label=method, edgecolors='black', linewidth=1)
+
+        # Add labels for each point
+        for i, (loc, time, label) in enumerate(zip(locs, times, labels)):
+            # Offset labels to avoid overlap
+            offset_x = 0.5
+            offset_y = time * 0.05 if time > 10 else 0.2
+            ax.annotate(label, (loc, time), 
+                       xytext=(offset_x, offset_y), 
+                       textcoords='offset points',
+                       fontsize=8, ha='left',
+                       bbox=dict(boxstyle='round,pad=0.3', 
+                               facecolor=colors[method], alpha=0.3))
+
+    # Add trend lines
+    for method in methods:
+        locs = []
+        times = []
+
+        for req in requests:
+            if req in loc_data and method in loc_data[req]:
+                loc = loc_data[req][method]
+                time = results.get(req, method, 'server_ms')
+                if time is not None:
+                    locs.append(loc)
+                    times.append(time)
+
+        if len(locs) > 1:
+            # Fit polynomial (degree 1 = linear)
+            z = np.polyfit(locs, times, 1)
+            p = np.poly1d(z)
+            x_line = np.linspace(min(locs), max(locs), 100)
+            ax.plot(x_line, p(x_line), linestyle='--', alpha=0.5, 
+                   color=colors[method], linewidth=2)
+
+    ax.set_xlabel('Lines of Code (LOC)', fontsize=13, fontweight='bold')
+    ax.set_ylabel('Server Processing Time (ms)', fontsize=13, fontweight='bold')
+    ax.set_title('Code Complexity vs Performance Trade-off\nLOC vs Server Processing Time',
+                fontsize=15, fontweight='bold', pad=20)
+    ax.legend(loc='upper left', fontsize=12, framealpha=0.9)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    ax.set_yscale('log')
+    ax.set_ylabel('Server Processing Time (ms) - Log Scale', fontsize=13, fontweight='bold')
+
+    plt.tight_layout()
+    save_figure('loc_vs_performance_tradeoff.png')
+    print("[OK] LOC vs Performance trade-off chart saved")
 
-for method in methods:
-    locs = []
-    times = []
-    labels = []
-    
-    for req in requests:
-        if req in loc_data and method in loc_data[req]:
-            loc = loc_data[req][method]
-            perf_row = server_data[(server_data['question'] == req) & 
-                                   (server_data['method'] == method)]
-            if not perf_row.empty:
-                time = perf_row['mean_ms'].values[0]
-                locs.append(loc)
-                times.append(time)
-                labels.append(req)
-    
-    # Plot scatter
-    scatter = ax.scatter(locs, times, s=150, alpha=0.7, 
-                        color=colors[method], marker=markers[method],
-                        label=method, edgecolors='black', linewidth=1)
-    
-    # Add labels for each point
-    for i, (loc, time, label) in enumerate(zip(locs, times, labels)):
-        # Offset labels to avoid overlap
-        offset_x = 0.5
-        offset_y = time * 0.05 if time > 10 else 0.2
-        ax.annotate(label, (loc, time), 
-                   xytext=(offset_x, offset_y), 
-                   textcoords='offset points',
-                   fontsize=8, ha='left',
-                   bbox=dict(boxstyle='round,pad=0.3', 
-                           facecolor=colors[method], alpha=0.3))
-
-# Add trend lines
-for method in methods:
-    locs = []
-    times = []
-    
-    for req in requests:
-        if req in loc_data and method in loc_data[req]:
-            loc = loc_data[req][method]
-            perf_row = server_data[(server_data['question'] == req) & 
-                                   (server_data['method'] == method)]
-            if not perf_row.empty:
-                time = perf_row['mean_ms'].values[0]
-                locs.append(loc)
-                times.append(time)
-    
-    if len(locs) > 1:
-        # Fit polynomial (degree 1 = linear)
-        z = np.polyfit(locs, times, 1)
-        p = np.poly1d(z)
-        x_line = np.linspace(min(locs), max(locs), 100)
-        ax.plot(x_line, p(x_line), linestyle='--', alpha=0.5, 
-               color=colors[method], linewidth=2)
-
-ax.set_xlabel('Lines of Code (LOC)', fontsize=13, fontweight='bold')
-ax.set_ylabel('Server Processing Time (ms)', fontsize=13, fontweight='bold')
-ax.set_title('Code Complexity vs Performance Trade-off\nLOC vs Server Processing Time',
-            fontsize=15, fontweight='bold', pad=20)
-ax.legend(loc='upper left', fontsize=12, framealpha=0.9)
-ax.grid(True, alpha=0.3, linestyle='--')
-ax.set_yscale('log')
-ax.set_ylabel('Server Processing Time (ms) - Log Scale', fontsize=13, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('loc_vs_performance_tradeoff.png', dpi=300, bbox_inches='tight')
-print("[OK] LOC vs Performance trade-off chart saved")
 
 # ============================================================================
 # CHART 2: Efficiency Metric (ms per LOC)
 # ============================================================================
-fig2, ax2 = plt.subplots(figsize=(14, 8))
+@chart_inputs(loc_data=loc_data, data=lambda: results.pivot('server_ms'), colors=colors)
+def chart_efficiency():
+    fig2, ax2 = plt.subplots(figsize=(14, 8))
 
-efficiency_data = []
+    efficiency_data = []
+
+    for req in requests:
+        for method in methods:
+            if req in loc_data and method in loc_data[req]:
+                loc = loc_data[req][method]
+                time = results.get(req, method, 'server_ms')
+                if time is not None:
+                    efficiency = time / loc  # ms per line of code
+                    efficiency_data.append({
+                        'Request': req,
+                        'Method': method,
+                        'Efficiency': efficiency,
+                        'LOC': loc,
+                        'Time': time
+                    })
+
+    efficiency_df = pd.DataFrame(efficiency_data)
+
+    # Group by method and request
+    pivot_eff = efficiency_df.pivot(index='Request', columns='Method', values='Efficiency')
+    pivot_eff = pivot_eff.reindex(requests)
+
+    x = np.arange(len(requests))
+    width = 0.25
+
+    for i, method in enumerate(methods):
+        if method in pivot_eff.columns:
+            offset = (i - 1) * width
+            bars = ax2.bar(x + offset, pivot_eff[method], width,
+                          label=method, color=colors[method], alpha=0.85)
+
+    ax2.set_xlabel('Request', fontsize=12, fontweight='bold')
+    ax2.set_ylabel('Efficiency (ms per LOC)', fontsize=12, fontweight='bold')
+    ax2.set_title('Code Efficiency: Processing Time per Line of Code\nLower is Better',
+                 fontsize=14, fontweight='bold', pad=20)
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(requests)
+    ax2.legend(loc='upper left', fontsize=11)
+    ax2.grid(axis='y', alpha=0.3, linestyle='--')
+    ax2.set_yscale('log')
+
+    plt.tight_layout()
+    save_figure('code_efficiency_metric.png')
+    print("[OK] Code efficiency metric chart saved")
 
-for req in requests:
-    for method in methods:
-        if req in loc_data and method in loc_data[req]:
-            loc = loc_data[req][method]
-            perf_row = server_data[(server_data['question'] == req) & 
-                                   (server_data['method'] == method)]
-            if not perf_row.empty:
-                time = perf_row['mean_ms'].values[0]
-                efficiency = time / loc  # ms per line of code
-                efficiency_data.append({
-                    'Request': req,
-                    'Method': method,
-                    'Efficiency': efficiency,
-                    'LOC': loc,
-                    'Time': time
-                })
-
-efficiency_df = pd.DataFrame(efficiency_data)
-
-# Group by method and request
-pivot_eff = efficiency_df.pivot(index='Request', columns='Method', values='Efficiency')
-pivot_eff = pivot_eff.reindex(requests)
-
-x = np.arange(len(requests))
-width = 0.25
-
-for i, method in enumerate(methods):
-    if method in pivot_eff.columns:
-        offset = (i - 1) * width
-        bars = ax2.bar(x + offset, pivot_eff[method], width,
-                      label=method, color=colors[method], alpha=0.85)
-
-ax2.set_xlabel('Request', fontsize=12, fontweight='bold')
-ax2.set_ylabel('Efficiency (ms per LOC)', fontsize=12, fontweight='bold')
-ax2.set_title('Code Efficiency: Processing Time per Line of Code\nLower is Better',
-             fontsize=14, fontweight='bold', pad=20)
-ax2.set_xticks(x)
-ax2.set_xticklabels(requests)
-ax2.legend(loc='upper left', fontsize=11)
-ax2.grid(axis='y', alpha=0.3, linestyle='--')
-ax2.set_yscale('log')
-
-plt.tight_layout()
-plt.savefig('code_efficiency_metric.png', dpi=300, bbox_inches='tight')
-print("[OK] Code efficiency metric chart saved")
 
 # ============================================================================
 # CHART 3: Pareto Frontier Analysis
 # ============================================================================
-fig3, ax3 = plt.subplots(figsize=(14, 10))
-
-# Calculate average LOC and average time per method
-avg_stats = []
-for method in methods:
-    avg_loc = np.mean([loc_data[req][method] for req in requests if method in loc_data[req]])
-    method_perf = server_data[server_data['method'] == method]
-    avg_time = method_perf['mean_ms'].mean()
-    avg_stats.append({'Method': method, 'Avg LOC': avg_loc, 'Avg Time': avg_time})
-
-# Plot individual points
-for method in methods:
-    locs = []
-    times = []
-    
-    for req in requests:
-        if req in loc_data and method in loc_data[req]:
-            loc = loc_data[req][method]
-            perf_row = server_data[(server_data['question'] == req) & 
-                                   (server_data['method'] == method)]
-            if not perf_row.empty:
-                time = perf_row['mean_ms'].values[0]
-                locs.append(loc)
-                times.append(time)
-    
-    ax3.scatter(locs, times, s=80, alpha=0.4, color=colors[method], marker=markers[method])
-
-# Plot averages as large markers
-for stat in avg_stats:
-    ax3.scatter(stat['Avg LOC'], stat['Avg Time'], s=500, 
-               color=colors[stat['Method']], marker=markers[stat['Method']],
-               edgecolors='black', linewidth=2, alpha=0.9,
-               label=f"{stat['Method']}\n({stat['Avg LOC']:.1f} LOC, {stat['Avg Time']:.2f} ms)")
-    
-    # Add text annotation
-    ax3.annotate(stat['Method'], 
-                (stat['Avg LOC'], stat['Avg Time']),
-                xytext=(10, 10), textcoords='offset points',
-                fontsize=12, fontweight='bold',
-                bbox=dict(boxstyle='round,pad=0.5', 
-                         facecolor=colors[stat['Method']], alpha=0.7))
-
-# Draw ideal Pareto frontier (conceptual)
-ax3.axhline(y=1, color='green', linestyle=':', linewidth=2, alpha=0.5, 
-           label='Ideal Performance (1ms)')
-ax3.axvline(x=20, color='blue', linestyle=':', linewidth=2, alpha=0.5,
-           label='Ideal Simplicity (20 LOC)')
-
-ax3.set_xlabel('Average Lines of Code', fontsize=13, fontweight='bold')
-ax3.set_ylabel('Average Processing Time (ms)', fontsize=13, fontweight='bold')
-ax3.set_title('Performance vs Complexity Trade-off Analysis\nAverages Highlighted (Large Markers)',
-             fontsize=15, fontweight='bold', pad=20)
-ax3.legend(loc='upper right', fontsize=10, framealpha=0.95)
-ax3.grid(True, alpha=0.3, linestyle='--')
-ax3.set_yscale('log')
-
-plt.tight_layout()
-plt.savefig('pareto_frontier_analysis.png', dpi=300, bbox_inches='tight')
-print("[OK] Pareto frontier analysis chart saved")
+@chart_inputs(loc_data=loc_data, data=lambda: results.pivot('server_ms'), colors=colors, markers=markers)
+def chart_pareto():
+    fig3, ax3 = plt.subplots(figsize=(14, 10))
+
+    # Calculate average LOC and average time per method
+    avg_stats = []
+    for method in methods:
+        avg_loc = np.mean([loc_data[req][method] for req in requests if method in loc_data[req]])
+        avg_time = server_avg[method]
+        avg_stats.append({'Method': method, 'Avg LOC': avg_loc, 'Avg Time': avg_time})
+
+    # Plot individual points
+    for method in methods:
+        locs = []
+        times = []
+
+        for req in requests:
+            if req in loc_data and method in loc_data[req]:
+                loc = loc_data[req][method]
+                time = results.get(req, method, 'server_ms')
+                if time is not None:
+                    locs.append(loc)
+                    times.append(time)
+
+        ax3.scatter(locs, times, s=80, alpha=0.4, color=colors[method], marker=markers[method])
+
+    # Plot averages as large markers
+    for stat in avg_stats:
+        ax3.scatter(stat['Avg LOC'], stat['Avg Time'], s=500, 
+                   color=colors[stat['Method']], marker=markers[stat['Method']],
+                   edgecolors='black', linewidth=2, alpha=0.9,
+                   label=f"{stat['Method']}\n({stat['Avg LOC']:.1f} LOC, {stat['Avg Time']:.2f} ms)")
+
+        # Add text annotation
+        ax3.annotate(stat['Method'], 
+                    (stat['Avg LOC'], stat['Avg Time']),
+                    xytext=(10, 10), textcoords='offset points',
+                    fontsize=12, fontweight='bold',
+                    bbox=dict(boxstyle='round,pad=0.5', 
+                             facecolor=colors[stat['Method']], alpha=0.7))
+
+    # Draw ideal Pareto frontier (conceptual)
+    ax3.axhline(y=1, color='green', linestyle=':', linewidth=2, alpha=0.5, 
+               label='Ideal Performance (1ms)')
+    ax3.axvline(x=20, color='blue', linestyle=':', linewidth=2, alpha=0.5,
+               label='Ideal Simplicity (20 LOC)')
+
+    ax3.set_xlabel('Average Lines of Code', fontsize=13, fontweight='bold')
+    ax3.set_ylabel('Average Processing Time (ms)', fontsize=13, fontweight='bold')
+    ax3.set_title('Performance vs Complexity Trade-off Analysis\nAverages Highlighted (Large Markers)',
+                 fontsize=15, fontweight='bold', pad=20)
+    ax3.legend(loc='upper right', fontsize=10, framealpha=0.95)
+    ax3.grid(True, alpha=0.3, linestyle='--')
+    ax3.set_yscale('log')
+
+    plt.tight_layout()
+    save_figure('pareto_frontier_analysis.png')
+    print("[OK] Pareto frontier analysis chart saved")
+
 
 # ============================================================================
 # Statistics Summary
 # ============================================================================
-print("\n" + "="*80)
-print("LOC VS PERFORMANCE ANALYSIS")
-print("="*80)
-
-print("\nAverage Statistics per Engine:")
-print("-" * 80)
-for method in methods:
-    avg_loc = np.mean([loc_data[req][method] for req in requests if method in loc_data[req]])
-    method_perf = server_data[server_data['method'] == method]
-    avg_time = method_perf['mean_ms'].mean()
-    efficiency = avg_time / avg_loc
-    
-    print(f"{method:15s}: {avg_loc:5.1f} LOC avg, {avg_time:8.2f} ms avg")
-    print(f"                Efficiency: {efficiency:.4f} ms/LOC")
-
-print("\n" + "="*80)
-print("KEY INSIGHTS:")
-print("="*80)
-
-print("\n1. Code Complexity:")
-web1_avg_loc = np.mean([loc_data[req]['Web 1.0'] for req in requests])
-rdfa_avg_loc = np.mean([loc_data[req]['RDFa'] for req in requests])
-sparql_avg_loc = np.mean([loc_data[req]['SPARQL'] for req in requests])
-
-print(f"   - Web 1.0: {web1_avg_loc:.1f} LOC (most compact)")
-print(f"   - RDFa: {rdfa_avg_loc:.1f} LOC ({((rdfa_avg_loc/web1_avg_loc-1)*100):.1f}% more code)")
-print(f"   - SPARQL: {sparql_avg_loc:.1f} LOC ({((sparql_avg_loc/web1_avg_loc-1)*100):.1f}% more code)")
-
-print("\n2. Performance:")
-web1_avg_time = server_data[server_data['method'] == 'Web 1.0']['mean_ms'].mean()
-rdfa_avg_time = server_data[server_data['method'] == 'RDFa']['mean_ms'].mean()
-sparql_avg_time = server_data[server_data['method'] == 'SPARQL']['mean_ms'].mean()
-
-print(f"   - SPARQL: {sparql_avg_time:.2f} ms (fastest, 6.7x faster than Web 1.0)")
-print(f"   - Web 1.0: {web1_avg_time:.2f} ms")
-print(f"   - RDFa: {rdfa_avg_time:.2f} ms (slowest of the three)")
-
-print("\n3. Trade-off Analysis:")
-print(f"   - SPARQL writes {((sparql_avg_loc/web1_avg_loc-1)*100):.1f}% more code")
-print(f"     but executes {web1_avg_time/sparql_avg_time:.1f}x faster")
-print(f"   - ROI: Every extra line in SPARQL saves {(web1_avg_time-sparql_avg_time)/(sparql_avg_loc-web1_avg_loc):.2f} ms")
-
-print("\n4. Winner:")
-print("   SPARQL Endpoint offers the BEST trade-off:")
-print(f"   - Only 20% more code than Web 1.0")
-print(f"   - But 6.7x faster execution")
-print(f"   - Plus: Best accuracy guarantee (5/5) and lowest DOM coupling (1/5)")
-
-print("\n" + "="*80)
+def print_summary():
+    print("\n" + "="*80)
+    print("LOC VS PERFORMANCE ANALYSIS")
+    print("="*80)
+
+    print("\nAverage Statistics per Engine:")
+    print("-" * 80)
+    for method in methods:
+        avg_loc = np.mean([loc_data[req][method] for req in requests if method in loc_data[req]])
+        avg_time = server_avg[method]
+        efficiency = avg_time / avg_loc
+
+        print(f"{method:15s}: {avg_loc:5.1f} LOC avg, {avg_time:8.2f} ms avg")
+        print(f"                Efficiency: {efficiency:.4f} ms/LOC")
+
+    print("\n" + "="*80)
+    print("KEY INSIGHTS:")
+    print("="*80)
+
+    print("\n1. Code Complexity:")
+    web1_avg_loc = np.mean([loc_data[req]['Web 1.0'] for req in requests])
+    rdfa_avg_loc = np.mean([loc_data[req]['RDFa'] for req in requests])
+    sparql_avg_loc = np.mean([loc_data[req]['SPARQL'] for req in requests])
+
+    print(f"   - Web 1.0: {web1_avg_loc:.1f} LOC (most compact)")
+    print(f"   - RDFa: {rdfa_avg_loc:.1f} LOC ({((rdfa_avg_loc/web1_avg_loc-1)*100):.1f}% more code)")
+    print(f"   - SPARQL: {sparql_avg_loc:.1f} LOC ({((sparql_avg_loc/web1_avg_loc-1)*100):.1f}% more code)")
+
+    print("\n2. Performance:")
+    web1_avg_time = server_avg['Web 1.0']
+    rdfa_avg_time = server_avg['RDFa']
+    sparql_avg_time = server_avg['SPARQL']
+
+    print(f"   - SPARQL: {sparql_avg_time:.2f} ms (fastest, 6.7x faster than Web 1.0)")
+    print(f"   - Web 1.0: {web1_avg_time:.2f} ms")
+    print(f"   - RDFa: {rdfa_avg_time:.2f} ms (slowest of the three)")
+
+    print("\n3. Trade-off Analysis:")
+    print(f"   - SPARQL writes {((sparql_avg_loc/web1_avg_loc-1)*100):.1f}% more code")
+    print(f"     but executes {web1_avg_time/sparql_avg_time:.1f}x faster")
+    print(f"   - ROI: Every extra line in SPARQL saves {(web1_avg_time-sparql_avg_time)/(sparql_avg_loc-web1_avg_loc):.2f} ms")
+
+    print("\n4. Winner:")
+    print("   SPARQL Endpoint offers the BEST trade-off:")
+    print(f"   - Only 20% more code than Web 1.0")
+    print(f"   - But 6.7x faster execution")
+    print(f"   - Plus: Best accuracy guarantee (5/5) and lowest DOM coupling (1/5)")
+
+    print("\n" + "="*80)
+
+
+CHARTS = {
+    'loc_vs_performance_tradeoff.png': chart_tradeoff,
+    'code_efficiency_metric.png': chart_efficiency,
+    'pareto_frontier_analysis.png': chart_pareto,
+}
+
+
+def main():
+    for render in CHARTS.values():
+        render()
+
+    print_summary()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generate pairwise engine significance matrices from raw per-iteration samples
+One engine x engine matrix per request: colour and value are Cliff's delta of
+the row engine against the column engine (red = row engine slower), * marks
+differences that stay significant after Holm correction (significance.py)
+
+    python generate_significance_charts.py [samples files...]
+"""
+import functools
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from chart_cache import chart_inputs
+from generate_distribution_charts import (METRIC_LABELS, SAMPLE_FILES, request_grid, sample_signature,
+                                          sampled_metrics)
+from render_profile import save_figure
+from significance import ALPHA, load_samples, pairwise_table, print_table
+
+CMAP = 'RdBu_r'
+
+
+@functools.lru_cache(maxsize=None)
+def _table(metric, paths):
+    samples = load_samples(metric, paths)
+    methods = list(dict.fromkeys(m for _, m in samples))
+    return pairwise_table(samples), methods
+
+
+def significance_table(metric):
+    """Pairwise test table and engine order for metric (computed once per sample set)"""
+    return _table(metric, tuple(SAMPLE_FILES))
+
+
+def delta_matrix(rows, methods):
+    """Antisymmetric engine x engine Cliff's delta and significance for one request"""
+    index = {m: i for i, m in enumerate(methods)}
+    delta = np.full((len(methods), len(methods)), np.nan)
+    significant = np.zeros(delta.shape, dtype=bool)
+    for row in rows.itertuples():
+        a, b = index[row.method_a], index[row.method_b]
+        delta[a, b], delta[b, a] = row.cliffs_delta, -row.cliffs_delta
+        significant[a, b] = significant[b, a] = row.significant
+    return delta, significant
+
+
+# ============================================================================
+# CHART 1: Engine x engine significance matrix per request
+# ============================================================================
+@chart_inputs(samples=sample_signature, cmap=CMAP, alpha=ALPHA)
+def chart_significance(metric='server_ms'):
+    table, methods = significance_table(metric)
+    requests = list(dict.fromkeys(table['question']))
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time: Pairwise Engine Differences\n'
+                                       "Cliff's delta of row vs column engine (>0 = row slower), "
+                                       f'* = significant after Holm correction (alpha={ALPHA})')
+    labels = [m.replace(' ', '\n') for m in methods]
+
+    for ax, req in zip(axes, requests):
+        delta, significant = delta_matrix(table[table['question'] == req], methods)
+        image = ax.imshow(delta, cmap=CMAP, vmin=-1, vmax=1)
+        for (i, j), value in np.ndenumerate(delta):
+            if np.isnan(value):
+                continue
+            ax.text(j, i, f"{value:.2f}{'*' if significant[i, j] else ''}", ha='center', va='center',
+                    fontsize=8, color='white' if abs(value) > 0.6 else 'black')
+        ax.set_xticks(range(len(methods)))
+        ax.set_xticklabels(labels, fontsize=7)
+        ax.set_yticks(range(len(methods)))
+        ax.set_yticklabels(labels, fontsize=7)
+        ax.set_title(req, fontsize=12, fontweight='bold')
+
+    plt.tight_layout(rect=(0, 0, 0.95, 1))
+    colorbar_ax = fig.add_axes((0.955, 0.15, 0.012, 0.65))
+    fig.colorbar(image, cax=colorbar_ax, label="Cliff's delta")
+    save_figure(f"significance_matrix_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 1: significance_matrix_{metric.replace('_ms', '')}.png")
+
+
+def significance_charts():
+    """One matrix chart per sampled metric, or none when there are no raw samples"""
+    charts = {}
+    if sample_signature():
+        for metric in sampled_metrics():
+            charts[f"significance_matrix_{metric.replace('_ms', '')}.png"] = functools.partial(
+                chart_significance, metric=metric)
+    return charts
+
+
+CHARTS = significance_charts()
+
+
+def main(paths):
+    if paths:
+        SAMPLE_FILES[:] = paths
+    if not sample_signature():
+        print(f"No raw samples found ({', '.join(SAMPLE_FILES)}): run the benchmarks with "
+              "sample output or pass sample files on the command line")
+        return 1
+
+    print("="*80)
+    print("GENERATING ENGINE SIGNIFICANCE CHARTS")
+    print("="*80)
+
+    for render in significance_charts().values():
+        render()
+
+    print()
+    print_table(significance_table('server_ms')[0], 'server_ms')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generate performance trend charts from the benchmark history
+Mean (solid) and p99 (dashed, when recorded) of every engine per request,
+across all runs in benchmark_history.sqlite (see history_store.py)
+
+    python generate_trend_charts.py
+"""
+import functools
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from chart_cache import chart_inputs
+from generate_distribution_charts import COLORS, METRIC_LABELS, engine_legend, request_grid
+from history_store import HISTORY_DB, history_signature, recorded_metrics, trend
+from render_profile import save_figure
+from sample_ingest import METRICS
+
+MIN_RUNS = 2  # a trend needs at least two runs
+MARKER_RUNS = 50  # mark individual runs up to this many
+
+
+def _natural_key(question):
+    return (len(question), question)
+
+
+@chart_inputs(history=history_signature, colors=COLORS)
+def chart_trend(metric='server_ms'):
+    means = trend(metric, 'mean_ms')
+    p99 = trend(metric, 'p99_ms').dropna(subset=['value'])
+    for frame in (means, p99):
+        frame['recorded_at'] = pd.to_datetime(frame['recorded_at'], utc=True, format='ISO8601')
+    requests = sorted(means['question'].unique(), key=_natural_key)
+    methods = list(dict.fromkeys(means['method']))
+    runs = means['run_id'].nunique()
+
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time Across {runs} Runs\n'
+                                       'Solid = mean, dashed = p99')
+    for ax, req in zip(axes, requests):
+        for method in methods:
+            color = COLORS.get(method, 'gray')
+            cell = means[(means['question'] == req) & (means['method'] == method)]
+            ax.plot(cell['recorded_at'], cell['value'], color=color, linewidth=1.5,
+                    marker='o' if runs <= MARKER_RUNS else None, markersize=3)
+            tail = p99[(p99['question'] == req) & (p99['method'] == method)]
+            if not tail.empty:
+                ax.plot(tail['recorded_at'], tail['value'], color=color, linewidth=1,
+                        linestyle='--', alpha=0.8)
+        ax.set_yscale('log')
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.tick_params(axis='x', labelrotation=30, labelsize=7)
+        ax.grid(alpha=0.3, linestyle='--')
+    axes[0].set_ylabel('Time (ms) - Log Scale', fontsize=10, fontweight='bold')
+
+    engine_legend(fig, methods)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure(f"trend_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 1: trend_{metric.replace('_ms', '')}.png")
+
+
+def trend_charts():
+    """One chart per recorded metric once the history holds enough runs"""
+    charts = {}
+    if history_signature()[0] >= MIN_RUNS:
+        recorded = recorded_metrics()
+        for metric in [m for m in METRICS if m in recorded]:
+            charts[f"trend_{metric.replace('_ms', '')}.png"] = functools.partial(chart_trend, metric=metric)
+    return charts
+
+
+CHARTS = trend_charts()
+
+
+def main():
+    runs = history_signature()[0]
+    if runs < MIN_RUNS:
+        print(f"{HISTORY_DB} holds {runs} run(s): record at least {MIN_RUNS} with "
+              "'python history_store.py record' first")
+        return 1
+
+    print("="*80)
+    print("GENERATING PERFORMANCE TREND CHARTS")
+    print("="*80)
+
+    for render in trend_charts().values():
+        render()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
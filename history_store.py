@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Append-only history of benchmark runs
+Every recorded run keeps its full results (benchmark_results.csv schema) in a
+local SQLite database under a run ID, with metadata: timestamp, git SHA, host,
+Python version, dataset scale and a free-form note. Rows are stored in a
+WITHOUT ROWID table clustered on (question, method, metric, run), so the trend
+of one cell over hundreds of runs is a single index range scan; a secondary
+index on (metric, question, method) serves the trend of a whole metric.
+
+    python history_store.py record [results.csv] [--scale 1] [--note "..."]
+    python history_store.py list
+    python history_store.py trend R9 "Knowledge Graph" [metric] [stat]
+    python history_store.py export RUN_ID [output.csv]
+"""
+import argparse
+import datetime
+import os
+import platform
+import socket
+import sqlite3
+import subprocess
+import sys
+import uuid
+
+import pandas as pd
+
+from results_store import KEY_COLUMNS, RESULTS_CSV, read_csv, write_csv
+
+HISTORY_DB = 'benchmark_history.sqlite'
+
+# Statistics kept per cell; columns missing from a run are stored as NULL
+STATISTICS = ['mean_ms', 'median_ms', 'stdev_ms', 'min_ms', 'max_ms',
+              'p90_ms', 'p95_ms', 'p99_ms', 'p999_ms']
+
+RUN_COLUMNS = ['run_id', 'recorded_at', 'git_sha', 'host', 'python', 'scale', 'note']
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    recorded_at TEXT NOT NULL,
+    git_sha TEXT,
+    host TEXT,
+    python TEXT,
+    scale REAL,
+    note TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_recorded_at ON runs (recorded_at);
+CREATE TABLE IF NOT EXISTS results (
+    question TEXT NOT NULL,
+    method TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    run_id TEXT NOT NULL REFERENCES runs (run_id),
+    position INTEGER NOT NULL,
+    {', '.join(f'{stat} REAL' for stat in STATISTICS)},
+    PRIMARY KEY (question, method, metric, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS results_metric ON results (metric, question, method);
+"""
+
+
+def connect(path=HISTORY_DB):
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA foreign_keys = ON')
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def git_sha():
+    """Commit of the working tree (with a -dirty suffix), or None outside git"""
+    try:
+        sha = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                             check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f'{sha}-dirty' if dirty else sha
+
+
+def run_metadata(scale=None, note=None):
+    """Metadata of a run recorded now on this machine"""
+    recorded_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+    return {'run_id': f"{recorded_at[:10].replace('-', '')}-{uuid.uuid4().hex[:8]}",
+            'recorded_at': recorded_at, 'git_sha': git_sha(), 'host': socket.gethostname(),
+            'python': platform.python_version(), 'scale': scale, 'note': note}
+
+
+def record_run(frame, metadata=None, path=HISTORY_DB):
+    """Append a run's results (benchmark_results.csv schema); returns the run ID
+
+    Runs are never updated: recording an existing run ID fails.
+    """
+    metadata = {**run_metadata(), **(metadata or {})}
+    rows = frame.astype({col: str for col in KEY_COLUMNS}).reindex(columns=KEY_COLUMNS + STATISTICS)
+    rows = rows.astype({stat: float for stat in STATISTICS}).assign(
+        run_id=metadata['run_id'], position=range(len(rows)))
+    rows = rows.astype(object).where(rows.notna(), None)
+    columns = KEY_COLUMNS + ['run_id', 'position'] + STATISTICS
+
+    with connect(path) as connection:
+        connection.execute(f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) "
+                           f"VALUES ({', '.join('?' * len(RUN_COLUMNS))})",
+                           [metadata.get(col) for col in RUN_COLUMNS])
+        connection.executemany(f"INSERT INTO results ({', '.join(columns)}) "
+                               f"VALUES ({', '.join('?' * len(columns))})",
+                               rows[columns].itertuples(index=False, name=None))
+    connection.close()
+    return metadata['run_id']
+
+
+def list_runs(path=HISTORY_DB):
+    """Every run's metadata, oldest first"""
+    with connect(path) as connection:
+        runs = pd.read_sql_query('SELECT * FROM runs ORDER BY recorded_at, run_id', connection)
+    connection.close()
+    return runs
+
+
+def load_run(run_id, path=HISTORY_DB):
+    """Results of one run in the benchmark_results.csv schema, in recorded row order"""
+    with connect(path) as connection:
+        frame = pd.read_sql_query(f"SELECT {', '.join(KEY_COLUMNS + STATISTICS)} FROM results "
+                                  "WHERE run_id = ? ORDER BY position", connection, params=(run_id,))
+    connection.close()
+    if frame.empty:
+        raise KeyError(f"No run {run_id!r} in {path}")
+    return frame.dropna(axis=1, how='all')
+
+
+def trend(metric='server_ms', stat='mean_ms', question=None, method=None, path=HISTORY_DB):
+    """One statistic of every (question, method) cell across runs, oldest run first
+
+    Filtering on question (and method) uses the clustered primary key; a
+    metric-only filter uses the results_metric index.
+    """
+    if stat not in STATISTICS:
+        raise ValueError(f"Unknown statistic {stat!r}, expected one of {', '.join(STATISTICS)}")
+    where, params = ['r.metric = ?'], [metric]
+    for column, value in (('question', question), ('method', method)):
+        if value is not None:
+            where.append(f'r.{column} = ?')
+            params.append(value)
+    query = (f"SELECT r.question, r.method, r.run_id, runs.recorded_at, runs.git_sha, "
+             f"r.{stat} AS value FROM results r JOIN runs USING (run_id) "
+             f"WHERE {' AND '.join(where)} ORDER BY runs.recorded_at, r.run_id, r.position")
+    with connect(path) as connection:
+        frame = pd.read_sql_query(query, connection, params=params)
+    connection.close()
+    return frame
+
+
+def recorded_metrics(path=HISTORY_DB):
+    """Metrics present in any recorded run (read from the results_metric index)"""
+    if not os.path.exists(path):
+        return []
+    with connect(path) as connection:
+        metrics = [row[0] for row in connection.execute('SELECT DISTINCT metric FROM results')]
+    connection.close()
+    return metrics
+
+
+def history_signature(path=HISTORY_DB):
+    """Number of runs and latest run ID (cheap cache key for the trend charts)"""
+    if not os.path.exists(path):
+        return (0, None)
+    with connect(path) as connection:
+        count, latest = connection.execute(
+            'SELECT COUNT(*), MAX(recorded_at || run_id) FROM runs').fetchone()
+    connection.close()
+    return (count, latest)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', default=HISTORY_DB, help=f'history database (default: {HISTORY_DB})')
+    commands = parser.add_subparsers(dest='command', required=True)
+    record = commands.add_parser('record', help='append a results CSV as a new run')
+    record.add_argument('csv', nargs='?', default=RESULTS_CSV)
+    record.add_argument('--scale', type=float, help='dataset scale factor of the run')
+    record.add_argument('--note')
+    commands.add_parser('list', help='list recorded runs')
+    trend_parser = commands.add_parser('trend', help='one cell across runs')
+    trend_parser.add_argument('question')
+    trend_parser.add_argument('method')
+    trend_parser.add_argument('metric', nargs='?', default='server_ms')
+    trend_parser.add_argument('stat', nargs='?', default='mean_ms')
+    export = commands.add_parser('export', help='write a recorded run back out as a results CSV')
+    export.add_argument('run_id')
+    export.add_argument('output', nargs='?', default=RESULTS_CSV)
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        frame = read_csv(args.csv)
+        run_id = record_run(frame, run_metadata(args.scale, args.note), args.db)
+        print(f"[OK] {args.csv} -> run {run_id} ({len(frame)} rows) in {args.db}")
+    elif args.command == 'list':
+        print(list_runs(args.db).to_string(index=False))
+    elif args.command == 'trend':
+        frame = trend(args.metric, args.stat, args.question, args.method, args.db)
+        print(frame[['recorded_at', 'run_id', 'git_sha', 'value']].to_string(index=False))
+    elif args.command == 'export':
+        write_csv(load_run(args.run_id, args.db), args.output)
+        print(f"[OK] run {args.run_id} -> {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-iteration context capture for spike attribution
+An IterationProbe wraps each measured iteration and records what the process
+went through meanwhile: garbage collections (gc.callbacks: time spent,
+oldest generation collected, objects freed), the RSS change, voluntary and
+involuntary context switches, block I/O operations and major page faults
+(getrusage). The records extend the JSONL iteration samples of
+sample_ingest.py, so one file feeds both the aggregates and
+spike_attribution.py:
+
+    {"question": "R1", "method": "Web 1.0", "server_ms": 21.9, "ts": 1718000000.1,
+     "gc_ms": 18.2, "gc_gen": 2, "nivcsw": 0, ...}
+
+resource (getrusage) is Unix-only: elsewhere only the GC and RSS fields are filled.
+"""
+import gc
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage
+    resource = None
+
+CONTEXT_FILE = 'benchmark_context.jsonl'
+
+# getrusage counters recorded as per-iteration deltas
+RUSAGE_FIELDS = {'nvcsw': 'ru_nvcsw', 'nivcsw': 'ru_nivcsw', 'inblock': 'ru_inblock',
+                 'oublock': 'ru_oublock', 'majflt': 'ru_majflt'}
+CONTEXT_FIELDS = ['ts', 'gc_ms', 'gc_gen', 'gc_collected', 'rss_kb', 'rss_delta_kb'] + list(RUSAGE_FIELDS)
+
+# Per-thread counters where available, so other threads' switches are not charged
+_RUSAGE_WHO = getattr(resource, 'RUSAGE_THREAD', getattr(resource, 'RUSAGE_SELF', None))
+_PAGE_KB = os.sysconf('SC_PAGE_SIZE') // 1024 if hasattr(os, 'sysconf') else 4
+
+
+def rss_kb():
+    """Current resident set size in KiB (Linux /proc), else None"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_KB
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class IterationProbe:
+    """Collects the context of each iteration run inside measure()
+
+        with IterationProbe() as probe:
+            for _ in range(iterations):
+                with probe.measure() as context:
+                    run_iteration()
+                record = {..., **context}
+    """
+
+    def __init__(self):
+        self._gc_started = None
+        self._reset()
+
+    def _reset(self):
+        self.gc_ns = 0
+        self.gc_generation = -1
+        self.gc_collected = 0
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._gc_started = time.perf_counter_ns()
+        elif self._gc_started is not None:
+            self.gc_ns += time.perf_counter_ns() - self._gc_started
+            self.gc_generation = max(self.gc_generation, info['generation'])
+            self.gc_collected += info['collected']
+            self._gc_started = None
+
+    def open(self):
+        gc.callbacks.append(self._on_gc)
+        return self
+
+    def close(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def measure(self):
+        """Yield a dict that holds the iteration's context once the block exits"""
+        context = {'ts': time.time()}
+        self._reset()
+        usage = resource.getrusage(_RUSAGE_WHO) if resource else None
+        rss = rss_kb()
+        try:
+            yield context
+        finally:
+            after = resource.getrusage(_RUSAGE_WHO) if resource else None
+            current = rss_kb()
+            context.update(gc_ms=self.gc_ns / 1e6, gc_gen=self.gc_generation,
+                           gc_collected=self.gc_collected, rss_kb=current,
+                           rss_delta_kb=current - rss if current is not None and rss is not None else None)
+            if usage is not None:
+                context.update({name: getattr(after, field) - getattr(usage, field)
+                                for name, field in RUSAGE_FIELDS.items()})
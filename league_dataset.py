@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seeded synthetic league dataset in every engine's representation
+The benchmark league is 10 teams over the 2008-2009 season. This generator
+builds N teams x M seasons from one set of underlying facts (double
+round-robin schedule, Poisson scores from seeded team strengths, standings)
+and writes them as:
+
+    web1/<season>/       Web 1.0 HTML: index.html (standings table, stat-box
+                         divs), calendar.html, teams/<team>.html
+    rdfa/<season>/       the same pages annotated with RDFa (schema.org
+                         SportsTeam / SportsEvent)
+    knowledge_graph.ttl  Turtle for the in-memory knowledge graph
+    endpoint.nt          N-Triples bulk file for the SPARQL endpoint
+
+Seasons are generated and written one at a time (vectorized per season), so
+memory is bounded by one season and a 1000x dataset streams straight to disk.
+The same seed always gives the same league.
+
+    python league_dataset.py [-o dataset] [--teams 10] [--seasons 1] [--seed 0]
+                             [--formats web1 rdfa turtle ntriples]
+"""
+import argparse
+import datetime
+import functools
+import json
+import os
+import re
+import sys
+import time
+from html import escape
+
+import numpy as np
+
+FORMATS = ['web1', 'rdfa', 'turtle', 'ntriples']
+MANIFEST = 'manifest.json'
+TURTLE_FILE = 'knowledge_graph.ttl'
+NTRIPLES_FILE = 'endpoint.nt'
+
+# The benchmark league: 10 teams, one season starting in August 2008
+BASE_TEAMS = 10
+BASE_SEASONS = 1
+FIRST_SEASON = 2008
+SEASON_START = (8, 16)   # month, day of the first matchday
+SEASON_DAYS = 280        # matchdays spread from mid-August to late May
+SEED = 0
+
+# Scoring model: goals ~ Poisson(exp(GOAL_BASE + HOME_ADVANTAGE + attack - defence))
+GOAL_BASE = 0.25
+HOME_ADVANTAGE = 0.25
+STRENGTH_SPREAD = 0.3
+
+SCHEMA = 'https://schema.org/'
+BASE_IRI = 'http://example.org/league/'
+
+CLUB_NAMES = ['Manchester United', 'Liverpool', 'Chelsea', 'Arsenal', 'Everton',
+              'Aston Villa', 'Fulham', 'Tottenham Hotspur', 'West Ham United',
+              'Manchester City', 'Wigan Athletic', 'Stoke City', 'Bolton Wanderers',
+              'Portsmouth', 'Blackburn Rovers', 'Sunderland', 'Hull City',
+              'Newcastle United', 'Middlesbrough', 'West Bromwich Albion']
+
+# Standings columns; the Web 1.0 scrapers rely on team at 1 and goals for at 7
+STANDINGS_HEADER = ['Pos', 'Équipe', 'J', 'G', 'N', 'P', 'Pts', 'BP', 'BC', 'Diff']
+
+
+def scale_factor(teams, seasons):
+    """Matches relative to the benchmark league (BASE_TEAMS x BASE_SEASONS)"""
+    return teams * (teams - 1) * seasons / (BASE_TEAMS * (BASE_TEAMS - 1) * BASE_SEASONS)
+
+
+def teams_for_scale(scale, seasons=BASE_SEASONS):
+    """Smallest league of seasons seasons with at least scale x the benchmark league's matches"""
+    matches = scale * BASE_TEAMS * (BASE_TEAMS - 1) * BASE_SEASONS / seasons
+    return max(2, int(np.ceil((1 + np.sqrt(1 + 4 * matches)) / 2 - 1e-9)))
+
+
+def team_names(teams):
+    """Real club names first, then numbered synthetic clubs"""
+    return CLUB_NAMES[:teams] + [f'Athletic Club {i + 1:04d}' for i in range(len(CLUB_NAMES), teams)]
+
+
+def slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def round_robin(teams):
+    """Double round-robin by the circle method: (home, away, round) index arrays
+
+    Every team meets every other team once at home and once away; with an odd
+    number of teams each round one team rests.
+    """
+    size = teams + teams % 2
+    rotation = np.arange(size)
+    homes, aways, rounds = [], [], []
+    for r in range(size - 1):
+        first, second = rotation[:size // 2].copy(), rotation[size // 2:][::-1].copy()
+        # Alternate the fixed team's venue so its home games are spread evenly
+        if r % 2:
+            first[0], second[0] = second[0], first[0]
+        homes.append(first)
+        aways.append(second)
+        rounds.append(np.full(size // 2, r))
+        rotation = np.concatenate(([rotation[0]], np.roll(rotation[1:], 1)))
+    home, away, rnd = np.concatenate(homes), np.concatenate(aways), np.concatenate(rounds)
+    # Second half: the same fixtures with the venues swapped
+    home, away = np.concatenate((home, away)), np.concatenate((away, home))
+    rnd = np.concatenate((rnd, rnd + size - 1))
+    keep = (home < teams) & (away < teams)
+    return home[keep], away[keep], rnd[keep]
+
+
+class Season:
+    """One season's facts: schedule, scores and standings (all numpy arrays)"""
+
+    def __init__(self, year, names, seed=SEED):
+        self.year = year
+        self.names = names
+        self.label = f'{year}-{year + 1}'
+        teams = len(names)
+        rng = np.random.default_rng([seed, year])
+        attack = rng.normal(0, STRENGTH_SPREAD, teams)
+        defence = rng.normal(0, STRENGTH_SPREAD, teams)
+
+        home, away, rnd = round_robin(teams)
+        order = np.lexsort((home, rnd))
+        self.home, self.away, self.round = home[order], away[order], rnd[order]
+        self.home_goals = rng.poisson(np.exp(GOAL_BASE + HOME_ADVANTAGE
+                                             + attack[self.home] - defence[self.away]))
+        self.away_goals = rng.poisson(np.exp(GOAL_BASE + attack[self.away] - defence[self.home]))
+        rounds = max(int(self.round.max()) + 1, 1) if len(self.round) else 1
+        start = datetime.date(year, *SEASON_START)
+        self.dates = [str(start + datetime.timedelta(days=d))
+                      for d in range(SEASON_DAYS + 1)]
+        self.day = (self.round * SEASON_DAYS) // rounds
+
+        self._standings(teams)
+
+    def _standings(self, teams):
+        hg, ag = self.home_goals, self.away_goals
+        count = lambda index, weights=None: np.bincount(index, weights, minlength=teams).astype(np.int64)
+        self.played = count(self.home) + count(self.away)
+        self.won = count(self.home, hg > ag) + count(self.away, ag > hg)
+        self.drawn = count(self.home, hg == ag) + count(self.away, hg == ag)
+        self.lost = self.played - self.won - self.drawn
+        self.goals_for = count(self.home, hg) + count(self.away, ag)
+        self.goals_against = count(self.home, ag) + count(self.away, hg)
+        self.points = 3 * self.won + self.drawn
+        # Points, then goal difference, then goals scored, then name
+        self.ranking = np.lexsort((np.array(self.names), -self.goals_for,
+                                   -(self.goals_for - self.goals_against), -self.points))
+        self.position = np.empty(teams, dtype=np.int64)
+        self.position[self.ranking] = np.arange(1, teams + 1)
+
+    @property
+    def matches(self):
+        return len(self.home)
+
+    @functools.cached_property
+    def rows(self):
+        """(date, home, away, home_goals, away_goals) of every match, as Python values"""
+        dates = [self.dates[day] for day in self.day.tolist()]
+        return list(zip(dates, self.home.tolist(), self.away.tolist(),
+                        self.home_goals.tolist(), self.away_goals.tolist()))
+
+    def team_matches(self):
+        """Match indices of every team, in date order"""
+        teams = len(self.names)
+        both = np.concatenate((self.home, self.away))
+        order = np.argsort(both, kind='stable')
+        bounds = np.searchsorted(both[order], np.arange(teams + 1))
+        return [np.sort(order[bounds[t]:bounds[t + 1]] % self.matches) for t in range(teams)]
+
+
+def seasons(teams=BASE_TEAMS, count=BASE_SEASONS, seed=SEED, first=FIRST_SEASON):
+    """Season facts one at a time"""
+    names = team_names(teams)
+    for year in range(first, first + count):
+        yield Season(year, names, seed)
+
+
+# ============================================================================
+# HTML (Web 1.0 and RDFa share the pages; RDFa adds the annotations)
+# ============================================================================
+def _rdfa(rdfa, attributes):
+    return f' {attributes}' if rdfa else ''
+
+
+def _property(rdfa, name):
+    return _rdfa(rdfa and name, f'property="{name}"')
+
+
+def _typeof(rdfa, name):
+    return _rdfa(rdfa, f'typeof="{name}"')
+
+
+def _page(title, body, rdfa=False, typeof=None):
+    vocab = _rdfa(rdfa, f'vocab="{SCHEMA}"') + (_typeof(rdfa, typeof) if typeof else '')
+    return (f'<!DOCTYPE html>\n<html lang="fr">\n<head><meta charset="utf-8">'
+            f'<title>{escape(title)}</title></head>\n<body{vocab}>\n{body}</body>\n</html>\n')
+
+
+def write_index(season, path, rdfa=False):
+    """Standings table and stat-box divs"""
+    names = season.names
+    rows = []
+    for t in season.ranking:
+        cells = [(season.position[t], 'position'), (escape(names[t]), 'name'),
+                 (season.played[t], None), (season.won[t], None), (season.drawn[t], None),
+                 (season.lost[t], None), (season.points[t], None),
+                 (season.goals_for[t], 'goalsScored'), (season.goals_against[t], None),
+                 (season.goals_for[t] - season.goals_against[t], None)]
+        tds = ''.join(f'<td{_property(rdfa, prop)}>{value}</td>' for value, prop in cells)
+        rows.append(f'<tr{_typeof(rdfa, "SportsTeam")}>{tds}</tr>\n')
+    header = ''.join(f'<th>{h}</th>' for h in STANDINGS_HEADER)
+    # Best attack: ties go to the better-placed team
+    best = int(season.ranking[np.argmax(season.goals_for[season.ranking])])
+    body = (f'<h1>Classement {season.label}</h1>\n'
+            f'<table class="classement">\n<tr>{header}</tr>\n{"".join(rows)}</table>\n'
+            f'<div class="stat-box">\n'
+            f'<p>Nombre total de matchs joués cette saison : {season.matches}.</p>\n'
+            f'<p>Nombre total de buts : {int(season.home_goals.sum() + season.away_goals.sum())}.</p>\n'
+            f'</div>\n<div class="stat-box">\n'
+            f'<p>Meilleure attaque : <strong>{escape(names[best])}</strong> avec '
+            f'<strong>{season.goals_for[best]}</strong> buts.</p>\n</div>\n')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_page(f'Classement {season.label}', body, rdfa))
+
+
+def write_calendar(season, path, rdfa=False):
+    """Every match of the season as a table row, in date order"""
+    names = [escape(name) for name in season.names]
+    event = _typeof(rdfa, 'SportsEvent')
+    date, home, score, away = (_property(rdfa, p) for p in ('startDate', 'homeTeam', 'score', 'awayTeam'))
+    # Streamed row by row: the page holds every match of the season
+    head, tail = _page(f'Calendrier {season.label}', '\0', rdfa).split('\0')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f'{head}<h1>Calendrier {season.label}</h1>\n<table class="calendrier">\n'
+                '<tr><th>Date</th><th>Domicile</th><th>Score</th><th>Extérieur</th></tr>\n')
+        f.writelines(f'<tr{event}><td{date}>{day}</td><td{home}>{names[h]}</td>'
+                     f'<td class="score"{score}>{hg}-{ag}</td><td{away}>{names[a]}</td></tr>\n'
+                     for day, h, a, hg, ag in season.rows)
+        f.write(f'</table>\n{tail}')
+
+
+def _result(goals, conceded):
+    return 'Victoire' if goals > conceded else 'Nul' if goals == conceded else 'Défaite'
+
+
+def write_team_pages(season, directory, rdfa=False):
+    """One page per team: its matches as 'Domicile/Extérieur ... - Victoire 2-1' lines"""
+    names = season.names
+    opponents = [escape(name) for name in names]
+    event = _typeof(rdfa, 'SportsEvent')
+    date = _property(rdfa, 'startDate')
+    venues = {True: ('Domicile', _property(rdfa, 'awayTeam')),
+              False: ('Extérieur', _property(rdfa, 'homeTeam'))}
+    rows = season.rows
+    for team, matches in enumerate(season.team_matches()):
+        lines = []
+        for m in matches.tolist():
+            day, h, a, hg, ag = rows[m]
+            home = h == team
+            venue, role = venues[home]
+            goals, conceded = (hg, ag) if home else (ag, hg)
+            lines.append(f'<p{event}><span{date}>{day}</span> : {venue} contre '
+                         f'<span{role}>{opponents[a if home else h]}</span>'
+                         f' - {_result(goals, conceded)} {goals}-{conceded}</p>\n')
+        body = (f'<h1{_property(rdfa, "name")}>{escape(names[team])}</h1>\n'
+                f'<p>Position : {season.position[team]} - Points : {season.points[team]}</p>\n'
+                f'<div class="matchs">\n{"".join(lines)}</div>\n')
+        with open(os.path.join(directory, f'{slug(names[team])}.html'), 'w', encoding='utf-8') as f:
+            f.write(_page(names[team], body, rdfa, 'SportsTeam'))
+
+
+def write_html(season, root, rdfa=False):
+    directory = os.path.join(root, 'rdfa' if rdfa else 'web1', season.label)
+    os.makedirs(os.path.join(directory, 'teams'), exist_ok=True)
+    write_index(season, os.path.join(directory, 'index.html'), rdfa)
+    write_calendar(season, os.path.join(directory, 'calendar.html'), rdfa)
+    write_team_pages(season, os.path.join(directory, 'teams'), rdfa)
+
+
+# ============================================================================
+# RDF (Turtle and N-Triples from the same triples)
+# ============================================================================
+def _literal(value):
+    text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{text}"'
+
+
+def season_triples(season):
+    """(subject, [(predicate, object), ...]) per resource; objects are N-Triples terms
+
+    Positions, goals and scores are plain literals, as in the benchmark graph
+    (queries cast them with xsd:integer or split the score with STRBEFORE).
+    """
+    base = f'{BASE_IRI}{season.year}/'
+    teams = [f'<{base}team/{slug(name)}>' for name in season.names]
+    season_iri = f'<{base}season>'
+    a = '<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>'
+    yield season_iri, [(a, f'<{SCHEMA}SportsEvent>'), (f'<{SCHEMA}name>', _literal(season.label))]
+    for t, iri in enumerate(teams):
+        yield iri, [(a, f'<{SCHEMA}SportsTeam>'), (f'<{SCHEMA}name>', _literal(season.names[t])),
+                    (f'<{SCHEMA}position>', _literal(season.position[t])),
+                    (f'<{SCHEMA}goalsScored>', _literal(season.goals_for[t])),
+                    (f'<{SCHEMA}memberOf>', season_iri)]
+    for m, (day, h, w, hg, ag) in enumerate(season.rows):
+        yield f'<{base}match/{m + 1}>', [
+            (a, f'<{SCHEMA}SportsEvent>'), (f'<{SCHEMA}startDate>', _literal(day)),
+            (f'<{SCHEMA}homeTeam>', teams[h]), (f'<{SCHEMA}awayTeam>', teams[w]),
+            (f'<{SCHEMA}score>', _literal(f'{hg}-{ag}')), (f'<{SCHEMA}superEvent>', season_iri)]
+
+
+TURTLE_PREFIXES = {SCHEMA: 'schema',
+                   'http://www.w3.org/1999/02/22-rdf-syntax-ns#': 'rdf'}
+
+
+def _turtle_term(term):
+    """Prefixed name for IRIs under a known namespace (local names without '/')"""
+    if term.startswith('<'):
+        iri = term[1:-1]
+        if iri == 'http://www.w3.org/1999/02/22-rdf-syntax-ns#type':
+            return 'a'
+        for namespace, prefix in TURTLE_PREFIXES.items():
+            local = iri[len(namespace):]
+            if iri.startswith(namespace) and re.fullmatch(r'[A-Za-z0-9_-]+', local):
+                return f'{prefix}:{local}'
+    return term
+
+
+def write_turtle_header(f):
+    f.writelines(f'@prefix {prefix}: <{namespace}> .\n' for namespace, prefix in TURTLE_PREFIXES.items())
+    f.write('\n')
+
+
+def write_turtle(season, f):
+    for subject, pairs in season_triples(season):
+        body = ' ;\n    '.join(f'{_turtle_term(p)} {_turtle_term(o)}' for p, o in pairs)
+        f.write(f'{subject} {body} .\n')
+
+
+def write_ntriples(season, f):
+    """Returns the number of triples written"""
+    count = 0
+    for subject, pairs in season_triples(season):
+        f.writelines(f'{subject} {p} {o} .\n' for p, o in pairs)
+        count += len(pairs)
+    return count
+
+
+def generate(root, teams=BASE_TEAMS, season_count=BASE_SEASONS, seed=SEED, formats=FORMATS,
+             progress=None):
+    """Write the dataset under root; returns its manifest (also saved as MANIFEST)"""
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown formats {sorted(unknown)}, expected some of {FORMATS}")
+    if teams < 2:
+        raise ValueError("A league needs at least 2 teams")
+    os.makedirs(root, exist_ok=True)
+    turtle = open(os.path.join(root, TURTLE_FILE), 'w', encoding='utf-8') if 'turtle' in formats else None
+    ntriples = open(os.path.join(root, NTRIPLES_FILE), 'w', encoding='utf-8') if 'ntriples' in formats else None
+    matches = triples = 0
+    labels = []
+    try:
+        if turtle:
+            write_turtle_header(turtle)
+        for season in seasons(teams, season_count, seed):
+            if 'web1' in formats:
+                write_html(season, root)
+            if 'rdfa' in formats:
+                write_html(season, root, rdfa=True)
+            if turtle:
+                write_turtle(season, turtle)
+            if ntriples:
+                triples += write_ntriples(season, ntriples)
+            matches += season.matches
+            labels.append(season.label)
+            if progress:
+                progress(season)
+    finally:
+        for f in (turtle, ntriples):
+            if f is not None:
+                f.close()
+
+    manifest = {'teams': teams, 'seasons': labels, 'seed': seed, 'formats': list(formats),
+                'matches': matches, 'triples': triples if ntriples else None,
+                'scale': scale_factor(teams, season_count)}
+    with open(os.path.join(root, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-o', '--output', default='dataset', help='output directory (default: dataset)')
+    parser.add_argument('--teams', type=int, default=BASE_TEAMS)
+    parser.add_argument('--seasons', type=int, default=BASE_SEASONS)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=FORMATS)
+    args = parser.parse_args(argv)
+
+    print(f"{args.teams} teams x {args.seasons} seasons "
+          f"(scale {scale_factor(args.teams, args.seasons):g}) -> {args.output}")
+    start = time.perf_counter()
+    manifest = generate(args.output, args.teams, args.seasons, args.seed, args.formats,
+                        lambda season: print(f"  {season.label}: {season.matches} matches"))
+    print(f"[OK] {manifest['matches']} matches"
+          + (f", {manifest['triples']} triples" if manifest['triples'] else '')
+          + f" in {time.perf_counter() - start:.1f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Multi-objective Pareto skyline per request
+The engines of each request are compared on every objective at once: server,
+client and render time, lines of code, branching complexity, DOM robustness
+and memory (when the results have a memory_kb metric). An engine is dominated
+when another one is at least as good on every objective and better on one;
+the non-dominated engines form the skyline (rank 1), and peeling skylines off
+gives ranked non-dominated sets (rank 2, 3, ...).
+
+Objectives missing for one of the compared engines in a request (e.g. no
+robustness score for SPARQL) are left out for that request and listed in the
+report. Engines are chosen per request class, not globally.
+
+    python pareto_skyline.py [--methods "Web 1.0" RDFa ...] [--objectives server_ms loc ...]
+"""
+import argparse
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from benchmark_data import REQUESTS, load_results
+from chart_cache import chart_inputs
+from chart_renderers import heatmap_renderer
+from generate_complexity_charts import complexity_data
+from generate_distribution_charts import COLORS, engine_legend, request_grid
+from generate_loc_vs_performance import loc_data
+from generate_robustness_charts import robustness_scores
+from render_profile import save_figure
+
+# name: (axis label, True if larger is better)
+OBJECTIVES = {
+    'server_ms': ('Server (ms)', False),
+    'client_ms': ('Client (ms)', False),
+    'render_ms': ('Render (ms)', False),
+    'loc': ('LOC', False),
+    'complexity': ('Branches', False),
+    'robustness': ('Robustness', True),
+    'memory_kb': ('Memory (KiB)', False),
+}
+
+# Engines with code metrics (LOC, complexity), as in the LOC vs performance charts
+DEFAULT_METHODS = ['Web 1.0', 'RDFa', 'SPARQL Endpoint']
+
+# Request classes by algorithmic complexity (see generate_complexity_charts.py)
+REQUEST_CLASSES = {'Simple (R1-R3)': ['R1', 'R2', 'R3'],
+                   'Medium (R4-R8)': ['R4', 'R5', 'R6', 'R7', 'R8'],
+                   'Complex (R9-R10)': ['R9', 'R10']}
+
+SKYLINE_BLOCK = 256  # points checked against the skyline window at once
+
+# The code metric tables name the endpoint engine 'SPARQL'
+CODE_METHOD_NAMES = {'SPARQL': 'SPARQL Endpoint'}
+
+
+def _dominance_order(points):
+    """Indices sorted by the sum of per-objective ranks: no point dominates an earlier one"""
+    ranks = np.empty(points.shape, dtype=np.int64)
+    for column in range(points.shape[1]):
+        ranks[:, column] = np.searchsorted(np.unique(points[:, column]), points[:, column])
+    # lexsort: last key is the primary one
+    return np.lexsort(tuple(points.T[::-1]) + (ranks.sum(axis=1),))
+
+
+def skyline(points):
+    """Boolean mask of the non-dominated rows of points (n x d, smaller is better)
+
+    d = 2 is the O(n log n) sort-and-sweep. Otherwise sort-filter-skyline: a
+    presort on the sum of per-objective ranks (O(n log n)) guarantees that a
+    point can only be dominated by skyline points before it, so each point is
+    checked against the current skyline only, in one vectorized comparison.
+    """
+    points = np.asarray(points, dtype=float)
+    n, d = points.shape
+    mask = np.zeros(n, dtype=bool)
+    if not n:
+        return mask
+    if d == 1:
+        return points[:, 0] == points[:, 0].min()
+    if d == 2:
+        order = np.lexsort((points[:, 1], points[:, 0]))
+        best = np.inf
+        previous = None
+        for i in order:
+            x, y = points[i]
+            # Equal points dominate neither each other
+            if y < best or (previous is not None and (x, y) == previous):
+                mask[i] = True
+                best, previous = min(best, y), (x, y)
+        return mask
+
+    order = _dominance_order(points)
+    window = np.empty((n, d))
+    size = 0
+    for start in range(0, n, SKYLINE_BLOCK):
+        block = order[start:start + SKYLINE_BLOCK]
+        # Whole block against the skyline so far, then the survivors one by one
+        # against what this block adds
+        candidates = points[block]
+        if size:
+            skyline_points = window[None, :size]
+            dominated = np.any(np.all(skyline_points <= candidates[:, None], axis=2)
+                               & np.any(skyline_points < candidates[:, None], axis=2), axis=1)
+            block, candidates = block[~dominated], candidates[~dominated]
+        first = size
+        for i, point in zip(block, candidates):
+            added = window[first:size]
+            if np.any(np.all(added <= point, axis=1) & np.any(added < point, axis=1)):
+                continue
+            mask[i] = True
+            window[size] = point
+            size += 1
+    return mask
+
+
+def pareto_ranks(points):
+    """Non-dominated rank of every row (1 = skyline), by peeling successive skylines"""
+    points = np.asarray(points, dtype=float)
+    ranks = np.zeros(len(points), dtype=np.int64)
+    remaining = np.arange(len(points))
+    rank = 1
+    while len(remaining):
+        front = skyline(points[remaining])
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+    return ranks
+
+
+def objective_table(results=None):
+    """Every objective of every (question, method) cell, NaN where unknown"""
+    results = results or load_results()
+    columns = {}
+    for metric in [m for m in OBJECTIVES if m in results.metrics]:
+        columns[metric] = results.pivot(metric).stack()
+    for name, data in (('loc', loc_data), ('complexity', complexity_data),
+                       ('robustness', robustness_scores)):
+        columns[name] = pd.Series({(question, CODE_METHOD_NAMES.get(method, method)): value
+                                   for question, values in data.items()
+                                   for method, value in values.items()}, dtype=float)
+    table = pd.DataFrame(columns)
+    table.index.names = ['question', 'method']
+    return table.reindex(columns=[name for name in OBJECTIVES if name in table.columns])
+
+
+def rank_engines(table, methods=DEFAULT_METHODS, objectives=None):
+    """Pareto rank of each engine per request: (ranks frame, {question: objectives used})"""
+    objectives = [o for o in (objectives or OBJECTIVES) if o in table.columns]
+    rows, used = [], {}
+    questions = list(dict.fromkeys(table.index.get_level_values('question')))
+    for question in [q for q in REQUESTS if q in questions] + [q for q in questions if q not in REQUESTS]:
+        cell = table.loc[question].reindex(methods).dropna(how='all')
+        # Objectives known for every compared engine of this request
+        known = [o for o in objectives if cell[o].notna().all()]
+        if not known or cell.empty:
+            continue
+        used[question] = known
+        # Larger-is-better objectives are negated so every axis is minimized
+        points = np.column_stack([-cell[o] if OBJECTIVES[o][1] else cell[o] for o in known])
+        for method, rank in zip(cell.index, pareto_ranks(points)):
+            rows.append({'question': question, 'method': method, 'rank': int(rank)})
+    return pd.DataFrame(rows, columns=['question', 'method', 'rank']), used
+
+
+def _ranked(methods=DEFAULT_METHODS, objectives=None):
+    table = objective_table()
+    ranks, used = rank_engines(table, methods, objectives)
+    return table, ranks, used
+
+
+# ============================================================================
+# CHART 1: Parallel coordinates per request
+# ============================================================================
+@chart_inputs(objectives=objective_table, colors=COLORS, methods=DEFAULT_METHODS)
+def chart_parallel_coordinates(methods=DEFAULT_METHODS, objectives=None):
+    table, ranks, used = _ranked(methods, objectives)
+    requests = [q for q in REQUESTS if q in used]
+    fig, axes = request_grid(requests, 'Engines on Every Objective per Request (Parallel Coordinates)\n'
+                                       'Each axis scaled best (bottom) to worst (top); solid = skyline, '
+                                       'dashed = dominated')
+    for ax, req in zip(axes, requests):
+        known = used[req]
+        cell = table.loc[req].reindex(methods).dropna(how='all')[known]
+        oriented = cell.apply(lambda column: -column if OBJECTIVES[column.name][1] else column)
+        spread = (oriented.max() - oriented.min()).replace(0, 1)
+        scaled = (oriented - oriented.min()) / spread
+        cell_ranks = ranks[ranks['question'] == req].set_index('method')['rank']
+        for method in cell.index:
+            rank = cell_ranks[method]
+            ax.plot(range(len(known)), scaled.loc[method], color=COLORS.get(method, 'gray'),
+                    linewidth=2.5 if rank == 1 else 1.2, linestyle='-' if rank == 1 else '--',
+                    marker='o', markersize=4, alpha=0.9)
+        ax.set_xticks(range(len(known)))
+        ax.set_xticklabels([OBJECTIVES[o][0] for o in known], rotation=45, ha='right', fontsize=7)
+        ax.set_yticks([0, 1])
+        ax.set_yticklabels(['best', 'worst'], fontsize=8)
+        ax.set_ylim(-0.08, 1.08)
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.grid(axis='x', alpha=0.4)
+
+    engine_legend(fig, methods)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure('pareto_parallel_coordinates.png')
+    plt.close(fig)
+    print("[OK] Chart 1: pareto_parallel_coordinates.png")
+
+
+# ============================================================================
+# CHART 2: Pareto rank per request and engine
+# ============================================================================
+@chart_inputs(objectives=objective_table, methods=DEFAULT_METHODS)
+def chart_ranks(methods=DEFAULT_METHODS, objectives=None):
+    _, ranks, _ = _ranked(methods, objectives)
+    table = ranks.pivot(index='question', columns='method', values='rank')
+    table = table.reindex(index=[q for q in REQUESTS if q in table.index],
+                          columns=[m for m in methods if m in table.columns])
+    fig = heatmap_renderer(list(table.index), list(table.columns), cmap='RdYlGn_r', fmt='.0f').render(
+        table, 'Pareto Rank per Request (every objective known for the compared engines)\n'
+        '1 = on the skyline (not dominated)',
+        'Engine', 'Request', 'Non-dominated rank')
+    path = save_figure('pareto_ranks.png', fig)
+    print(f"[OK] Chart 2: {path}")
+
+
+def print_ranks(table, ranks, used):
+    print("="*80)
+    print("PARETO SKYLINE PER REQUEST (rank 1 = not dominated)")
+    print("="*80)
+    for question, known in used.items():
+        cell = ranks[ranks['question'] == question].sort_values('rank')
+        fronts = ' > '.join(', '.join(group['method']) for _, group in cell.groupby('rank'))
+        missing = [o for o in table.columns if o not in known]
+        print(f"{question:<4} {fronts}"
+              + (f"   (without {', '.join(missing)})" if missing else ''))
+
+    print("\n" + "="*80)
+    print("SKYLINE ENGINES PER REQUEST CLASS (requests where the engine is not dominated)")
+    print("="*80)
+    for name, questions in REQUEST_CLASSES.items():
+        front = ranks[ranks['question'].isin(questions) & (ranks['rank'] == 1)]
+        counts = front['method'].value_counts()
+        print(f"{name:<18} " + ', '.join(f"{method} {count}/{len(questions)}"
+                                         for method, count in counts.items()))
+
+
+CHARTS = {
+    'pareto_parallel_coordinates.png': chart_parallel_coordinates,
+    'pareto_ranks.png': chart_ranks,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--methods', nargs='+', default=DEFAULT_METHODS,
+                        help=f"engines to compare (default: {', '.join(DEFAULT_METHODS)})")
+    parser.add_argument('--objectives', nargs='+', choices=list(OBJECTIVES),
+                        help='objectives to use (default: all known)')
+    parser.add_argument('--charts', action='store_true',
+                        help='draw pareto_parallel_coordinates.png and pareto_ranks.png')
+    args = parser.parse_args(argv)
+
+    table, ranks, used = _ranked(args.methods, args.objectives)
+    print_ranks(table, ranks, used)
+    if args.charts:
+        chart_parallel_coordinates(args.methods, args.objectives)
+        chart_ranks(args.methods, args.objectives)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
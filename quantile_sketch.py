@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mergeable quantile sketch for latency samples
+An HDR-style histogram with log-spaced buckets: every value lands in a bucket
+at most 0.1% wide, so any quantile is known to 0.1% relative accuracy with
+memory proportional to the number of occupied buckets. Each bucket keeps its
+count and the sum of its values (the bucket mean is reported, which is exact
+when a bucket holds a single distinct value). Sketches of the same layout
+merge by adding buckets, so partial runs can be combined without the samples.
+"""
+import numpy as np
+
+GROWTH = 1.001   # bucket upper/lower bound ratio (0.1%)
+FLOOR = 1e-6     # ms; smaller values share the first bucket
+
+# Tail percentiles reported next to the median: (column suffix, quantile)
+PERCENTILES = [('p90', 0.90), ('p95', 0.95), ('p99', 0.99), ('p999', 0.999)]
+
+
+def bucket_of(values, growth=GROWTH, floor=FLOOR):
+    """Bucket index of each value"""
+    clipped = np.maximum(np.asarray(values, dtype=float), floor)
+    return np.floor(np.log(clipped / floor) / np.log(growth)).astype(np.int64)
+
+
+class LogHistogram:
+    """Log-bucketed histogram of non-negative values with mergeable state"""
+
+    def __init__(self, growth=GROWTH, floor=FLOOR):
+        self.growth = growth
+        self.floor = floor
+        self.buckets = {}  # bucket -> [count, sum of values]
+
+    @property
+    def count(self):
+        return sum(entry[0] for entry in self.buckets.values())
+
+    def add(self, values):
+        """Add an array of samples (vectorized per call)"""
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        buckets, inverse, counts = np.unique(bucket_of(values, self.growth, self.floor),
+                                             return_inverse=True, return_counts=True)
+        self.add_buckets(buckets, counts, np.bincount(inverse, weights=values))
+
+    def add_buckets(self, buckets, counts, sums):
+        """Add pre-bucketed counts and sums (bucket indices from bucket_of)"""
+        for bucket, count, total in zip(np.asarray(buckets).tolist(), np.asarray(counts).tolist(),
+                                        np.asarray(sums).tolist()):
+            entry = self.buckets.setdefault(bucket, [0, 0.0])
+            entry[0] += count
+            entry[1] += total
+
+    def merge(self, other):
+        """Add every bucket of other (same layout) into this sketch"""
+        if (other.growth, other.floor) != (self.growth, self.floor):
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        for bucket, (count, total) in other.buckets.items():
+            entry = self.buckets.setdefault(bucket, [0, 0.0])
+            entry[0] += count
+            entry[1] += total
+        return self
+
+    def _ranked(self):
+        order = sorted(self.buckets)
+        cumulative = np.cumsum([self.buckets[b][0] for b in order])
+        return order, cumulative
+
+    def _value_at(self, order, cumulative, rank):
+        count, total = self.buckets[order[int(np.searchsorted(cumulative, rank))]]
+        return total / count
+
+    def quantile(self, q):
+        """Nearest-rank q-quantile (0 < q <= 1); NaN when empty"""
+        if not self.buckets:
+            return float('nan')
+        order, cumulative = self._ranked()
+        rank = max(1, int(np.ceil(q * cumulative[-1])))
+        return self._value_at(order, cumulative, rank)
+
+    def median(self):
+        """Median, averaging the two middle ranks for even counts like statistics.median"""
+        if not self.buckets:
+            return float('nan')
+        order, cumulative = self._ranked()
+        total = cumulative[-1]
+        return (self._value_at(order, cumulative, (total + 1) // 2)
+                + self._value_at(order, cumulative, total // 2 + 1)) / 2
+
+    def cdf(self):
+        """(bucket values, cumulative fraction) in increasing order, for ECDF plots"""
+        order = sorted(self.buckets)
+        counts = np.array([self.buckets[b][0] for b in order], dtype=float)
+        sums = np.array([self.buckets[b][1] for b in order])
+        return sums / counts, np.cumsum(counts) / counts.sum()
+
+    def quantiles(self, qs):
+        """Vectorized nearest-rank quantiles for an array of q (e.g. a percentile spectrum)"""
+        values, cumulative = self.cdf()
+        # Small tolerance so q * N landing exactly on a rank is not pushed to the next one
+        positions = np.searchsorted(cumulative, np.asarray(qs, dtype=float) - 1e-12)
+        return values[np.minimum(positions, len(values) - 1)]
+
+    def density(self, edges):
+        """Sample fraction per bin of edges (values re-binned from the buckets)"""
+        values, cumulative = self.cdf()
+        weights = np.diff(np.r_[0.0, cumulative])
+        return np.histogram(values, bins=edges, weights=weights)[0]
+
+    def to_dict(self):
+        """JSON-serializable state"""
+        return {'growth': self.growth, 'floor': self.floor,
+                'buckets': [[b, c, s] for b, (c, s) in sorted(self.buckets.items())]}
+
+    @classmethod
+    def from_dict(cls, state):
+        sketch = cls(state['growth'], state['floor'])
+        sketch.buckets = {b: [c, s] for b, c, s in state['buckets']}
+        return sketch
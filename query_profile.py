@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Queries per request and N+1 query detection
+The Knowledge Graph R9 slowdown (397 ms against 5.64 ms) came from issuing
+one SPARQL query per top-6 team instead of one aggregated query. QueryCounter
+wraps query execution (rdflib Graph.query and the endpoint client of
+reference_engines.py) and counts, per request: queries, queries of the same
+shape (the text with its literals and numbers blanked out) and result rows
+returned. A shape repeated N_PLUS_ONE times or more within one request is
+flagged as an N+1 pattern.
+
+benchmark_runner.py --queries adds the count as a queries_per_request metric
+row to the results and saves the per-request profile to benchmark_queries.csv;
+the report and chart below read that profile.
+
+    python query_profile.py profile [--dataset dataset]   # one pass over every request
+    python query_profile.py report [benchmark_queries.csv]
+"""
+import argparse
+import collections
+import contextlib
+import functools
+import os
+import re
+import sys
+import threading
+
+import pandas as pd
+
+from chart_cache import chart_inputs
+from chart_renderers import heatmap_renderer
+from render_profile import save_figure
+from results_store import CSV_SEPARATOR
+from sample_ingest import file_signature
+
+QUERIES_METRIC = 'queries_per_request'
+PROFILE_CSV = 'benchmark_queries.csv'
+PROFILE_COLUMNS = ['question', 'method', 'queries', 'shapes', 'max_repeats', 'rows',
+                   'n_plus_one', 'repeated_shape']
+
+N_PLUS_ONE = 3  # same-shape queries in one request from which it is flagged
+
+# IRIs are kept (they name the pattern); string and number literals are blanked
+_TOKENS = re.compile(r'(<[^<>\s]*>)|"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|(?<![\w:?$])\d+(?:\.\d+)?\b')
+_PREFIXES = re.compile(r'^\s*(?:PREFIX\s+[\w-]*:\s*<[^>]*>\s*)+', re.IGNORECASE)
+_SPACES = re.compile(r'\s+')
+
+
+def query_shape(text):
+    """Query text without PREFIX lines, literals replaced by ?, whitespace collapsed"""
+    text = _TOKENS.sub(lambda match: match.group(1) or '?', _PREFIXES.sub('', text))
+    return _SPACES.sub(' ', text).strip()
+
+
+def _rows(result):
+    try:
+        return len(result)
+    except TypeError:  # a lazy result: count without consuming it twice
+        return None
+
+
+def summarize(queries):
+    """Counts of one request's [(text, result), ...]"""
+    shapes = collections.Counter(query_shape(text) for text, _ in queries)
+    shape, repeats = shapes.most_common(1)[0] if shapes else ('', 0)
+    rows = [_rows(result) for _, result in queries]
+    return {'queries': len(queries), 'shapes': len(shapes), 'max_repeats': repeats,
+            'rows': sum(r for r in rows if r is not None),
+            'n_plus_one': repeats >= N_PLUS_ONE, 'repeated_shape': shape if repeats > 1 else ''}
+
+
+def default_targets():
+    """(owner, attribute) of every query entry point that is importable"""
+    targets = []
+    try:
+        import rdflib
+        targets.append((rdflib.Graph, 'query'))
+    except ImportError:
+        pass
+    from reference_engines import EndpointClient
+    targets.append((EndpointClient, 'query'))
+    return targets
+
+
+class QueryCounter:
+    """Counts the queries run inside count() blocks while installed
+
+        with QueryCounter() as counter:
+            with counter.count() as queries:
+                engine.run('R9')
+            queries['queries'], queries['max_repeats']   # filled once the block exits
+
+    Only the query text and result object are kept while the block runs;
+    shapes and row counts are computed on exit, outside any timing. Queries
+    from other threads (e.g. a stand-in endpoint answering) are not counted.
+    """
+
+    def __init__(self, targets=None):
+        self.targets = targets
+        self._originals = []
+        self._queries = None
+        self._thread = None
+
+    def _wrap(self, original):
+        counter = self
+
+        @functools.wraps(original)
+        def query(owner, text, *args, **kwargs):
+            result = original(owner, text, *args, **kwargs)
+            if counter._queries is not None and threading.get_ident() == counter._thread:
+                counter._queries.append((str(text), result))
+            return result
+        return query
+
+    def install(self):
+        for owner, attribute in (default_targets() if self.targets is None else self.targets):
+            original = getattr(owner, attribute)
+            self._originals.append((owner, attribute, original))
+            setattr(owner, attribute, self._wrap(original))
+        return self
+
+    def uninstall(self):
+        for owner, attribute, original in reversed(self._originals):
+            setattr(owner, attribute, original)
+        self._originals = []
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+    @contextlib.contextmanager
+    def count(self):
+        """Yield a dict that holds the block's summarize() counts once it exits"""
+        stats = {}
+        self._queries = []
+        self._thread = threading.get_ident()
+        try:
+            yield stats
+        finally:
+            queries, self._queries = self._queries, None
+            stats.update(summarize(queries))
+
+
+def profile_frame(profiles):
+    """{(question, method): summarize() counts} -> PROFILE_COLUMNS frame"""
+    rows = [{'question': question, 'method': method, **stats}
+            for (question, method), stats in profiles.items()]
+    return pd.DataFrame(rows, columns=PROFILE_COLUMNS)
+
+
+def write_profile(frame, path=PROFILE_CSV):
+    frame.to_csv(path, sep=CSV_SEPARATOR, index=False)
+
+
+def read_profile(path=PROFILE_CSV):
+    return pd.read_csv(path, sep=CSV_SEPARATOR, keep_default_na=False)
+
+
+def profile_signature():
+    return file_signature([PROFILE_CSV])
+
+
+def profile_engines(engines, questions):
+    """Run every request once per engine under a QueryCounter; returns the profile frame"""
+    profiles = {}
+    with QueryCounter() as counter:
+        for engine in engines:
+            for question in questions:
+                with counter.count() as stats:
+                    engine.run(question)
+                profiles[(question, engine.method)] = stats
+    return profile_frame(profiles)
+
+
+# ============================================================================
+# CHART 1: Queries per request, N+1 cells marked
+# ============================================================================
+@chart_inputs(profile=profile_signature, threshold=N_PLUS_ONE)
+def chart_queries():
+    profile = read_profile()
+    # Engines that issue queries only (the HTML engines never do)
+    profile = profile[profile.groupby('method')['queries'].transform('sum') > 0]
+    table = profile.pivot(index='question', columns='method', values='queries')
+    table = table.reindex(index=list(dict.fromkeys(profile['question'])),
+                          columns=list(dict.fromkeys(profile['method'])))
+    flags = profile.pivot(index='question', columns='method', values='n_plus_one').reindex_like(table)
+    # Engines profiled on only some requests leave NaN cells: shown blank
+    annot = table.astype('Int64').astype(str).replace('<NA>', '')
+    annot = annot + flags.astype('boolean').fillna(False).map(lambda flag: ' N+1' if flag else '')
+    fig = heatmap_renderer(list(table.index), list(table.columns), cmap='Reds', fmt='').render(
+        table, f'SPARQL Queries per Request\n'
+               f'N+1 = one query shape repeated {N_PLUS_ONE}+ times in a request',
+        'Engine', 'Request', 'Queries', annot=annot)
+    path = save_figure('queries_per_request.png', fig)
+    print(f"[OK] Chart 1: {path}")
+
+
+def print_report(profile):
+    print("="*80)
+    print(f"QUERIES PER REQUEST (N+1 = a shape repeated {N_PLUS_ONE}+ times)")
+    print("="*80)
+    print(f"{'Request':<8}{'Engine':<17}{'Queries':>8}{'Shapes':>8}{'Repeats':>8}{'Rows':>8}")
+    queried = profile[profile['queries'] > 0]
+    for row in queried.itertuples():
+        print(f"{row.question:<8}{row.method:<17}{row.queries:8d}{row.shapes:8d}"
+              f"{row.max_repeats:8d}{row.rows:8d}" + ('   N+1' if row.n_plus_one else ''))
+    flagged = queried[queried['n_plus_one']]
+    if flagged.empty:
+        print("\nNo N+1 query pattern.")
+        return
+    print(f"\n{len(flagged)} N+1 pattern(s): aggregate these into one query")
+    for row in flagged.itertuples():
+        print(f"  {row.question} {row.method}: {row.max_repeats}x {row.repeated_shape[:150]}")
+
+
+def query_charts():
+    if profile_signature():
+        return {'queries_per_request.png': chart_queries}
+    return {}
+
+
+CHARTS = query_charts()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('command', choices=['profile', 'report'])
+    parser.add_argument('path', nargs='?', default=PROFILE_CSV, help=f'profile CSV (default: {PROFILE_CSV})')
+    parser.add_argument('--dataset', help='league_dataset.py output for profile (default: dataset)')
+    parser.add_argument('--season')
+    parser.add_argument('--charts', action='store_true', help='draw queries_per_request.png')
+    args = parser.parse_args(argv)
+
+    if args.command == 'profile':
+        from benchmark_data import REQUESTS
+        from reference_engines import DATASET, SEASON, ensure_dataset, open_engines
+
+        dataset = args.dataset or DATASET
+        ensure_dataset(dataset)
+        engines = open_engines(dataset=dataset, season=args.season or SEASON)
+        try:
+            profile = profile_engines(engines, REQUESTS)
+        finally:
+            for engine in engines:
+                engine.close()
+        write_profile(profile, args.path)
+        print(f"[OK] query profile -> {args.path}")
+    elif not os.path.exists(args.path):
+        print(f"No {args.path}: run 'python query_profile.py profile' or "
+              "'python benchmark_runner.py --queries ...' first")
+        return 1
+    else:
+        profile = read_profile(args.path)
+
+    print_report(profile)
+    if args.charts:
+        chart_queries()
+    return 1 if profile['n_plus_one'].any() else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
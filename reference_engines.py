@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reference implementations of R1-R10 for the four engines
+Offline versions of the benchmarked functions (function_comparison_metrics.md)
+over a league_dataset.py dataset, all behind one Engine interface:
+
+    Web 1.0          DOM scraping of web1/<season>/ by position (BeautifulSoup)
+    RDFa             the same pages read through their RDFa properties
+    Knowledge Graph  SPARQL on an in-memory rdflib graph of knowledge_graph.ttl
+    SPARQL Endpoint  the same queries over HTTP, to a local stand-in endpoint
+                     (rdflib on endpoint.nt) or to a real one (--endpoint URL)
+
+They follow the shapes that were measured, including R9 querying the away
+matches of each top-6 team separately, so optimizations can be checked and
+timed in-tree without network access or Fuseki. beautifulsoup4 and rdflib are
+optional: engines whose library is missing are skipped.
+
+    python reference_engines.py check [--dataset dataset] [--season 2008-2009]
+    python reference_engines.py run R9 [--methods RDFa ...]
+    python reference_engines.py bench [R1 ...] [-- benchmark_runner.py options]
+"""
+import abc
+import argparse
+import functools
+import glob
+import http.client
+import json
+import os
+import re
+import sys
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # optional: only the HTML engines need it
+    BeautifulSoup = None
+
+try:
+    import rdflib
+except ImportError:  # optional: only the SPARQL engines need it
+    rdflib = None
+
+from benchmark_data import METHODS, REQUESTS
+from calibration import StandInServer
+from league_dataset import BASE_IRI, MANIFEST, NTRIPLES_FILE, SCHEMA, TURTLE_FILE, generate, slug
+
+DATASET = 'dataset'
+SEASON = '2008-2009'
+
+# Parameters of the benchmarked requests
+TEAM = 'Manchester United'  # R7
+GOALS_THRESHOLD = 70        # R5
+MONTH = 11                  # R6: November of the season's first year
+TOP = 6                     # R9
+
+FUNCTION_NAMES = {
+    'R1': 'getFirstTeamInClassment', 'R2': 'getNumberOfMatchesPlayedThisSeason',
+    'R3': 'getNumberOfGoals', 'R4': 'getTeamWithMostGoals', 'R5': 'getTeamsOver70Goals',
+    'R6': 'getMatchesNovember2008', 'R7': 'getManchesterUnitedHomeWins',
+    'R8': 'getRankingByAwayWins', 'R9': 'getAwayGoalsForTop6',
+    'R10': 'getConfrontationsFirstVsThird',
+}
+
+# Requests whose result is a set of rows (compared regardless of order)
+UNORDERED = {'R5', 'R6', 'R10'}
+
+
+def _score(text):
+    """'2-1' -> (2, 1)"""
+    home, _, away = text.partition('-')
+    return int(home), int(away)
+
+
+def _number(text):
+    return int(re.search(r'\d+', text).group())
+
+
+class Engine:
+    """R1-R10 of one engine over one season of a dataset
+
+    Results: R1/R4 a team name, R2/R3/R7 a count, R5 team names, R6/R10
+    (date, home, score, away) rows, R8 (team, away wins) by decreasing wins
+    then name, R9 (team, away goals) in standings order.
+    """
+
+    method = None
+
+    def __init__(self, dataset=DATASET, season=SEASON):
+        self.dataset = dataset
+        self.season = season
+        self.year = int(season[:4])
+        self.month = f'{self.year}-{MONTH:02d}'
+
+    def open(self):
+        return self
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def run(self, question):
+        return getattr(self, question.lower())()
+
+
+# ============================================================================
+# HTML engines
+# ============================================================================
+class HtmlEngine(Engine):
+    """Pages are read and parsed on every call, as the scrapers did"""
+
+    directory = None
+
+    def open(self):
+        if BeautifulSoup is None:
+            raise ImportError(f"{self.method} needs beautifulsoup4: pip install beautifulsoup4")
+        return self
+
+    def soup(self, *path):
+        with open(os.path.join(self.dataset, self.directory, self.season, *path), encoding='utf-8') as f:
+            return BeautifulSoup(f.read(), 'html.parser')
+
+    def team_pages(self):
+        return sorted(glob.glob(os.path.join(self.dataset, self.directory, self.season, 'teams', '*.html')))
+
+
+class Web1Engine(HtmlEngine):
+    """Positional DOM scraping: table rows, column indices, div and paragraph order"""
+
+    method = 'Web 1.0'
+    directory = 'web1'
+
+    def _standings(self):
+        return self.soup('index.html').find('table').find_all('tr')[1:]
+
+    def _calendar(self):
+        for row in self.soup('calendar.html').find('table').find_all('tr')[1:]:
+            yield tuple(td.get_text(strip=True) for td in row.find_all('td'))
+
+    def r1(self):
+        return self._standings()[0].find_all('td')[1].get_text(strip=True)
+
+    def _stat(self, box, paragraph):
+        boxes = self.soup('index.html').find_all('div', class_='stat-box')
+        return _number(boxes[box].find_all('p')[paragraph].get_text())
+
+    def r2(self):
+        return self._stat(0, 0)
+
+    def r3(self):
+        return self._stat(0, 1)
+
+    def r4(self):
+        boxes = self.soup('index.html').find_all('div', class_='stat-box')
+        return boxes[1].find('strong').get_text(strip=True)
+
+    def r5(self):
+        teams = []
+        for row in self._standings():
+            cols = row.find_all('td')
+            if int(cols[7].get_text(strip=True)) > GOALS_THRESHOLD:
+                teams.append(cols[1].get_text(strip=True))
+        return teams
+
+    def r6(self):
+        return [match for match in self._calendar() if match[0].startswith(self.month)]
+
+    def r7(self):
+        soup = self.soup('teams', f'{slug(TEAM)}.html')
+        return sum(1 for p in soup.find('div').find_all('p')
+                   if 'Domicile' in p.get_text() and 'Victoire' in p.get_text())
+
+    def r8(self):
+        ranking = []
+        for path in self.team_pages():
+            with open(path, encoding='utf-8') as f:
+                soup = BeautifulSoup(f.read(), 'html.parser')
+            wins = sum(1 for p in soup.find('div').find_all('p')
+                       if 'Extérieur' in p.get_text() and 'Victoire' in p.get_text())
+            ranking.append((soup.find('h1').get_text(strip=True), wins))
+        return sorted(ranking, key=lambda item: (-item[1], item[0]))
+
+    def r9(self):
+        goals = {row.find_all('td')[1].get_text(strip=True): 0 for row in self._standings()[:TOP]}
+        for _, _, score, away in self._calendar():
+            if away in goals:
+                goals[away] += _score(score)[1]
+        return list(goals.items())
+
+    def r10(self):
+        rows = self._standings()
+        first = rows[0].find_all('td')[1].get_text(strip=True)
+        third = rows[2].find_all('td')[1].get_text(strip=True)
+        return [match for match in self._calendar() if {match[1], match[3]} == {first, third}]
+
+
+class RdfaEngine(HtmlEngine):
+    """The same pages through typeof/property annotations (text matching where the markup stops)"""
+
+    method = 'RDFa'
+    directory = 'rdfa'
+
+    @staticmethod
+    def _property(element, name):
+        return element.find(attrs={'property': name}).get_text(strip=True)
+
+    def _teams(self):
+        return self.soup('index.html').find_all('tr', attrs={'typeof': 'SportsTeam'})
+
+    def _events(self):
+        for event in self.soup('calendar.html').find_all('tr', attrs={'typeof': 'SportsEvent'}):
+            yield tuple(self._property(event, name) for name in ('startDate', 'homeTeam', 'score', 'awayTeam'))
+
+    def r1(self):
+        return self._property(self._teams()[0], 'name')
+
+    def _stat(self, label):
+        for box in self.soup('index.html').find_all('div', class_='stat-box'):
+            for p in box.find_all('p'):
+                if label in p.get_text():
+                    return _number(p.get_text())
+        return None
+
+    def r2(self):
+        return self._stat('Nombre total de matchs')
+
+    def r3(self):
+        return self._stat('Nombre total de buts')
+
+    def r4(self):
+        best = max(self._teams(), key=lambda team: int(self._property(team, 'goalsScored')))
+        return self._property(best, 'name')
+
+    def r5(self):
+        return [self._property(team, 'name') for team in self._teams()
+                if int(self._property(team, 'goalsScored')) > GOALS_THRESHOLD]
+
+    def r6(self):
+        return [event for event in self._events() if event[0].startswith(self.month)]
+
+    def _wins(self, soup, venue):
+        return sum(1 for event in soup.find_all(attrs={'typeof': 'SportsEvent'})
+                   if venue in event.get_text() and 'Victoire' in event.get_text())
+
+    def r7(self):
+        return self._wins(self.soup('teams', f'{slug(TEAM)}.html'), 'Domicile')
+
+    def r8(self):
+        ranking = []
+        for path in self.team_pages():
+            with open(path, encoding='utf-8') as f:
+                soup = BeautifulSoup(f.read(), 'html.parser')
+            ranking.append((self._property(soup, 'name'), self._wins(soup, 'Extérieur')))
+        return sorted(ranking, key=lambda item: (-item[1], item[0]))
+
+    def r9(self):
+        goals = {self._property(team, 'name'): 0 for team in self._teams()[:TOP]}
+        for _, _, score, away in self._events():
+            if away in goals:
+                goals[away] += _score(score)[1]
+        return list(goals.items())
+
+    def r10(self):
+        teams = self._teams()
+        pair = {self._property(teams[0], 'name'), self._property(teams[2], 'name')}
+        return [event for event in self._events() if {event[1], event[3]} == pair]
+
+
+# ============================================================================
+# SPARQL engines (same queries, in memory or over HTTP)
+# ============================================================================
+PREFIXES = f'PREFIX schema: <{SCHEMA}>\nPREFIX xsd: <http://www.w3.org/2001/XMLSchema#>\n'
+
+
+def _string(value):
+    """SPARQL string literal"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+class SparqlEngine(Engine, abc.ABC):
+    """R1-R10 as SPARQL queries; select() runs one and returns rows of strings"""
+
+    def __init__(self, dataset=DATASET, season=SEASON):
+        super().__init__(dataset, season)
+        self.season_iri = f'<{BASE_IRI}{self.year}/season>'
+
+    @abc.abstractmethod
+    def select(self, query):
+        """Bindings of a SELECT query (PREFIXES added): [{variable: value}]"""
+
+    def _teams(self, condition=''):
+        """Names of the season's teams in standings order"""
+        rows = self.select(f"""
+            SELECT ?name ?goals WHERE {{
+                ?team a schema:SportsTeam ; schema:memberOf {self.season_iri} ;
+                      schema:name ?name ; schema:position ?position ; schema:goalsScored ?goals .
+                {condition}
+            }} ORDER BY xsd:integer(?position)""")
+        return [row['name'] for row in rows]
+
+    def _matches(self, condition):
+        return [(row['date'], row['home'], row['score'], row['away']) for row in self.select(f"""
+            SELECT ?date ?home ?score ?away WHERE {{
+                ?event schema:superEvent {self.season_iri} ; schema:startDate ?date ;
+                       schema:score ?score ; schema:homeTeam/schema:name ?home ;
+                       schema:awayTeam/schema:name ?away .
+                {condition}
+            }} ORDER BY ?date""")]
+
+    def r1(self):
+        return self._teams('FILTER(?position = "1")')[0]
+
+    def r2(self):
+        return int(self.select(f"""
+            SELECT (COUNT(?event) AS ?matches) WHERE {{
+                ?event a schema:SportsEvent ; schema:superEvent {self.season_iri} .
+            }}""")[0]['matches'])
+
+    def r3(self):
+        return int(self.select(f"""
+            SELECT (SUM(xsd:integer(?goals)) AS ?total) WHERE {{
+                ?team schema:memberOf {self.season_iri} ; schema:goalsScored ?goals .
+            }}""")[0]['total'])
+
+    def r4(self):
+        return self.select(f"""
+            SELECT ?name WHERE {{
+                ?team a schema:SportsTeam ; schema:memberOf {self.season_iri} ;
+                      schema:name ?name ; schema:position ?position ; schema:goalsScored ?goals .
+            }} ORDER BY DESC(xsd:integer(?goals)) xsd:integer(?position) LIMIT 1""")[0]['name']
+
+    def r5(self):
+        return self._teams(f'FILTER(xsd:integer(?goals) > {GOALS_THRESHOLD})')
+
+    def r6(self):
+        return self._matches(f'FILTER(REGEX(?date, "^{self.month}"))')
+
+    def r7(self):
+        return int(self.select(f"""
+            SELECT (COUNT(?event) AS ?wins) WHERE {{
+                ?event schema:superEvent {self.season_iri} ; schema:score ?score ;
+                       schema:homeTeam/schema:name {_string(TEAM)} .
+                FILTER(xsd:integer(STRBEFORE(?score, "-")) > xsd:integer(STRAFTER(?score, "-")))
+            }}""")[0]['wins'])
+
+    def r8(self):
+        rows = self.select(f"""
+            SELECT ?name (SUM(IF(xsd:integer(STRAFTER(?score, "-")) > xsd:integer(STRBEFORE(?score, "-")),
+                                 1, 0)) AS ?wins) WHERE {{
+                ?event schema:superEvent {self.season_iri} ; schema:score ?score ;
+                       schema:awayTeam/schema:name ?name .
+            }} GROUP BY ?name ORDER BY DESC(?wins) ?name""")
+        return [(row['name'], int(row['wins'])) for row in rows]
+
+    def r9(self):
+        # One query for the top teams, then one per team (the measured shape)
+        goals = []
+        for name in self._teams(f'FILTER(xsd:integer(?position) <= {TOP})'):
+            rows = self.select(f"""
+                SELECT ?score WHERE {{
+                    ?event schema:superEvent {self.season_iri} ; schema:score ?score ;
+                           schema:awayTeam/schema:name {_string(name)} .
+                }}""")
+            goals.append((name, sum(_score(row['score'])[1] for row in rows)))
+        return goals
+
+    def r10(self):
+        first, third = self._teams('FILTER(?position IN ("1", "3"))')
+        return self._matches(f'FILTER((?home = {_string(first)} && ?away = {_string(third)}) || '
+                             f'(?home = {_string(third)} && ?away = {_string(first)}))')
+
+
+def _require_rdflib(method):
+    if rdflib is None:
+        raise ImportError(f"{method} needs rdflib: pip install rdflib")
+
+
+class KnowledgeGraphEngine(SparqlEngine):
+    """Queries on an in-memory rdflib graph (loaded once, on open)"""
+
+    method = 'Knowledge Graph'
+
+    def __init__(self, dataset=DATASET, season=SEASON):
+        super().__init__(dataset, season)
+        self.graph = None
+
+    def open(self):
+        _require_rdflib(self.method)
+        self.graph = rdflib.Graph()
+        self.graph.parse(os.path.join(self.dataset, TURTLE_FILE), format='turtle')
+        return self
+
+    def select(self, query):
+        return [{name: str(value) for name, value in row.asdict().items()}
+                for row in self.graph.query(PREFIXES + query)]
+
+
+def endpoint_handler(graph):
+    """Request handler answering SPARQL protocol GETs (?query=) on graph with JSON results"""
+    class SparqlHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive, like a real endpoint
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            query = parse_qs(urlsplit(self.path).query).get('query')
+            if not query:
+                self.send_error(400, 'Missing query parameter')
+                return
+            body = graph.query(query[0]).serialize(format='json')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/sparql-results+json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+    return SparqlHandler
+
+
+class EndpointClient:
+    """SPARQL protocol client on one keep-alive connection"""
+
+    def __init__(self, url, timeout=60):
+        parts = urlsplit(url)
+        self.path = parts.path or '/'
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+
+    def query(self, text):
+        """Bindings of a SELECT query: [{variable: value}]"""
+        self.connection.request('GET', f'{self.path}?{urlencode({"query": text})}',
+                                headers={'Accept': 'application/sparql-results+json'})
+        response = self.connection.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise RuntimeError(f"SPARQL endpoint: HTTP {response.status}: {body[:200]!r}")
+        return [{name: binding['value'] for name, binding in row.items()}
+                for row in json.loads(body)['results']['bindings']]
+
+    def close(self):
+        self.connection.close()
+
+
+class SparqlEndpointEngine(SparqlEngine):
+    """Queries over HTTP: to url, or to a local stand-in serving endpoint.nt"""
+
+    method = 'SPARQL Endpoint'
+
+    def __init__(self, dataset=DATASET, season=SEASON, url=None):
+        super().__init__(dataset, season)
+        self.url = url
+        self.server = None
+        self.client = None
+
+    def open(self):
+        url = self.url
+        if url is None:
+            _require_rdflib(self.method)
+            graph = rdflib.Graph()
+            graph.parse(os.path.join(self.dataset, NTRIPLES_FILE), format='nt')
+            self.server = StandInServer(endpoint_handler(graph)).start()
+            url = f'{self.server.url}sparql'
+        self.client = EndpointClient(url)
+        return self
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+        if self.server is not None:
+            self.server.stop()
+        self.client = self.server = None
+
+    def select(self, query):
+        return self.client.query(PREFIXES + query)
+
+    def r9(self):
+        # The endpoint's R9 is one aggregate query (GROUP BY), not one query per team
+        rows = self.select(f"""
+            SELECT ?name ?rank (SUM(xsd:integer(STRAFTER(?score, "-"))) AS ?goals) WHERE {{
+                ?team a schema:SportsTeam ; schema:memberOf {self.season_iri} ;
+                      schema:name ?name ; schema:position ?position .
+                BIND(xsd:integer(?position) AS ?rank)
+                FILTER(?rank <= {TOP})
+                ?event schema:superEvent {self.season_iri} ; schema:score ?score ;
+                       schema:awayTeam ?team .
+            }} GROUP BY ?name ?rank ORDER BY ?rank""")
+        return [(row['name'], int(row['goals'])) for row in rows]
+
+
+ENGINES = {engine.method: engine for engine in
+           (Web1Engine, RdfaEngine, KnowledgeGraphEngine, SparqlEndpointEngine)}
+
+
+def ensure_dataset(dataset=DATASET):
+    """Generate the base league (league_dataset.py defaults) if dataset has none"""
+    if not os.path.exists(os.path.join(dataset, MANIFEST)):
+        generate(dataset)
+        print(f"[OK] generated the base league in {dataset}/")
+
+
+def open_engines(methods=METHODS, dataset=DATASET, season=SEASON, endpoint=None):
+    """Opened engines of methods; those whose library is missing are reported and skipped"""
+    engines = []
+    for method in methods:
+        options = {'url': endpoint} if method == SparqlEndpointEngine.method else {}
+        try:
+            engines.append(ENGINES[method](dataset, season, **options).open())
+        except ImportError as exc:
+            print(f"[SKIP] {exc}")
+    return engines
+
+
+def register_targets(engines, questions=REQUESTS):
+    """Register every (request, engine) pair with benchmark_runner.py (server_ms = the call)"""
+    from benchmark_runner import CallableTarget, register
+
+    for engine in engines:
+        for question in questions:
+            register(CallableTarget(question, engine.method, functools.partial(engine.run, question)))
+
+
+def _normalized(question, result):
+    return sorted(result) if question in UNORDERED else result
+
+
+def check(engines, questions=REQUESTS):
+    """Requests where an engine disagrees with the first one: {question: [method, ...]}"""
+    mismatches = {}
+    for question in questions:
+        results = [(engine.method, _normalized(question, engine.run(question))) for engine in engines]
+        reference = results[0][1]
+        different = [method for method, result in results[1:] if result != reference]
+        if different:
+            mismatches[question] = different
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('command', choices=['check', 'run', 'bench'])
+    parser.add_argument('questions', nargs='*', default=REQUESTS, metavar='REQUEST')
+    parser.add_argument('--dataset', default=DATASET,
+                        help=f'league_dataset.py output (default: {DATASET}, generated if missing)')
+    parser.add_argument('--season', default=SEASON)
+    parser.add_argument('--methods', nargs='+', choices=list(ENGINES), default=METHODS)
+    parser.add_argument('--endpoint', metavar='URL',
+                        help='real SPARQL endpoint (default: a local stand-in on endpoint.nt)')
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Options after -- go to benchmark_runner.py (bench)
+    split = argv.index('--') if '--' in argv else len(argv)
+    args = parser.parse_args(argv[:split])
+    runner_args = argv[split + 1:]
+    unknown = [q for q in args.questions if q not in REQUESTS]
+    if unknown:
+        parser.error(f"unknown requests {unknown}, expected some of {REQUESTS}")
+
+    ensure_dataset(args.dataset)
+    engines = open_engines(args.methods, args.dataset, args.season, args.endpoint)
+    if not engines:
+        return 1
+    try:
+        if args.command == 'run':
+            for question in args.questions:
+                print(f"{question} {FUNCTION_NAMES[question]}()")
+                for engine in engines:
+                    print(f"  {engine.method:<17} {engine.run(question)}")
+        elif args.command == 'check':
+            mismatches = check(engines, args.questions)
+            for question in args.questions:
+                status = f"differs: {', '.join(mismatches[question])}" if question in mismatches else 'agree'
+                print(f"{question:<4} {FUNCTION_NAMES[question]:<36} {status}")
+            print(f"\n{len(args.questions) - len(mismatches)}/{len(args.questions)} requests agree "
+                  f"across {', '.join(engine.method for engine in engines)}")
+            return 1 if mismatches else 0
+        else:
+            import benchmark_runner
+            register_targets(engines, args.questions)
+            return benchmark_runner.main(runner_args)
+    finally:
+        for engine in engines:
+            engine.close()
+    return 0
+
+
+if __name__ == '__main__':
+    # query_profile.py instruments reference_engines.EndpointClient: use this module for it
+    sys.modules.setdefault('reference_engines', sys.modules['__main__'])
+    sys.exit(main())
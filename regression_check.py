@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run-to-run performance regression check
+Compares a candidate result set against a baseline, cell by cell
+(question, method, metric). A cell regresses when its mean grew by more than
+the noise of both runs allows, SIGMA standard errors of the difference
+(stdev / sqrt(iterations) of each side), and by at least MIN_CHANGE of the
+baseline so huge sample counts do not flag sub-percent drifts. Either side
+can be a results CSV (benchmark_results.csv schema, ITERATIONS iterations per
+cell) or raw samples (.samples / .jsonl, with their actual counts).
+
+    python regression_check.py baseline.csv candidate.csv [--chart]
+    python regression_check.py old.samples new.samples
+
+Prints the ranked delta table and exits with status 1 if any cell regressed,
+so engine changes can be gated on it.
+"""
+import argparse
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from chart_renderers import heatmap_renderer
+from generate_distribution_charts import METRIC_LABELS
+from render_profile import save_figure
+from results_store import KEY_COLUMNS, read_csv
+from sample_ingest import METRICS, ingest
+
+SIGMA = 3.0          # standard errors of the difference (~0.3% false alarms per cell)
+MIN_CHANGE = 0.05    # minimum relative change of the mean worth flagging
+ITERATIONS = 100     # iterations behind each CSV row (see README methodology)
+
+REGRESSED, IMPROVED, UNCHANGED = 'regressed', 'improved', 'unchanged'
+
+
+def load_run(path, iterations=ITERATIONS):
+    """Mean, stdev and sample count per cell from a results CSV or a raw sample file"""
+    if path.endswith('.csv'):
+        frame = read_csv(path)
+        frame = frame[KEY_COLUMNS + ['mean_ms', 'stdev_ms']].copy()
+        frame['count'] = iterations
+    else:
+        aggregator = ingest([path])
+        frame = aggregator.to_frame()[KEY_COLUMNS + ['mean_ms', 'stdev_ms']]
+        counts = dict(zip(aggregator.keys, aggregator.count.tolist()))
+        frame = frame.assign(count=[counts[key] for key in
+                                    frame[KEY_COLUMNS].itertuples(index=False, name=None)])
+    return frame.astype({col: str for col in KEY_COLUMNS})
+
+
+def compare(baseline, candidate, sigma=SIGMA, min_change=MIN_CHANGE):
+    """Per-cell deltas ranked from worst regression to best improvement
+
+    Cells present in only one run are dropped. noise is the standard error of
+    the difference of means; z = delta / noise.
+    """
+    cells = baseline.merge(candidate, on=KEY_COLUMNS, suffixes=('_base', '_new'))
+    delta = cells['mean_ms_new'] - cells['mean_ms_base']
+    noise = np.sqrt(cells['stdev_ms_base'] ** 2 / cells['count_base']
+                    + cells['stdev_ms_new'] ** 2 / cells['count_new'])
+    threshold = np.maximum(sigma * noise, min_change * cells['mean_ms_base'])
+
+    table = cells[KEY_COLUMNS].assign(
+        base_ms=cells['mean_ms_base'], new_ms=cells['mean_ms_new'], delta_ms=delta,
+        change=delta / cells['mean_ms_base'],
+        z=delta / noise.where(noise > 0),
+        threshold_ms=threshold)
+    table['status'] = np.select([delta > threshold, delta < -threshold],
+                                [REGRESSED, IMPROVED], UNCHANGED)
+    return table.sort_values(['change', 'z'], ascending=False, ignore_index=True)
+
+
+def print_report(table, sigma=SIGMA, min_change=MIN_CHANGE, limit=20):
+    flagged = table[table['status'] != UNCHANGED]
+    print("="*100)
+    print(f"REGRESSION CHECK ({len(table)} cells, threshold max({sigma:g} sigma, {min_change:.0%}))")
+    print("="*100)
+    print(f"{'Request':<8}{'Engine':<17}{'Metric':<11}{'Base (ms)':>11}{'New (ms)':>11}"
+          f"{'Delta':>10}{'Change':>9}{'z':>8}  Status")
+    for row in flagged.head(limit).itertuples():
+        print(f"{row.question:<8}{row.method:<17}{row.metric:<11}{row.base_ms:11.2f}{row.new_ms:11.2f}"
+              f"{row.delta_ms:+10.2f}{row.change:+9.1%}{row.z:8.1f}  {row.status}")
+    if len(flagged) > limit:
+        print(f"... {len(flagged) - limit} more flagged cells")
+    counts = table['status'].value_counts()
+    print(f"\n{counts.get(REGRESSED, 0)} regressed, {counts.get(IMPROVED, 0)} improved, "
+          f"{counts.get(UNCHANGED, 0)} within noise")
+
+
+def chart_diff(table, questions, methods, metric='server_ms'):
+    """Heatmap of the relative change per request and engine, in the benchmark_heatmap style"""
+    cells = table[table['metric'] == metric]
+    change = cells.pivot(index='question', columns='method', values='change') * 100
+    status = cells.pivot(index='question', columns='method', values='status')
+    questions = [q for q in questions if q in change.index]
+    methods = [m for m in methods if m in change.columns]
+    change, status = change.reindex(questions)[methods], status.reindex(questions)[methods]
+
+    # Flags are placed by (row, col); cells missing from either run stay blank
+    flagged = status.notna() & (status != UNCHANGED)
+    annot = change.map(lambda value: '' if np.isnan(value) else format(value, '+.1f'))
+    annot = annot + flagged.map(lambda flag: '*' if flag else '')
+
+    fig = heatmap_renderer(list(change.index), list(change.columns), cmap='RdBu_r', fmt='',
+                           center=0).render(
+        change, f'{METRIC_LABELS[metric]} Time: Mean Change vs Baseline (%)\n'
+                'Red = slower, * = beyond the noise threshold',
+        'Engine', 'Request', 'Change of mean (%)', annot=annot)
+    path = save_figure(f"regression_diff_{metric.replace('_ms', '')}.png", fig)
+    print(f"[OK] {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('baseline', help='results CSV or raw sample file of the reference run')
+    parser.add_argument('candidate', help='results CSV or raw sample file of the new run')
+    parser.add_argument('--sigma', type=float, default=SIGMA)
+    parser.add_argument('--min-change', type=float, default=MIN_CHANGE)
+    parser.add_argument('--iterations', type=int, default=ITERATIONS,
+                        help='iterations per cell behind a results CSV')
+    parser.add_argument('--chart', action='store_true', help='write regression_diff_<metric>.png')
+    args = parser.parse_args(argv)
+
+    baseline = load_run(args.baseline, args.iterations)
+    table = compare(baseline, load_run(args.candidate, args.iterations), args.sigma, args.min_change)
+    print_report(table, args.sigma, args.min_change)
+    if args.chart:
+        for metric in METRICS:
+            if (table['metric'] == metric).any():
+                chart_diff(table, list(dict.fromkeys(baseline['question'])),
+                           list(dict.fromkeys(baseline['method'])), metric)
+    return 1 if (table['status'] == REGRESSED).any() else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rendering profiles shared by every chart script
+A profile sets DPI, tight bounding box, output format and font hinting for all
+save_figure() calls, so a quick preview tier can replace the 300-DPI
+publication output while numbers are still being checked
+"""
+import os
+
+import matplotlib.pyplot as plt
+
+PROFILES = {
+    # Final report images, identical to the historical savefig(dpi=300, bbox_inches='tight')
+    'publication': {
+        'dpi': 300,
+        'bbox_inches': 'tight',
+        'format': 'png',
+        'hinting': None,  # keep matplotlib's default
+        'output_dir': '.',
+    },
+    # Screen-resolution drafts, written next to the report instead of over it
+    'preview': {
+        'dpi': 72,
+        'bbox_inches': None,
+        'format': 'png',
+        'hinting': 'none',
+        'output_dir': 'preview',
+    },
+}
+
+FORMATS = ['png', 'svg', 'pdf']
+
+_active = {'name': os.environ.get('CHART_PROFILE', 'publication'),
+           'format': os.environ.get('CHART_FORMAT')}
+
+
+def set_profile(name='publication', fmt=None):
+    """Select the profile (and optionally override its format) for later saves"""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown rendering profile {name!r}, expected one of {sorted(PROFILES)}")
+    if fmt is not None and fmt not in FORMATS:
+        raise ValueError(f"Unknown output format {fmt!r}, expected one of {FORMATS}")
+    _active['name'] = name
+    _active['format'] = fmt
+
+
+def active_profile():
+    """Settings of the active profile, with the format override applied"""
+    profile = dict(PROFILES[_active['name']], name=_active['name'])
+    if _active['format']:
+        profile['format'] = _active['format']
+    return profile
+
+
+def output_path(filename, profile=None):
+    """Where filename ends up under profile (directory and extension)"""
+    profile = profile or active_profile()
+    base, _ = os.path.splitext(filename)
+    return os.path.normpath(os.path.join(profile['output_dir'], f"{base}.{profile['format']}"))
+
+
+def save_figure(filename, fig=None):
+    """Save fig (default: current figure) with the active profile; returns the path"""
+    profile = active_profile()
+    path = output_path(filename, profile)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    rc = {'text.hinting': profile['hinting']} if profile['hinting'] else {}
+    with plt.rc_context(rc):
+        (fig or plt.gcf()).savefig(path, dpi=profile['dpi'],
+                                   bbox_inches=profile['bbox_inches'],
+                                   format=profile['format'])
+    return path
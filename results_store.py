@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar results store next to benchmark_results.csv
+The results are kept in an uncompressed Arrow IPC (Feather v2) file with
+dictionary-encoded question/method/metric columns and float64 statistics.
+Loading memory-maps that file instead of parsing the CSV text; the CSV stays
+the human-readable export and is re-imported whenever it is newer.
+pyarrow is optional: without it every load falls back to the CSV.
+
+    python results_store.py import   # benchmark_results.csv -> benchmark_results.arrow
+    python results_store.py export   # benchmark_results.arrow -> benchmark_results.csv
+    python results_store.py info     # schema, rows and load times
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # optional: fall back to the CSV
+    pa = None
+
+RESULTS_CSV = 'benchmark_results.csv'
+KEY_COLUMNS = ['question', 'method', 'metric']
+CSV_SEPARATOR = ';'
+
+
+def store_path(csv_path=RESULTS_CSV):
+    """benchmark_results.csv -> benchmark_results.arrow"""
+    return os.path.splitext(csv_path)[0] + '.arrow'
+
+
+def read_csv(csv_path=RESULTS_CSV):
+    """Parse the text export (key columns as categoricals)"""
+    df = pd.read_csv(csv_path, sep=CSV_SEPARATOR)
+    return df.astype({col: 'category' for col in KEY_COLUMNS if col in df.columns})
+
+
+def write_csv(df, csv_path=RESULTS_CSV):
+    df.to_csv(csv_path, sep=CSV_SEPARATOR, index=False)
+
+
+def to_table(df):
+    """Arrow table with dictionary-encoded keys and float64 statistics"""
+    keys = [col for col in KEY_COLUMNS if col in df.columns]
+    typed = df.astype({col: 'category' for col in keys})
+    typed = typed.astype({col: 'float64' for col in df.columns if col not in keys})
+    return pa.Table.from_pandas(typed, preserve_index=False)
+
+
+def write_store(df, path):
+    """Write df as an uncompressed Feather v2 file (atomically)"""
+    tmp = f"{path}.tmp"
+    # Uncompressed so the columns can be used straight from the memory map
+    feather.write_feather(to_table(df), tmp, compression='uncompressed')
+    os.replace(tmp, path)
+
+
+def read_table(path):
+    """Memory-map the store; column buffers point into the mapped file"""
+    return feather.read_table(path, memory_map=True)
+
+
+def read_store(path):
+    table = read_table(path)
+    # Dictionary columns come back as categoricals without re-encoding the strings
+    return table.to_pandas(split_blocks=True)
+
+
+def is_fresh(path, csv_path):
+    """True if the store exists and is not older than the CSV it mirrors"""
+    if not os.path.exists(path):
+        return False
+    return not os.path.exists(csv_path) or os.path.getmtime(path) >= os.path.getmtime(csv_path)
+
+
+def import_csv(csv_path=RESULTS_CSV, path=None):
+    """(Re)build the store from the CSV and return the frame"""
+    df = read_csv(csv_path)
+    write_store(df, path or store_path(csv_path))
+    return df
+
+
+def export_csv(csv_path=RESULTS_CSV, path=None):
+    """Write the store back out as the ;-separated CSV"""
+    write_csv(read_store(path or store_path(csv_path)), csv_path)
+
+
+def sync_store(csv_path=RESULTS_CSV):
+    """Rebuild a missing or stale store from the CSV; True if the store is usable"""
+    if pa is None:
+        return False
+    path = store_path(csv_path)
+    if is_fresh(path, csv_path):
+        return True
+    try:
+        import_csv(csv_path, path)
+    except OSError:
+        return False
+    return True
+
+
+def load_frame(csv_path=RESULTS_CSV):
+    """Results as a DataFrame, from the memory-mapped store when possible
+
+    Without pyarrow (or if the store cannot be written) the CSV is parsed directly.
+    """
+    if sync_store(csv_path):
+        return read_store(store_path(csv_path))
+    return read_csv(csv_path)
+
+
+def source_mtime(csv_path=RESULTS_CSV):
+    """Modification time of whichever of CSV and store is newer"""
+    times = [os.path.getmtime(p) for p in (csv_path, store_path(csv_path)) if os.path.exists(p)]
+    if not times:
+        raise FileNotFoundError(csv_path)
+    return max(times)
+
+
+def main(argv):
+    if pa is None:
+        print("pyarrow is not installed: results are read from the CSV only")
+        return 1
+    command = argv[0] if argv else 'info'
+    csv_path = argv[1] if len(argv) > 1 else RESULTS_CSV
+    path = store_path(csv_path)
+
+    if command == 'import':
+        df = import_csv(csv_path, path)
+        print(f"[OK] {csv_path} -> {path} ({len(df)} rows, {os.path.getsize(path) / 1024:.1f} KiB)")
+    elif command == 'export':
+        export_csv(csv_path, path)
+        print(f"[OK] {path} -> {csv_path}")
+    elif command == 'info':
+        sync_store(csv_path)
+        print(read_table(path).schema)
+        for label, load in [('CSV parse', lambda: read_csv(csv_path)),
+                            ('Arrow memory map', lambda: read_store(path))]:
+            start = time.perf_counter()
+            df = load()
+            print(f"{label:18s}: {len(df)} rows in {(time.perf_counter() - start) * 1000:.2f} ms")
+    else:
+        print(f"Unknown command {command!r}, expected import, export or info")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
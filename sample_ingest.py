@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ingest raw per-iteration benchmark samples into benchmark_results.csv
+Samples are streamed in chunks (JSONL or the binary .samples format) and folded
+into per-(question, method, metric) running aggregates: count, mean and
+variance (Welford/Chan), min, max, and a mergeable log-bucketed histogram
+(quantile_sketch.LogHistogram) for the median and tail percentiles. Memory
+is bounded by the number of keys and histogram buckets, never by the number
+of samples.
+
+    python sample_ingest.py run1.jsonl run2.samples -o benchmark_results.csv
+
+Sharded campaigns: each shard writes its aggregate state as a partial
+(.partial.json) instead of a CSV, and partials merge like sample files:
+
+    python sample_ingest.py shard1.samples --partial shard1.partial.json
+    python sample_ingest.py shard*.partial.json -o benchmark_results.csv
+
+JSONL: one sample per line, either
+    {"question": "R1", "method": "Web 1.0", "metric": "server_ms", "value": 2.41}
+or one iteration with several metrics
+    {"question": "R1", "method": "Web 1.0", "server_ms": 2.41, "client_ms": 3.2}
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from quantile_sketch import PERCENTILES, LogHistogram, bucket_of
+from results_store import KEY_COLUMNS, RESULTS_CSV, sync_store, write_csv
+
+METRICS = ['server_ms', 'client_ms', 'render_ms']
+STATISTICS = (['mean_ms', 'median_ms', 'stdev_ms', 'min_ms', 'max_ms']
+              + [f'{name}_ms' for name, _ in PERCENTILES])
+DECIMALS = 3  # the CSV keeps microsecond precision
+
+# Default raw sample file, next to the aggregated CSV
+SAMPLES_FILE = 'benchmark_results.samples'
+
+# Partial aggregates of a shard (JSON), see SampleAggregator.to_partial
+PARTIAL_SUFFIX = '.partial.json'
+PARTIAL_FORMAT = 'benchmark-partial 1'
+
+CHUNK_SIZE = 1 << 16
+
+# Binary format: magic line, one JSON header line with the label tables, then
+# fixed-width little-endian records
+SAMPLES_MAGIC = b'BENCHSAMPLES 1\n'
+RECORD_DTYPE = np.dtype([('question', '<u2'), ('method', '<u2'),
+                         ('metric', '<u2'), ('value', '<f8')])
+
+
+class SampleAggregator:
+    """Streaming aggregates for every (question, method, metric) key"""
+
+    def __init__(self):
+        self.keys = []        # key tuples in first-seen order
+        self._index = {}
+        self.count = np.zeros(0, dtype=np.int64)
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)  # sum of squared deviations from the mean
+        self.min = np.zeros(0)
+        self.max = np.zeros(0)
+        self.sketches = []  # per key LogHistogram
+        self._pending = ([], [])
+
+    def key_index(self, key):
+        """Index of key, registering it on first use"""
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.keys)
+            self.keys.append(key)
+            self.sketches.append(LogHistogram())
+            self.count = np.append(self.count, 0)
+            self.mean = np.append(self.mean, 0.0)
+            self.m2 = np.append(self.m2, 0.0)
+            self.min = np.append(self.min, np.inf)
+            self.max = np.append(self.max, -np.inf)
+        return index
+
+    def add(self, question, method, metric, value):
+        """Queue one sample (folded in by chunks)"""
+        keys, values = self._pending
+        keys.append(self.key_index((question, method, metric)))
+        values.append(value)
+        if len(values) >= CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        keys, values = self._pending
+        if values:
+            self.add_chunk(np.asarray(keys, dtype=np.intp), np.asarray(values, dtype=float))
+        self._pending = ([], [])
+
+    def add_chunk(self, key_indices, values):
+        """Fold a chunk of samples into the running aggregates (vectorized)"""
+        keep = np.isfinite(values)
+        key_indices, values = key_indices[keep], values[keep]
+        if not len(values):
+            return
+        size = len(self.keys)
+        n = np.bincount(key_indices, minlength=size)
+        seen = n > 0
+        sums = np.bincount(key_indices, weights=values, minlength=size)
+        chunk_mean = np.divide(sums, n, out=np.zeros(size), where=seen)
+        deviations = values - chunk_mean[key_indices]
+        chunk_m2 = np.bincount(key_indices, weights=deviations * deviations, minlength=size)
+
+        # Chan et al. pairwise update of (count, mean, M2)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        ratio = np.divide(n, total, out=np.zeros(size), where=seen)
+        self.mean = np.where(seen, self.mean + delta * ratio, self.mean)
+        self.m2 = np.where(seen, self.m2 + chunk_m2 + delta * delta * self.count * ratio, self.m2)
+        self.count = total
+
+        np.minimum.at(self.min, key_indices, values)
+        np.maximum.at(self.max, key_indices, values)
+
+        # Bucket every sample once, then hand each key its (bucket, count, sum) run
+        codes, inverse, counts = np.unique(key_indices.astype(np.int64) << 32 | bucket_of(values),
+                                           return_inverse=True, return_counts=True)
+        bucket_sums = np.bincount(inverse, weights=values)
+        owners = codes >> 32
+        starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        for start, end in zip(starts, np.r_[starts[1:], len(codes)]):
+            self.sketches[owners[start]].add_buckets(codes[start:end] & 0xFFFFFFFF,
+                                                     counts[start:end], bucket_sums[start:end])
+
+    def merge(self, other):
+        """Fold another aggregator's state into this one (Chan et al. for mean and M2)"""
+        other.flush()
+        self.flush()
+        for source, key in enumerate(other.keys):
+            index = self.key_index(key)
+            count, n = self.count[index], other.count[source]
+            if not n:
+                continue
+            total = count + n
+            delta = other.mean[source] - self.mean[index]
+            self.mean[index] += delta * n / total
+            self.m2[index] += other.m2[source] + delta * delta * count * n / total
+            self.count[index] = total
+            self.min[index] = min(self.min[index], other.min[source])
+            self.max[index] = max(self.max[index], other.max[source])
+            self.sketches[index].merge(other.sketches[source])
+        return self
+
+    def to_partial(self):
+        """JSON-serializable aggregate state, for merging shards without their samples"""
+        self.flush()
+        return {'format': PARTIAL_FORMAT, 'keys': [list(key) for key in self.keys],
+                'count': self.count.tolist(), 'mean': self.mean.tolist(), 'm2': self.m2.tolist(),
+                'min': self.min.tolist(), 'max': self.max.tolist(),
+                'sketches': [sketch.to_dict() for sketch in self.sketches]}
+
+    @classmethod
+    def from_partial(cls, state):
+        if state.get('format') != PARTIAL_FORMAT:
+            raise ValueError(f"Unsupported partial aggregate format {state.get('format')!r}")
+        aggregator = cls()
+        for key in state['keys']:
+            aggregator.key_index(tuple(key))
+        aggregator.count = np.array(state['count'], dtype=np.int64)
+        for name in ('mean', 'm2', 'min', 'max'):
+            setattr(aggregator, name, np.array(state[name], dtype=float))
+        aggregator.sketches = [LogHistogram.from_dict(sketch) for sketch in state['sketches']]
+        return aggregator
+
+    def to_frame(self):
+        """Aggregates in the benchmark_results.csv schema"""
+        self.flush()
+        rows = []
+        for index, key in enumerate(self.keys):
+            count = self.count[index]
+            if not count:
+                continue
+            stdev = np.sqrt(self.m2[index] / (count - 1)) if count > 1 else 0.0
+            sketch = self.sketches[index]
+            row = dict(zip(KEY_COLUMNS, key),
+                       mean_ms=self.mean[index], median_ms=sketch.median(),
+                       stdev_ms=stdev, min_ms=self.min[index], max_ms=self.max[index])
+            for name, q in PERCENTILES:
+                row[f'{name}_ms'] = sketch.quantile(q)
+            rows.append(row)
+        frame = pd.DataFrame(rows, columns=KEY_COLUMNS + STATISTICS)
+        return frame.round({stat: DECIMALS for stat in STATISTICS})
+
+
+class SampleCollector(SampleAggregator):
+    """Keeps the raw samples of every key in memory, for resampling
+
+    Meant for campaign-sized data (hundreds to thousands of iterations per
+    key); use SampleAggregator for anything larger. Only keys whose metric is
+    in metrics are kept.
+    """
+
+    def __init__(self, metrics=METRICS):
+        super().__init__()
+        self.metrics = set(metrics)
+        self._chunks = []
+
+    def key_index(self, key):
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.keys)
+            self.keys.append(key)
+            self._chunks.append([])
+        return index
+
+    def add_chunk(self, key_indices, values):
+        order = np.argsort(key_indices, kind='stable')
+        key_indices, values = key_indices[order], values[order]
+        starts = np.flatnonzero(np.r_[True, key_indices[1:] != key_indices[:-1]])
+        for start, end in zip(starts, np.r_[starts[1:], len(values)]):
+            index = key_indices[start]
+            if self.keys[index][2] in self.metrics:
+                self._chunks[index].append(values[start:end])
+
+    def merge(self, other):
+        raise ValueError("Partial aggregates hold no raw samples to collect")
+
+    def samples(self):
+        """{(question, method, metric): array of samples in file order}"""
+        self.flush()
+        return {key: np.concatenate(chunks) for key, chunks in zip(self.keys, self._chunks)
+                if chunks}
+
+
+def file_signature(paths):
+    """Cheap identity of sample files for the chart cache (path, size, mtime)"""
+    return [(path, os.path.getsize(path), os.path.getmtime(path))
+            for path in paths if os.path.exists(path)]
+
+
+def ingest_jsonl(path, aggregator):
+    """Stream a JSONL sample file into aggregator"""
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                question, method = record['question'], record['method']
+            except (ValueError, KeyError) as exc:
+                raise ValueError(f"{path}:{line_number}: invalid sample ({exc})") from exc
+            if 'metric' in record:
+                aggregator.add(question, method, record['metric'], float(record['value']))
+            else:
+                for metric in METRICS:
+                    if record.get(metric) is not None:
+                        aggregator.add(question, method, metric, float(record[metric]))
+    aggregator.flush()
+
+
+class SampleWriter:
+    """Append raw samples to a binary .samples file"""
+
+    def __init__(self, path, questions, methods, metrics=METRICS):
+        self.labels = {'question': list(questions), 'method': list(methods),
+                       'metric': list(metrics)}
+        self._codes = {name: {label: i for i, label in enumerate(labels)}
+                       for name, labels in self.labels.items()}
+        self.file = open(path, 'wb')
+        self.file.write(SAMPLES_MAGIC)
+        self.file.write(json.dumps(self.labels).encode() + b'\n')
+
+    def write(self, question, method, metric, values):
+        """Write every value of values as a sample of (question, method, metric)"""
+        values = np.asarray(values, dtype='<f8')
+        records = np.empty(len(values), dtype=RECORD_DTYPE)
+        records['question'] = self._codes['question'][question]
+        records['method'] = self._codes['method'][method]
+        records['metric'] = self._codes['metric'][metric]
+        records['value'] = values
+        records.tofile(self.file)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def ingest_binary(path, aggregator):
+    """Stream a binary .samples file into aggregator (memory-mapped, chunked)"""
+    with open(path, 'rb') as f:
+        if f.readline() != SAMPLES_MAGIC:
+            raise ValueError(f"{path}: not a benchmark samples file")
+        labels = json.loads(f.readline())
+        offset = f.tell()
+    size = os.path.getsize(path) - offset
+    if size % RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path}: truncated record at the end of the file")
+    if not size:
+        return
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=offset)
+
+    # Map the file's label codes to the aggregator's key indices
+    codes = {}
+    for start in range(0, len(records), CHUNK_SIZE):
+        chunk = records[start:start + CHUNK_SIZE]
+        combined = ((chunk['question'].astype(np.int64) << 32)
+                    | (chunk['method'].astype(np.int64) << 16) | chunk['metric'])
+        unique, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+        # Register new keys in file order, like the JSONL reader
+        for code in unique[np.argsort(first)].tolist():
+            if code not in codes:
+                codes[code] = aggregator.key_index((labels['question'][code >> 32],
+                                                    labels['method'][(code >> 16) & 0xFFFF],
+                                                    labels['metric'][code & 0xFFFF]))
+        key_indices = np.array([codes[code] for code in unique.tolist()], dtype=np.intp)[inverse]
+        aggregator.add_chunk(key_indices, np.asarray(chunk['value'], dtype=float))
+
+
+def write_partial(aggregator, path):
+    """Save aggregator's state as a partial aggregate file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(aggregator.to_partial(), f)
+
+
+def read_partial(path):
+    """SampleAggregator restored from a partial aggregate file"""
+    with open(path, encoding='utf-8') as f:
+        try:
+            return SampleAggregator.from_partial(json.load(f))
+        except (ValueError, KeyError) as exc:
+            raise ValueError(f"{path}: invalid partial aggregate ({exc})") from exc
+
+
+def ingest(paths, aggregator=None):
+    """Aggregate every sample file of paths (.jsonl, .samples or merged .partial.json)"""
+    aggregator = aggregator or SampleAggregator()
+    for path in paths:
+        if path.endswith(PARTIAL_SUFFIX):
+            aggregator.merge(read_partial(path))
+        elif path.endswith('.jsonl'):
+            ingest_jsonl(path, aggregator)
+        else:
+            ingest_binary(path, aggregator)
+    return aggregator
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('samples', nargs='+', help=f'.jsonl, .samples or {PARTIAL_SUFFIX} files')
+    parser.add_argument('-o', '--output', default=RESULTS_CSV,
+                        help=f'aggregated CSV to write (default: {RESULTS_CSV})')
+    parser.add_argument('--partial', metavar='PATH',
+                        help=f'write the partial aggregate state ({PARTIAL_SUFFIX}) instead of a CSV')
+    args = parser.parse_args(argv)
+
+    aggregator = ingest(args.samples)
+    if args.partial:
+        write_partial(aggregator, args.partial)
+        print(f"[OK] {int(aggregator.count.sum())} samples -> partial {args.partial}")
+        return 0
+    frame = aggregator.to_frame()
+    write_csv(frame, args.output)
+    sync_store(args.output)
+
+    print(f"[OK] {int(aggregator.count.sum())} samples -> {len(frame)} rows in {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
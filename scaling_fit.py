@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Empirical complexity fitting across dataset scales
+A sweep runs every request at several dataset scale factors and records each
+scale as a run in the history (history_store.py, scale column). For every
+engine and request, time ~ a * scale^k is then fitted by least squares on
+log(mean) against log(scale). The exponent's 95% interval comes from a
+parametric bootstrap of the cell means (mean, stdev, iterations), refitted
+for every draw, and R^2 shows how well a power law fits at all.
+
+k ~ 0 means the request does not depend on the data size, k ~ 1 linear, k ~ 2
+quadratic. The time predicted at EXTRAPOLATION x the base scale says which
+engine survives a much bigger league.
+
+    python scaling_fit.py [--metric server_ms] [--charts]         # sweep from the history
+    python scaling_fit.py --csv 1=x1.csv 10=x10.csv 100=x100.csv  # sweep from results CSVs
+    python scaling_fit.py --sweep 1 10 100 [--iterations 30]      # generate, bench, record, fit
+
+--sweep generates a league_dataset.py league per scale factor (more teams,
+one season, rounded up to whole teams), benches the reference engines on it
+with benchmark_runner.py and records each scale before fitting.
+"""
+import argparse
+import functools
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from bootstrap_ci import ITERATIONS, RESAMPLES, SEED, percentile_interval, summary_mean_draws
+from chart_cache import chart_inputs
+from chart_renderers import heatmap_renderer
+from generate_distribution_charts import COLORS, METRIC_LABELS, engine_legend, request_grid
+from history_store import HISTORY_DB, history_signature, list_runs, load_run, record_run, run_metadata
+from render_profile import save_figure
+from results_store import read_csv
+from sample_ingest import METRICS, file_signature
+
+EXTRAPOLATION = 100  # predicted time at this many times the base (smallest) scale
+MIN_SCALES = 2       # a fit needs at least two scales
+
+FIT_COLUMNS = ['question', 'method', 'exponent', 'exponent_low', 'exponent_high',
+               'coefficient_ms', 'r2', 'scales', 'predicted_ms']
+
+# {scale: results CSV}; empty = the scaled runs of the history
+SWEEP_CSVS = {}
+
+SWEEP_DIR = 'scaling_datasets'  # --sweep: one generated league per scale, scale_<factor>/
+
+
+def sweep(run, scales, note=None, path=HISTORY_DB):
+    """Run every scale and record it in the history; returns the run IDs
+
+    run(scale) runs the benchmark on a dataset of that scale factor and
+    returns its results (benchmark_results.csv schema).
+    """
+    return [record_run(run(scale), run_metadata(scale, note), path) for scale in scales]
+
+
+def bench_scale(scale, root=SWEEP_DIR, questions=None, methods=None, iterations=None):
+    """Results of the reference engines on a generated league of scale (for sweep)
+
+    The league (league_dataset.py) is generated under root once per scale and
+    reused afterwards; every (request, engine) pair is then timed by
+    benchmark_runner.py with a detected warmup.
+    """
+    from benchmark_data import METHODS, REQUESTS
+    from benchmark_runner import ITERATIONS as RUNNER_ITERATIONS, REGISTRY, BenchmarkRunner
+    from league_dataset import MANIFEST, generate, teams_for_scale
+    from reference_engines import open_engines, register_targets
+
+    dataset = os.path.join(root, f'scale_{scale:g}')
+    if not os.path.exists(os.path.join(dataset, MANIFEST)):
+        manifest = generate(dataset, teams_for_scale(scale))
+        print(f"[OK] scale {scale:g}: {manifest['teams']} teams, {manifest['matches']} matches "
+              f"-> {dataset}/")
+    engines = open_engines(methods or METHODS, dataset)
+    try:
+        REGISTRY.clear()
+        register_targets(engines, questions or REQUESTS)
+        runner = BenchmarkRunner(list(REGISTRY.values()), iterations or RUNNER_ITERATIONS)
+        runner.run(lambda t: print(f"  x{scale:<8g} {t.question:<4} {t.method:<17} done"))
+        return runner.to_frame()
+    finally:
+        for engine in engines:
+            engine.close()
+
+
+def scaled_runs(path=HISTORY_DB):
+    """{scale: run ID} of the latest recorded run of every scale"""
+    runs = list_runs(path).dropna(subset=['scale'])
+    return dict(zip(runs['scale'], runs['run_id']))
+
+
+def load_sweep():
+    """Results of every scale (SWEEP_CSVS, else the history) with a scale column"""
+    if SWEEP_CSVS:
+        frames = {scale: read_csv(csv) for scale, csv in SWEEP_CSVS.items()}
+    else:
+        frames = {scale: load_run(run_id) for scale, run_id in scaled_runs().items()}
+    if not frames:
+        return pd.DataFrame(columns=['question', 'method', 'metric', 'mean_ms', 'stdev_ms', 'scale'])
+    return pd.concat([frame.assign(scale=float(scale)) for scale, frame in frames.items()],
+                     ignore_index=True)
+
+
+def sweep_signature():
+    if SWEEP_CSVS:
+        return [sorted(SWEEP_CSVS.items()), file_signature(list(SWEEP_CSVS.values()))]
+    return history_signature()
+
+
+def _slopes(x, y):
+    """Least-squares slopes and intercepts of y (..., points) on x (points)"""
+    dx = x - x.mean()
+    slope = ((y - y.mean(axis=-1, keepdims=True)) * dx).sum(axis=-1) / (dx * dx).sum()
+    return slope, y.mean(axis=-1) - slope * x.mean()
+
+
+def fit_scaling(frame, metric='server_ms', iterations=ITERATIONS, resamples=RESAMPLES, seed=SEED):
+    """Fitted time ~ a * scale^k of every (question, method) cell (FIT_COLUMNS)"""
+    frame = frame[(frame['metric'] == metric) & (frame['mean_ms'] > 0)]
+    base = frame['scale'].min()
+    rows = []
+    for (question, method), cell in frame.groupby(['question', 'method'], sort=False):
+        cell = cell.sort_values('scale')
+        if cell['scale'].nunique() < MIN_SCALES:
+            continue
+        x = np.log(cell['scale'].to_numpy())
+        y = np.log(cell['mean_ms'].to_numpy())
+        slope, intercept = _slopes(x, y)
+        residuals = y - (intercept + slope * x)
+        total = ((y - y.mean()) ** 2).sum()
+        r2 = 1 - (residuals ** 2).sum() / total if total else 1.0
+
+        # Refit on draws of the means (scales x resamples), kept positive for the log
+        draws = summary_mean_draws(cell['mean_ms'].to_numpy(), cell['stdev_ms'].fillna(0).to_numpy(),
+                                   iterations, resamples, seed)
+        draws = np.log(np.maximum(draws, cell['mean_ms'].to_numpy()[:, None] * 1e-3))
+        low, high = percentile_interval(_slopes(x, draws.T)[0])
+        rows.append({'question': question, 'method': method, 'exponent': slope,
+                     'exponent_low': low, 'exponent_high': high,
+                     'coefficient_ms': np.exp(intercept), 'r2': r2, 'scales': len(cell),
+                     'predicted_ms': np.exp(intercept) * (EXTRAPOLATION * base) ** slope})
+    return pd.DataFrame(rows, columns=FIT_COLUMNS)
+
+
+@functools.lru_cache(maxsize=None)
+def _fits(signature, metric):
+    frame = load_sweep()
+    return frame, fit_scaling(frame, metric)
+
+
+def sweep_fits(metric):
+    """(sweep frame, fits) for metric, computed once per sweep state"""
+    return _fits(repr(sweep_signature()), metric)
+
+
+# ============================================================================
+# CHART 1: Time against scale per request (log-log, with fitted power laws)
+# ============================================================================
+@chart_inputs(sweep=sweep_signature, colors=COLORS, iterations=ITERATIONS)
+def chart_scaling(metric='server_ms'):
+    frame, fits = sweep_fits(metric)
+    frame = frame[frame['metric'] == metric]
+    requests = list(dict.fromkeys(fits['question']))
+    methods = list(dict.fromkeys(fits['method']))
+    scales = np.sort(frame['scale'].unique())
+    line = np.geomspace(scales[0], scales[-1], 50)
+
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time Against Dataset Scale\n'
+                                       'Mean per scale, dashed = fitted a * scale^k (k in legend)')
+    for ax, req in zip(axes, requests):
+        for method in methods:
+            color = COLORS.get(method, 'gray')
+            cell = frame[(frame['question'] == req) & (frame['method'] == method)].sort_values('scale')
+            fit = fits[(fits['question'] == req) & (fits['method'] == method)]
+            if fit.empty:
+                continue
+            fit = fit.iloc[0]
+            ax.plot(cell['scale'], cell['mean_ms'], 'o', color=color, markersize=4,
+                    label=f"k={fit['exponent']:.2f}")
+            ax.plot(line, fit['coefficient_ms'] * line ** fit['exponent'], '--', color=color,
+                    linewidth=1.2)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.set_xlabel('Scale factor', fontsize=9)
+        ax.legend(fontsize=7, loc='upper left', handlelength=1)
+        ax.grid(alpha=0.3, linestyle='--', which='both')
+    axes[0].set_ylabel('Time (ms) - Log Scale', fontsize=10, fontweight='bold')
+
+    engine_legend(fig, methods)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure(f"scaling_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 1: scaling_{metric.replace('_ms', '')}.png")
+
+
+# ============================================================================
+# CHART 2: Fitted exponents (requests x engines)
+# ============================================================================
+@chart_inputs(sweep=sweep_signature, iterations=ITERATIONS)
+def chart_exponents(metric='server_ms'):
+    _, fits = sweep_fits(metric)
+    table = fits.pivot(index='question', columns='method', values='exponent')
+    table = table.reindex(index=list(dict.fromkeys(fits['question'])),
+                          columns=list(dict.fromkeys(fits['method'])))
+    fig = heatmap_renderer(list(table.index), list(table.columns), cmap='YlOrRd', fmt='.2f').render(
+        table, f'{METRIC_LABELS[metric]} Time: Fitted Scaling Exponent k (time ~ scale^k)\n'
+               '0 = independent of data size, 1 = linear, 2 = quadratic',
+        'Engine', 'Request', 'Exponent k')
+    path = save_figure(f"scaling_exponents_{metric.replace('_ms', '')}.png", fig)
+    print(f"[OK] Chart 2: {path}")
+
+
+def print_fits(fits, metric):
+    print("="*80)
+    print(f"SCALING EXPONENTS ({metric}): time ~ a * scale^k, 95% bootstrap CI")
+    print("="*80)
+    print(f"{'Request':<8}{'Engine':<17}{'k':>6}{'95% CI':>16}{'R^2':>7}"
+          f"{f'x{EXTRAPOLATION} (ms)':>14}")
+    for row in fits.itertuples():
+        print(f"{row.question:<8}{row.method:<17}{row.exponent:6.2f}"
+              f"   [{row.exponent_low:5.2f}, {row.exponent_high:5.2f}]{row.r2:7.2f}"
+              f"{row.predicted_ms:14.1f}")
+    worst = fits.groupby('method', sort=False)['predicted_ms'].max()
+    print(f"\nSlowest request at x{EXTRAPOLATION} per engine: "
+          + ', '.join(f"{method} {ms / 1000:.2f} s" for method, ms in worst.items()))
+
+
+def scaling_charts():
+    """Charts per metric once the sweep covers MIN_SCALES scales"""
+    charts = {}
+    frame = load_sweep() if SWEEP_CSVS or history_signature()[0] else None
+    if frame is not None and frame['scale'].nunique() >= MIN_SCALES:
+        for metric in [m for m in METRICS if m in set(frame['metric'])]:
+            name = metric.replace('_ms', '')
+            charts[f'scaling_{name}.png'] = functools.partial(chart_scaling, metric=metric)
+            charts[f'scaling_exponents_{name}.png'] = functools.partial(chart_exponents, metric=metric)
+    return charts
+
+
+CHARTS = scaling_charts()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--csv', nargs='+', metavar='SCALE=PATH',
+                        help='results CSV of each scale (default: scaled runs of the history)')
+    parser.add_argument('--sweep', nargs='+', type=float, metavar='SCALE',
+                        help='generate, bench and record the reference engines at these scale factors')
+    parser.add_argument('--datasets', default=SWEEP_DIR,
+                        help=f'generated leagues for --sweep (default: {SWEEP_DIR})')
+    parser.add_argument('--iterations', type=int, help='iterations per target for --sweep')
+    parser.add_argument('--note', help='history note of the --sweep runs')
+    parser.add_argument('--metric', default='server_ms')
+    parser.add_argument('--charts', action='store_true',
+                        help='draw scaling_<metric>.png and scaling_exponents_<metric>.png')
+    args = parser.parse_args(argv)
+
+    if args.sweep:
+        from league_dataset import BASE_SEASONS, scale_factor, teams_for_scale
+
+        # Record the scale of the league actually generated (whole teams)
+        scales = sorted({scale_factor(teams_for_scale(scale), BASE_SEASONS) for scale in args.sweep})
+        run_ids = sweep(functools.partial(bench_scale, root=args.datasets, iterations=args.iterations),
+                        scales, args.note)
+        print(f"[OK] recorded scales {', '.join(f'{s:g}' for s in scales)} as runs "
+              f"{', '.join(map(str, run_ids))}")
+    if args.csv:
+        for item in args.csv:
+            scale, _, path = item.partition('=')
+            SWEEP_CSVS[float(scale)] = path
+    frame = load_sweep()
+    if frame['scale'].nunique() < MIN_SCALES:
+        print(f"Need runs at {MIN_SCALES}+ scales: 'python history_store.py record --scale N' "
+              "per scale, or --csv SCALE=PATH ...")
+        return 1
+
+    print_fits(sweep_fits(args.metric)[1], args.metric)
+    if args.charts:
+        for render in scaling_charts().values():
+            render()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pairwise significance of engine differences per request
+Every pair of engines is compared on every request with a two-sided
+Mann-Whitney U test (normal approximation with tie correction) on the raw
+per-iteration samples. Each cell is sorted once and U comes from binary
+searches between sorted cells, so R requests x N(N-1)/2 pairs of 100,000
+iterations each take seconds, not a merged ranking per pair. Effect
+size is Cliff's delta, P(A > B) - P(B > A), and p-values are Holm-corrected
+over the whole family of comparisons.
+
+    python significance.py [metric] [samples files...]
+"""
+import itertools
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+
+from sample_ingest import SAMPLES_FILE, SampleCollector, file_signature, ingest
+
+ALPHA = 0.05
+
+# Conventional Cliff's delta thresholds (Romano et al.)
+EFFECT_SIZES = [(0.147, 'negligible'), (0.33, 'small'), (0.474, 'medium'), (1.0, 'large')]
+
+TABLE_COLUMNS = ['question', 'method_a', 'method_b', 'n_a', 'n_b', 'median_a_ms', 'median_b_ms',
+                 'u', 'cliffs_delta', 'effect', 'p_value', 'p_holm', 'significant']
+
+
+def mann_whitney(pairs):
+    """Two-sided Mann-Whitney U tests for a batch of (a, b) sample pairs
+
+    Returns (u, p, delta) arrays with U of a, the p-value and Cliff's delta
+    (positive: a tends to be larger, i.e. slower). Each sample array is sorted
+    and tallied once however many pairs it appears in; U then comes from two
+    binary searches of a into b, so a pair of 100,000-sample cells costs
+    O(n log n) without ranking the merged samples.
+    """
+    tallies = {}
+
+    def tally(values):
+        if id(values) not in tallies:
+            ordered = np.sort(values)
+            tallies[id(values)] = (ordered,) + np.unique(ordered, return_counts=True)
+        return tallies[id(values)]
+
+    u, p, delta = (np.empty(len(pairs)) for _ in range(3))
+    for i, (a, b) in enumerate(pairs):
+        sorted_a, distinct_a, counts_a = tally(a)
+        sorted_b, distinct_b, counts_b = tally(b)
+        size_a, size_b = len(sorted_a), len(sorted_b)
+        below = np.searchsorted(sorted_b, distinct_a, 'left')
+        equal = np.searchsorted(sorted_b, distinct_a, 'right') - below
+        u[i] = counts_a @ (below + equal / 2)
+
+        # Tie correction: runs of equal values across both samples
+        _, run = np.unique(np.r_[distinct_a, distinct_b], return_inverse=True)
+        runs = np.bincount(run, weights=np.r_[counts_a, counts_b]).astype(float)
+        n = size_a + size_b
+        product = size_a * size_b
+        variance = product / 12 * ((n + 1) - (runs ** 3 - runs).sum() / (n * (n - 1)))
+        z = max(abs(u[i] - product / 2) - 0.5, 0) / math.sqrt(variance) if variance > 0 else 0
+        p[i] = math.erfc(z / math.sqrt(2)) if variance > 0 else 1.0
+        delta[i] = 2 * u[i] / product - 1
+    return u, p, delta
+
+
+def holm(p_values):
+    """Holm-Bonferroni adjusted p-values (same order as p_values)"""
+    p_values = np.asarray(p_values, dtype=float)
+    order = np.argsort(p_values)
+    scaled = (len(p_values) - np.arange(len(p_values))) * p_values[order]
+    adjusted = np.empty_like(p_values)
+    adjusted[order] = np.minimum(np.maximum.accumulate(scaled), 1.0)
+    return adjusted
+
+
+def effect_label(delta):
+    magnitude = abs(delta)
+    return next(label for limit, label in EFFECT_SIZES if magnitude < limit or limit == 1.0)
+
+
+def load_samples(metric, sample_files=(SAMPLES_FILE,)):
+    """{(question, method): samples} for one metric, or {} without raw samples"""
+    existing = [path for path, _, _ in file_signature(sample_files)]
+    if not existing:
+        return {}
+    samples = ingest(existing, SampleCollector([metric])).samples()
+    return {(q, m): values for (q, m, _), values in samples.items()}
+
+
+def pairwise_table(samples, alpha=ALPHA):
+    """One row per (request, engine pair) with U, Cliff's delta, raw and Holm p-values"""
+    questions = list(dict.fromkeys(q for q, _ in samples))
+    methods = list(dict.fromkeys(m for _, m in samples))
+    cells = [(q, a, b) for q in questions for a, b in itertools.combinations(methods, 2)
+             if (q, a) in samples and (q, b) in samples]
+    if not cells:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+
+    u, p, delta = mann_whitney([(samples[(q, a)], samples[(q, b)]) for q, a, b in cells])
+    p_holm = holm(p)
+    rows = [dict(question=q, method_a=a, method_b=b,
+                 n_a=len(samples[(q, a)]), n_b=len(samples[(q, b)]),
+                 median_a_ms=np.median(samples[(q, a)]), median_b_ms=np.median(samples[(q, b)]),
+                 u=u[i], cliffs_delta=delta[i], effect=effect_label(delta[i]),
+                 p_value=p[i], p_holm=p_holm[i], significant=bool(p_holm[i] < alpha))
+            for i, (q, a, b) in enumerate(cells)]
+    return pd.DataFrame(rows, columns=TABLE_COLUMNS)
+
+
+def print_table(table, metric):
+    print("="*100)
+    print(f"PAIRWISE ENGINE COMPARISON ({metric}, Mann-Whitney U, Holm-corrected, alpha={ALPHA})")
+    print("Cliff's delta > 0: first engine slower")
+    print("="*100)
+    print(f"{'Request':<8}{'Engine A':<17}{'Engine B':<17}{'Median A':>10}{'Median B':>10}"
+          f"{'Delta':>8}  {'Effect':<11}{'p':>10}{'p (Holm)':>10}")
+    for row in table.itertuples():
+        print(f"{row.question:<8}{row.method_a:<17}{row.method_b:<17}{row.median_a_ms:10.2f}"
+              f"{row.median_b_ms:10.2f}{row.cliffs_delta:8.2f}  {row.effect:<11}"
+              f"{row.p_value:10.2g}{row.p_holm:10.2g}{' *' if row.significant else ''}")
+    print(f"\n{int(table['significant'].sum())} of {len(table)} differences significant "
+          f"after Holm correction")
+
+
+def main(argv):
+    metric = argv[0] if argv else 'server_ms'
+    sample_files = argv[1:] or [SAMPLES_FILE]
+    samples = load_samples(metric, sample_files)
+    if not samples:
+        print(f"No raw samples found ({', '.join(sample_files)}): the tests need per-iteration samples")
+        return 1
+    print_table(pairwise_table(samples), metric)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
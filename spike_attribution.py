@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Attribute latency spikes to GC, scheduler or I/O
+Reads per-iteration samples with their context (iteration_probe.py) and flags
+spikes: iterations slower than the cell median by more than SPIKE_MADS
+median absolute deviations and SPIKE_RATIO times the median. Each spike's
+excess over the median is then attributed, first match wins:
+
+    gc          collections during the iteration cover half the excess or more
+    io          block I/O or major page faults, or more voluntary context
+                switches (blocking waits) than the cell usually has
+    scheduler   more involuntary context switches (preemption) than usual
+    unexplained none of the above: the engine itself, or something not probed
+
+Only unexplained spikes are likely to move with an engine change.
+
+    python spike_attribution.py [context.jsonl] [metric]
+"""
+import functools
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_cache import chart_inputs
+from generate_distribution_charts import METRIC_LABELS, request_grid
+from iteration_probe import CONTEXT_FILE, RUSAGE_FIELDS
+from render_profile import save_figure
+from sample_ingest import METRICS, file_signature
+
+SPIKE_MADS = 5       # robust z-score threshold
+SPIKE_RATIO = 1.5    # and at least this many times the median
+GC_SHARE = 0.5       # GC time covering this share of the excess explains the spike
+
+CAUSES = ['gc', 'io', 'scheduler', 'unexplained']
+CAUSE_COLORS = {'gc': '#F4A259', 'io': '#8CB369', 'scheduler': '#5B8E7D', 'unexplained': '#BC4B51'}
+CAUSE_LABELS = {'gc': 'Garbage collection', 'io': 'I/O and blocking waits',
+                'scheduler': 'Scheduler preemption', 'unexplained': 'Unexplained'}
+
+CONTEXT_FILES = [CONTEXT_FILE]
+
+
+def load_context(paths):
+    """Iteration records (JSONL) with every context column present (missing = 0)"""
+    frame = pd.concat([pd.read_json(path, lines=True) for path in paths], ignore_index=True)
+    for column in ['gc_ms'] + list(RUSAGE_FIELDS):
+        frame[column] = frame[column].fillna(0) if column in frame else 0
+    return frame
+
+
+def classify(frame, metric='server_ms'):
+    """Rows of frame that are spikes for metric, with excess_ms and cause columns"""
+    frame = frame.dropna(subset=[metric])
+    cells = frame.groupby(['question', 'method'], sort=False)
+    median = cells[metric].transform('median')
+    mad = (frame[metric] - median).abs().groupby([frame['question'], frame['method']]).transform('median')
+    spike = (frame[metric] > median + SPIKE_MADS * 1.4826 * mad) & (frame[metric] > SPIKE_RATIO * median)
+
+    # "More than usual" is relative to the cell's median iteration
+    usual = {name: cells[name].transform('median') for name in ('nvcsw', 'nivcsw')}
+    excess = frame[metric] - median
+    cause = np.select(
+        [frame['gc_ms'] >= GC_SHARE * excess,
+         (frame['inblock'] + frame['oublock'] + frame['majflt'] > 0) | (frame['nvcsw'] > usual['nvcsw']),
+         frame['nivcsw'] > usual['nivcsw']],
+        CAUSES[:3], CAUSES[3])
+    return frame.assign(median_ms=median, excess_ms=excess, cause=cause)[spike.to_numpy()]
+
+
+def attribution_table(spikes):
+    """Spike excess time per cell and cause (cells x causes)"""
+    table = spikes.pivot_table(index=['question', 'method'], columns='cause', values='excess_ms',
+                               aggfunc='sum', fill_value=0.0, sort=False)
+    return table.reindex(columns=CAUSES, fill_value=0.0)
+
+
+def context_signature():
+    return file_signature(CONTEXT_FILES)
+
+
+@functools.lru_cache(maxsize=None)
+def _context(paths):
+    return load_context(list(paths))
+
+
+def context_frame():
+    """Iteration records of CONTEXT_FILES (read once per file set)"""
+    return _context(tuple(path for path in CONTEXT_FILES if os.path.exists(path)))
+
+
+def load_spikes(metric):
+    return classify(context_frame(), metric)
+
+
+# ============================================================================
+# CHART 1: Spike time per cell, split by cause
+# ============================================================================
+@chart_inputs(context=context_signature, colors=CAUSE_COLORS,
+              thresholds=(SPIKE_MADS, SPIKE_RATIO, GC_SHARE))
+def chart_spike_attribution(metric='server_ms'):
+    spikes = load_spikes(metric)
+    table = attribution_table(spikes)
+    frame = context_frame()
+    requests = list(dict.fromkeys(frame['question']))
+    methods = list(dict.fromkeys(frame['method']))
+
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time Spikes by Cause\n'
+                                       'Excess over the cell median summed over spike iterations')
+    for ax, req in zip(axes, requests):
+        bottom = np.zeros(len(methods))
+        for cause in CAUSES:
+            values = np.array([table[cause].get((req, m), 0.0) for m in methods])
+            ax.bar(range(len(methods)), values, bottom=bottom, color=CAUSE_COLORS[cause], alpha=0.9)
+            bottom += values
+        ax.set_xticks(range(len(methods)))
+        ax.set_xticklabels([m.replace(' ', '\n') for m in methods], fontsize=8)
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+    axes[0].set_ylabel('Spike excess time (ms)', fontsize=10, fontweight='bold')
+
+    handles = [plt.Rectangle((0, 0), 1, 1, color=CAUSE_COLORS[c]) for c in CAUSES]
+    fig.legend(handles, [CAUSE_LABELS[c] for c in CAUSES], loc='lower center', ncol=len(CAUSES),
+               fontsize=10)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure(f"spike_attribution_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 1: spike_attribution_{metric.replace('_ms', '')}.png")
+
+
+def print_summary(metric='server_ms'):
+    spikes = load_spikes(metric)
+    table = attribution_table(spikes)
+    counts = spikes.groupby(['question', 'method'], sort=False).size()
+
+    print("\n" + "="*80)
+    print(f"SPIKE ATTRIBUTION ({metric}, excess ms over the cell median)")
+    print("="*80)
+    print(f"{'Request':<8}{'Engine':<17}{'Spikes':>7}" + ''.join(f"{c:>13s}" for c in CAUSES))
+    for (question, method), row in table.iterrows():
+        print(f"{question:<8}{method:<17}{counts[(question, method)]:7d}"
+              + ''.join(f"{row[c]:13.2f}" for c in CAUSES))
+    total = table.to_numpy().sum()
+    if total:
+        print(f"\nExplained: {1 - table['unexplained'].sum() / total:.0%} of spike time "
+              f"({len(spikes)} spikes)")
+
+
+def spike_charts():
+    """One chart per metric present in the context files, or none without them"""
+    charts = {}
+    if context_signature():
+        for metric in [m for m in METRICS if m in context_frame()]:
+            charts[f"spike_attribution_{metric.replace('_ms', '')}.png"] = functools.partial(
+                chart_spike_attribution, metric=metric)
+    return charts
+
+
+CHARTS = spike_charts()
+
+
+def main(argv):
+    paths = [a for a in argv if a.endswith('.jsonl')]
+    metric = next((a for a in argv if a in METRICS), 'server_ms')
+    if paths:
+        CONTEXT_FILES[:] = paths
+    if not context_signature():
+        print(f"No iteration context found ({', '.join(CONTEXT_FILES)}): run the benchmarks "
+              "with an IterationProbe (iteration_probe.py)")
+        return 1
+
+    chart_spike_attribution(metric)
+    print_summary(metric)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
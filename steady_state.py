@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Warmup and steady-state detection per benchmark cell
+Instead of discarding a fixed number of warmup iterations, the warmup of each
+(question, method, metric) cell is detected from its raw samples in run order:
+a moving median over WINDOW iterations is compared with the median of the
+second half of the run (taken as steady state). Warmup ends where WINDOW
+consecutive window medians stay within REL_TOLERANCE of the steady median
+or Z standard errors of a window median, and after any leading run of
+individually slow iterations (a cold first call); it is capped at half the run.
+
+The steady-state iterations are aggregated into the usual results CSV, and the
+cold-start cost is reported instead of thrown away (benchmark_warmup.csv):
+warmup length, first-call latency and the excess time of the warmup phase.
+
+    python steady_state.py run.samples [-o benchmark_results.csv] [--charts]
+"""
+import argparse
+import functools
+import os
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from chart_cache import chart_inputs
+from generate_distribution_charts import (COLORS, METRIC_LABELS, SAMPLE_FILES, engine_legend,
+                                          request_grid, sample_signature, sampled_metrics)
+from render_profile import save_figure
+from results_store import KEY_COLUMNS, RESULTS_CSV, sync_store, write_csv
+from sample_ingest import SampleAggregator, SampleCollector, ingest
+
+WINDOW = 10            # iterations per moving-median window
+REL_TOLERANCE = 0.05   # windows within 5% of the steady median count as steady
+Z = 3.0                # ... or within Z standard errors of a window median
+MIN_ITERATIONS = 4 * WINDOW  # shorter cells are taken as steady throughout
+
+WARMUP_CSV = 'benchmark_warmup.csv'
+WARMUP_COLUMNS = ['warmup_iterations', 'first_call_ms', 'cold_excess_ms', 'steady_median_ms']
+
+CURVE_ITERATIONS = 60  # iterations shown on the warmup curves
+
+
+def moving_median(values, window=WINDOW):
+    """Median of every window of consecutive values (len(values) - window + 1 of them)"""
+    return np.median(np.lib.stride_tricks.sliding_window_view(values, window), axis=1)
+
+
+def detect_warmup(values, window=WINDOW, rel_tolerance=REL_TOLERANCE, z=Z):
+    """Number of leading warmup iterations in values (run order)"""
+    values = np.asarray(values, dtype=float)
+    if len(values) < MIN_ITERATIONS:
+        return 0
+    half = len(values) // 2
+    steady = values[half:]
+    reference = np.median(steady)
+    sigma = 1.4826 * np.median(np.abs(steady - reference))
+    # 1.2533 sigma / sqrt(n): standard error of a median
+    tolerance = max(rel_tolerance * reference, z * 1.2533 * sigma / np.sqrt(window))
+
+    within = np.abs(moving_median(values[:half + 2 * window - 2], window) - reference) <= tolerance
+    # Steady state: the first stretch of `window` consecutive in-tolerance windows
+    # (so a lone noisy window late in the run does not extend the warmup)
+    settled = np.flatnonzero(np.all(np.lib.stride_tricks.sliding_window_view(within, window), axis=1))
+    start = int(settled[0]) if len(settled) else half
+    # A window's median is off while more than half of it is warmup, so the
+    # first steady window starts about half a window before steady state
+    warmup = min(start + window // 2, half) if start else 0
+
+    # Warmups shorter than half a window do not move a median: also drop the
+    # leading run of individually off iterations (a slow first call)
+    off = np.abs(values[:half] - reference) > max(rel_tolerance * reference, z * sigma)
+    leading = int(np.argmin(off)) if not off.all() else half
+    return max(warmup, leading)
+
+
+def split_warmup(samples, **thresholds):
+    """{key: warmup length} for every key of a {key: samples in run order} mapping"""
+    return {key: detect_warmup(values, **thresholds) for key, values in samples.items()}
+
+
+def warmup_frame(samples, warmups):
+    """Cold-start report: one row per cell in the WARMUP_CSV schema"""
+    rows = []
+    for key, values in samples.items():
+        warmup = warmups[key]
+        steady_median = np.median(values[warmup:])
+        rows.append(dict(zip(KEY_COLUMNS, key), warmup_iterations=warmup, first_call_ms=values[0],
+                         cold_excess_ms=float(np.sum(values[:warmup] - steady_median)),
+                         steady_median_ms=steady_median))
+    return pd.DataFrame(rows, columns=KEY_COLUMNS + WARMUP_COLUMNS).round(3)
+
+
+def steady_state_frame(samples, warmups):
+    """Results CSV aggregates over the steady-state iterations only"""
+    aggregator = SampleAggregator()
+    for key, values in samples.items():
+        index = aggregator.key_index(key)
+        steady = values[warmups[key]:]
+        aggregator.add_chunk(np.full(len(steady), index, dtype=np.intp), steady)
+    return aggregator.to_frame()
+
+
+@functools.lru_cache(maxsize=None)
+def _samples(paths):
+    samples = ingest(list(paths), SampleCollector()).samples()
+    return samples, split_warmup(samples)
+
+
+def load_samples():
+    """Raw samples of SAMPLE_FILES in run order and their detected warmups"""
+    return _samples(tuple(path for path in SAMPLE_FILES if os.path.exists(path)))
+
+
+# ============================================================================
+# CHART 1: Warmup curves per request
+# ============================================================================
+@chart_inputs(samples=sample_signature, colors=COLORS,
+              thresholds=(WINDOW, REL_TOLERANCE, Z, MIN_ITERATIONS))
+def chart_warmup(metric='server_ms'):
+    samples, warmups = load_samples()
+    keys = [key for key in samples if key[2] == metric]
+    requests = list(dict.fromkeys(q for q, _, _ in keys))
+    methods = list(dict.fromkeys(m for _, m, _ in keys))
+
+    fig, axes = request_grid(requests, f'{METRIC_LABELS[metric]} Time Warmup Curves\n'
+                                       'Iteration time / steady-state median, dotted = detected end of warmup')
+    for ax, req in zip(axes, requests):
+        for method in methods:
+            key = (req, method, metric)
+            if key not in samples:
+                continue
+            values, warmup = samples[key], warmups[key]
+            ratio = values[:CURVE_ITERATIONS] / np.median(values[warmup:])
+            color = COLORS.get(method, 'gray')
+            ax.plot(np.arange(1, len(ratio) + 1), ratio, color=color, linewidth=1.2, alpha=0.9)
+            if warmup:
+                ax.axvline(warmup + 0.5, color=color, linestyle=':', linewidth=1.5)
+        ax.axhline(1, color='gray', linewidth=0.8)
+        ax.set_yscale('log')
+        ax.set_title(req, fontsize=12, fontweight='bold')
+        ax.set_xlabel('Iteration', fontsize=9)
+        ax.grid(alpha=0.3, linestyle='--')
+    axes[0].set_ylabel('Relative to steady state - Log Scale', fontsize=10, fontweight='bold')
+
+    engine_legend(fig, methods)
+    plt.tight_layout(rect=(0, 0.05, 1, 1))
+    save_figure(f"warmup_curves_{metric.replace('_ms', '')}.png")
+    plt.close(fig)
+    print(f"[OK] Chart 1: warmup_curves_{metric.replace('_ms', '')}.png")
+
+
+def print_summary(report):
+    print("\n" + "="*80)
+    print("WARMUP (server processing): detected iterations, first call and cold-start cost")
+    print("="*80)
+    print(f"{'Request':<8}{'Engine':<17}{'Warmup':>8}{'First call':>12}{'Steady':>10}{'Cold excess':>13}")
+    for row in report[report['metric'] == 'server_ms'].itertuples():
+        print(f"{row.question:<8}{row.method:<17}{row.warmup_iterations:8d}{row.first_call_ms:12.2f}"
+              f"{row.steady_median_ms:10.2f}{row.cold_excess_ms:13.2f}")
+
+
+def warmup_charts():
+    """One chart per metric, or none when there are no raw samples"""
+    charts = {}
+    if sample_signature():
+        for metric in sampled_metrics():
+            charts[f"warmup_curves_{metric.replace('_ms', '')}.png"] = functools.partial(
+                chart_warmup, metric=metric)
+    return charts
+
+
+CHARTS = warmup_charts()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('samples', nargs='*', help='.jsonl or .samples files in run order')
+    parser.add_argument('-o', '--output', help=f'write steady-state aggregates (e.g. {RESULTS_CSV})')
+    parser.add_argument('--warmup-output', default=WARMUP_CSV,
+                        help=f'cold-start report (default: {WARMUP_CSV})')
+    parser.add_argument('--charts', action='store_true', help='draw warmup_curves_<metric>.png')
+    args = parser.parse_args(argv)
+
+    if args.samples:
+        SAMPLE_FILES[:] = args.samples
+    if not sample_signature():
+        print(f"No raw samples found ({', '.join(SAMPLE_FILES)})")
+        return 1
+
+    samples, warmups = load_samples()
+    report = warmup_frame(samples, warmups)
+    write_csv(report, args.warmup_output)
+    print(f"[OK] cold-start report -> {args.warmup_output}")
+    if args.output:
+        write_csv(steady_state_frame(samples, warmups), args.output)
+        sync_store(args.output)
+        print(f"[OK] steady-state aggregates -> {args.output}")
+    if args.charts:
+        for render in warmup_charts().values():
+            render()
+    print_summary(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())